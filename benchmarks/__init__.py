@@ -0,0 +1,11 @@
+################################################
+# Title     : Game Benchmark Suite
+# Author    : balarcode
+# File Type : Python Package
+# Comments  : Micro and macro benchmarks of the games, compared with a JSON baseline.
+#             Run them with: python -m benchmarks [--save] [--threshold F] [--profile] [--tracemalloc]
+#
+# All Rights Reserved.
+################################################
+
+from .suite import BENCHMARKS, capture, compare, load_baseline, main, measure, save_baseline
@@ -0,0 +1,413 @@
+################################################
+# Title     : Game Benchmark Suite
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Times the hot paths of every game and compares them with a stored baseline.
+#             1) Micro benchmarks time one call of a hot function (obscurePhrase, spinWheel, getRandomCategoryAndPhrase,
+#                WOFComputerPlayer.getMove, Bot.make_guess, Bot.record_guess_results, the Wordle feedback); macro
+#                benchmarks time a full headless game of Wheel of Fortune or Wordle, or the headless turtle_play scenes.
+#             2) A benchmark is a setup function of a seed that returns the operation to time. Its inputs are drawn
+#                from generators seeded with the seed only, and every repeat sets it up again, so every repeat and every
+#                run times the same work.
+#             3) The number of operations per repeat is calibrated so a repeat lasts at least --min-time seconds. The
+#                garbage collector is off while timing and game output goes to os.devnull. The best time per operation
+#                over the repeats is compared, as it is the least disturbed by other processes.
+#             4) Results are saved as a JSON baseline with --save. Timings depend on the machine, so the baseline is not
+#                committed: the first run on a machine records it with --save (without one every benchmark is "new").
+#                A benchmark whose time per operation is more than --threshold (a fraction) above its baseline is a
+#                regression: with --profile and/or --tracemalloc it is run again under cProfile and/or tracemalloc and
+#                the captures are written to --capture-dir. The run exits with status 1 if anything regressed.
+#             Usage: python -m benchmarks [--filter PATTERN] [--kind micro|macro] [--repeat N] [--min-time S] [--save]
+#                    [--threshold F] [--profile] [--tracemalloc]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import contextlib
+import cProfile
+import fnmatch
+import gc
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_CAPTURE_DIR = "benchmark-captures"
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.2 # Seconds per repeat
+DEFAULT_THRESHOLD = 0.2 # Slowdown over the baseline counted as a regression
+INPUTS = 256 # Inputs drawn for a micro benchmark, used in turn
+MAX_NUMBER = 1 << 20 # Most operations per repeat
+TOP_LINES = 25 # Lines of a capture report
+
+################################################
+# Function Definitions
+################################################
+# Returns the inputs of a Wheel of Fortune board
+def _boards(rng: random.Random, count: int = INPUTS) -> list[tuple[str, str, list[str]]]:
+    """Return count (category, obscured phrase, guessed letters) boards with 0 to 12 letters guessed."""
+    from wheel_of_fortune.wheel_of_fortune import LETTERS, getRandomCategoryAndPhrase, obscurePhrase
+    boards = []
+    for _ in range(count):
+        category, phrase = getRandomCategoryAndPhrase(rng)
+        guessed = rng.sample(LETTERS, rng.randint(0, 12))
+        boards.append((category, obscurePhrase(phrase, guessed), guessed))
+    return boards
+
+# Returns an operation that takes its inputs in turn
+def _cycle(inputs: list, call):
+    """Return an operation calling call(input) on the next of inputs, wrapping around."""
+    state = {"i": 0}
+    def operation():
+        i = state["i"]
+        state["i"] = i + 1 if i + 1 < len(inputs) else 0
+        return call(inputs[i])
+    return operation
+
+# Times obscurePhrase()
+def setup_obscure_phrase(seed: int):
+    """obscurePhrase() of random phrases with 0 to 12 letters guessed."""
+    from wheel_of_fortune.wheel_of_fortune import LETTERS, getRandomCategoryAndPhrase, obscurePhrase
+    rng = random.Random(seed)
+    inputs = [(getRandomCategoryAndPhrase(rng)[1], rng.sample(LETTERS, rng.randint(0, 12))) for _ in range(INPUTS)]
+    return _cycle(inputs, lambda args: obscurePhrase(*args))
+
+# Times spinWheel()
+def setup_spin_wheel(seed: int):
+    """spinWheel() with a seeded generator."""
+    from wheel_of_fortune.wheel_of_fortune import spinWheel
+    rng = random.Random(seed)
+    spinWheel(rng) # Loads wheel.json
+    return lambda: spinWheel(rng)
+
+# Times getRandomCategoryAndPhrase()
+def setup_random_category_and_phrase(seed: int):
+    """getRandomCategoryAndPhrase() with a seeded generator (from the phrase store if phrases.json is missing)."""
+    from wheel_of_fortune.wheel_of_fortune import getRandomCategoryAndPhrase
+    rng = random.Random(seed)
+    getRandomCategoryAndPhrase(rng) # Opens the phrase store
+    return lambda: getRandomCategoryAndPhrase(rng)
+
+# Times WOFComputerPlayer.getMove()
+def _setup_get_move(seed: int, level: int):
+    """getMove() of a computer player of a level on random boards after a random cash spin."""
+    from wheel_of_fortune.game_data import getGameData
+    from wheel_of_fortune.tournament import discard
+    from wheel_of_fortune.wheel_of_fortune import EV_LEVEL, WOFComputerPlayer
+    rng = random.Random(seed)
+    evEngine = None
+    if level >= EV_LEVEL:
+        from wheel_of_fortune.ev import EVEngine
+        evEngine = EVEngine(getGameData().getWheel()[0], 0.0) # One batch of rollouts per move
+    player = WOFComputerPlayer("Computer", level, output=discard, evEngine=evEngine, rng=random.Random(rng.getrandbits(128)))
+    player.prizeMoney = 1000 # Can buy vowels
+    cash = [segment for segment in getGameData().getWheel()[0] if segment["type"] == "cash"]
+    inputs = [(board, rng.choice(cash)) for board in _boards(rng)]
+    def move(args):
+        board, prize = args
+        player.observeSpin(prize)
+        return player.getMove(*board)
+    getGameData().getPhraseIndex()
+    getGameData().getLetterStats()
+    return _cycle(inputs, move)
+
+# Times WOFComputerPlayer.getMove() below EV_LEVEL
+def setup_get_move(seed: int):
+    """getMove() of a level 5 computer player (letter counts over the candidates and coin flips)."""
+    return _setup_get_move(seed, 5)
+
+# Times WOFComputerPlayer.getMove() with the expected value engine
+def setup_get_move_ev(seed: int):
+    """getMove() of a level 10 computer player (one batch of rollouts per move)."""
+    return _setup_get_move(seed, 10)
+
+# Returns the generator, word list and Bot of a Wordle benchmark
+def _wordle(seed: int):
+    """Return a generator seeded with seed, the default word list and a random strategy Bot seeded from it."""
+    from wordle.lexicon import DEFAULT_WORDS_FILE, Lexicon
+    from wordle.wordle import Bot
+    rng = random.Random(seed)
+    lexicon = Lexicon.load(DEFAULT_WORDS_FILE)
+    return rng, lexicon, Bot(lexicon, rng=random.Random(rng.getrandbits(128)))
+
+# Times Bot.make_guess()
+def setup_make_guess(seed: int):
+    """The first make_guess() of a game of the random strategy, over the whole word list."""
+    rng, lexicon, bot = _wordle(seed)
+    def guess():
+        bot.new_game()
+        return bot.make_guess()
+    return guess
+
+# Times Bot.record_guess_results()
+def setup_record_guess_results(seed: int):
+    """record_guess_results() of the feedback of a random guess against a random target, at the start of a game."""
+    from wordle.feedback import score
+    rng, lexicon, bot = _wordle(seed)
+    inputs = []
+    for _ in range(INPUTS):
+        guess, target = rng.choice(lexicon.words), rng.choice(lexicon.words)
+        inputs.append((guess, score(guess, target)))
+    def record(args):
+        bot.new_game()
+        bot.record_guess_results(*args)
+    return _cycle(inputs, record)
+
+# Times the feedback of a guess
+def setup_feedback_score(seed: int):
+    """feedback.score() of a random guess against a random target."""
+    from wordle.feedback import score
+    rng, lexicon, bot = _wordle(seed)
+    inputs = [(rng.choice(lexicon.words), rng.choice(lexicon.words)) for _ in range(INPUTS)]
+    return _cycle(inputs, lambda args: score(*args))
+
+# Times the feedback of a guess against every word
+def setup_feedback_score_targets(seed: int):
+    """feedback.score_targets() of a random guess against the whole word list (NumPy)."""
+    from wordle.feedback import encode_words, score_targets
+    rng, lexicon, bot = _wordle(seed)
+    targets = encode_words(lexicon)
+    return _cycle([rng.choice(lexicon.words) for _ in range(INPUTS)], lambda guess: score_targets(guess, targets))
+
+# Times a game of Wheel of Fortune
+def setup_wheel_of_fortune_game(seed: int):
+    """A headless game between computer players of levels 1, 5 and 10, seeded as in the tournament."""
+    from wheel_of_fortune.ev import EVEngine
+    from wheel_of_fortune.game_data import getGameData
+    from wheel_of_fortune.tournament import MAX_TURNS, discard, gameRandom
+    from wheel_of_fortune.wheel_of_fortune import Game, WOFComputerPlayer
+    levels = (1, 5, 10)
+    evEngine = EVEngine(getGameData().getWheel()[0], 0.0)
+    state = {"game": 0}
+    def game():
+        rng = gameRandom(seed, state["game"])
+        state["game"] += 1
+        players = [WOFComputerPlayer("Computer {}".format(seat + 1), level, output=discard, evEngine=evEngine,
+                                     rng=random.Random(rng.getrandbits(128))) for seat, level in enumerate(levels)]
+        return Game(players, sleep=discard, output=discard, maxTurns=MAX_TURNS, rng=rng).play()
+    getGameData().getPhraseIndex()
+    getGameData().getLetterStats()
+    return game
+
+# Times a game of Wordle
+def setup_wordle_game(seed: int):
+    """A headless game of the random strategy against a random target, seeded as in the Wordle benchmark."""
+    from wordle.benchmark import game_rng
+    from wordle.wordle import GameEngine
+    rng, lexicon, bot = _wordle(seed)
+    targets = [rng.choice(lexicon.words) for _ in range(INPUTS)]
+    state = {"game": 0}
+    def game():
+        number = state["game"]
+        state["game"] += 1
+        game_random = game_rng(seed, number)
+        bot.new_game(game_random)
+        GameEngine(rng=game_random).play(bot, word_list_file=lexicon, target_word=targets[number % len(targets)])
+    return game
+
+# Times the turtle_play scenes
+def setup_turtle_scenes(seed: int):
+    """Record every scene on a headless Drawing and render it to PNG."""
+    from turtle_play.headless import record_scene, render_png
+    from turtle_play.turtle_play import SCENES
+    def scenes():
+        for scene in SCENES.values():
+            render_png(record_scene(scene))
+    return scenes
+
+# Times a turtle_play animation export
+def setup_turtle_gif(seed: int):
+    """Export the animation of the spiral as a GIF in memory."""
+    from turtle_play.export import GifWriter, build_palette, frames, quantize
+    from turtle_play.headless import DEFAULT_HEIGHT, DEFAULT_WIDTH
+    from turtle_play.turtle_play import SCENES
+    palette = build_palette()
+    def export():
+        writer = GifWriter(io.BytesIO(), DEFAULT_WIDTH, DEFAULT_HEIGHT, palette)
+        for image, changed in frames(SCENES["spiral"], rate=6):
+            if changed:
+                writer.add(quantize(image, palette), 1 / 30)
+            else:
+                writer.hold(1 / 30)
+        writer.close()
+    return export
+
+# Benchmarks by name: (kind, setup function)
+BENCHMARKS = {
+    "wheel_of_fortune.obscurePhrase": ("micro", setup_obscure_phrase),
+    "wheel_of_fortune.spinWheel": ("micro", setup_spin_wheel),
+    "wheel_of_fortune.getRandomCategoryAndPhrase": ("micro", setup_random_category_and_phrase),
+    "wheel_of_fortune.WOFComputerPlayer.getMove": ("micro", setup_get_move),
+    "wheel_of_fortune.WOFComputerPlayer.getMove[ev]": ("micro", setup_get_move_ev),
+    "wordle.Bot.make_guess": ("micro", setup_make_guess),
+    "wordle.Bot.record_guess_results": ("micro", setup_record_guess_results),
+    "wordle.feedback.score": ("micro", setup_feedback_score),
+    "wordle.feedback.score_targets": ("micro", setup_feedback_score_targets),
+    "wheel_of_fortune.game": ("macro", setup_wheel_of_fortune_game),
+    "wordle.game": ("macro", setup_wordle_game),
+    "turtle_play.scenes": ("macro", setup_turtle_scenes),
+    "turtle_play.gif": ("macro", setup_turtle_gif),
+}
+
+# Times a number of operations
+def time_operations(operation, number: int) -> float:
+    """Return the seconds taken by number calls of operation, with the garbage collector off."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+# Times a benchmark
+def measure(setup, seed: int = 0, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Return the best and median seconds per operation of a benchmark over repeat repeats of calibrated length."""
+    number = 1
+    while True: # Calibrate the operations per repeat
+        elapsed = time_operations(setup(seed), number)
+        if elapsed >= min_time or number >= MAX_NUMBER:
+            break
+        number = min(max(number * 2, int(number * min_time * 1.2 / max(elapsed, 1e-9))), MAX_NUMBER)
+    times = [time_operations(setup(seed), number) / number for _ in range(repeat)]
+    return {"seconds_per_op": min(times), "median_seconds_per_op": statistics.median(times), "ops_per_repeat": number,
+            "repeats": repeat}
+
+# Compares results with a baseline
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """Return, per benchmark, its baseline and current seconds per operation, their ratio and its status
+    (regressed, improved, unchanged or new)."""
+    comparison = {}
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            comparison[name] = {"status": "new"}
+            continue
+        ratio = result["seconds_per_op"] / previous["seconds_per_op"]
+        status = "regressed" if ratio > 1 + threshold else "improved" if ratio < 1 / (1 + threshold) else "unchanged"
+        comparison[name] = {"baseline": previous["seconds_per_op"], "current": result["seconds_per_op"],
+                            "ratio": ratio, "status": status}
+    return comparison
+
+# Profiles a benchmark
+def capture(name: str, setup, seed: int, number: int, directory: str, profile: bool = True,
+            trace: bool = False) -> list[str]:
+    """Run number operations of a benchmark under cProfile and/or tracemalloc and return the files written."""
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    if profile:
+        operation = setup(seed)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(number):
+            operation()
+        profiler.disable()
+        path = os.path.join(directory, name + ".prof")
+        profiler.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(TOP_LINES)
+        with open(path[:-len(".prof")] + ".profile.txt", "w") as f:
+            f.write(report.getvalue())
+        files += [path, path[:-len(".prof")] + ".profile.txt"]
+    if trace:
+        operation = setup(seed)
+        tracemalloc.start()
+        for _ in range(number):
+            operation()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        path = os.path.join(directory, name + ".tracemalloc.txt")
+        with open(path, "w") as f:
+            f.write("Current {} bytes, peak {} bytes after {} operations\n".format(current, peak, number))
+            for statistic in snapshot.statistics("lineno")[:TOP_LINES]:
+                f.write(str(statistic) + "\n")
+        files.append(path)
+    return files
+
+# Loads a baseline file
+def load_baseline(path: str) -> dict:
+    """Return the results of a baseline file by benchmark name ({} if there is none)."""
+    try:
+        with open(path) as f:
+            return json.load(f)["benchmarks"]
+    except FileNotFoundError:
+        return {}
+
+# Saves a baseline file
+def save_baseline(path: str, results: dict) -> None:
+    """Write results into a baseline file, keeping the baseline of the benchmarks that were not run."""
+    benchmarks = load_baseline(path)
+    benchmarks.update(results)
+    with open(path, "w") as f:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(), "benchmarks": benchmarks},
+                  f, indent=2)
+        f.write("\n")
+
+################################################
+# Benchmark Logic
+################################################
+def main(argv: list[str] = None) -> None:
+    """Run the benchmarks, compare them with the baseline and print the report as JSON (python -m benchmarks)."""
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths of the games against a JSON baseline.")
+    parser.add_argument("--filter", default="*", help="Only run the benchmarks whose name matches this glob pattern")
+    parser.add_argument("--kind", choices=["micro", "macro"], default=None, help="Only run micro or macro benchmarks")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME, help="Seconds per repeat (at least)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Slowdown over the baseline that is a regression (0.2 = 20%%)")
+    parser.add_argument("--profile", action="store_true", help="Capture a cProfile of every regressed benchmark")
+    parser.add_argument("--tracemalloc", action="store_true", help="Capture the allocations of every regressed benchmark")
+    parser.add_argument("--capture-dir", default=DEFAULT_CAPTURE_DIR)
+    args = parser.parse_args(argv)
+
+    names = [name for name, (kind, _) in BENCHMARKS.items()
+             if fnmatch.fnmatchcase(name, args.filter) and args.kind in (None, kind)]
+    if args.list:
+        print("\n".join("{} ({})".format(name, BENCHMARKS[name][0]) for name in names))
+        return
+    if not names:
+        parser.error("no benchmark matches {!r}".format(args.filter))
+
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name in names:
+            results[name] = measure(BENCHMARKS[name][1], args.seed, args.repeat, args.min_time)
+            print("{:<50} {:>12.3f} us".format(name, results[name]["seconds_per_op"] * 1e6), file=sys.stderr)
+        baseline = load_baseline(args.baseline)
+        if not baseline and not args.save:
+            print("No baseline in {}: record one on this machine with --save".format(args.baseline), file=sys.stderr)
+        comparison = compare(results, baseline, args.threshold)
+        regressions = [name for name in names if comparison[name]["status"] == "regressed"]
+        captures = {}
+        if args.profile or args.tracemalloc:
+            for name in regressions:
+                captures[name] = capture(name, BENCHMARKS[name][1], args.seed, results[name]["ops_per_repeat"],
+                                         args.capture_dir, args.profile, args.tracemalloc)
+    if args.save:
+        save_baseline(args.baseline, results)
+    print(json.dumps({"seed": args.seed, "threshold": args.threshold, "results": results, "comparison": comparison,
+                      "regressions": regressions, "captures": captures, "baseline_saved": args.save}, indent=2))
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
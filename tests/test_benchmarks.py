@@ -0,0 +1,94 @@
+################################################
+# Title     : Benchmark Suite Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the baseline comparison and files of the benchmark suite and runs every benchmark once.
+#             Usage: python -m pytest tests/test_benchmarks.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import io
+import json
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from benchmarks import suite
+from benchmarks.suite import BENCHMARKS, capture, compare, load_baseline, main, measure, save_baseline
+
+################################################
+# Function Definitions
+################################################
+# Returns a result of a benchmark taking seconds per operation
+def result(seconds: float) -> dict:
+    return {"seconds_per_op": seconds, "median_seconds_per_op": seconds, "ops_per_repeat": 1, "repeats": 1}
+
+# Returns the setup of a benchmark doing nothing
+def setup_noop(seed: int):
+    return lambda: None
+
+def test_compare():
+    baseline = {"slow": result(1.0), "fast": result(1.0), "same": result(1.0), "gone": result(1.0)}
+    results = {"slow": result(1.3), "fast": result(0.8), "same": result(1.1), "new": result(1.0)}
+    comparison = compare(results, baseline, threshold=0.2)
+    assert {name: entry["status"] for name, entry in comparison.items()} == \
+           {"slow": "regressed", "fast": "improved", "same": "unchanged", "new": "new"}
+    assert comparison["slow"]["ratio"] == pytest.approx(1.3) and comparison["slow"]["baseline"] == 1.0
+    assert compare(results, baseline, threshold=0.5)["slow"]["status"] == "unchanged"
+
+def test_baseline_files(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    assert load_baseline(path) == {}
+    save_baseline(path, {"a": result(1.0), "b": result(2.0)})
+    save_baseline(path, {"b": result(3.0)}) # Keeps the baseline of a
+    assert load_baseline(path) == {"a": result(1.0), "b": result(3.0)}
+    with open(path) as f:
+        data = json.load(f)
+    assert {"python", "machine"} <= set(data)
+
+def test_measure_and_capture(tmp_path):
+    measured = measure(setup_noop, repeat=3, min_time=0.001)
+    assert measured["repeats"] == 3 and measured["ops_per_repeat"] >= 1
+    assert 0 < measured["seconds_per_op"] <= measured["median_seconds_per_op"]
+    files = capture("noop", setup_noop, 0, 10, str(tmp_path), profile=True, trace=True)
+    assert sorted(os.path.basename(path) for path in files) == ["noop.prof", "noop.profile.txt", "noop.tracemalloc.txt"]
+    assert all(os.path.getsize(path) > 0 for path in files)
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmarks_run(name):
+    kind, setup = BENCHMARKS[name]
+    assert kind in ("micro", "macro")
+    with contextlib.redirect_stdout(io.StringIO()):
+        operation = setup(0)
+        operation()
+        operation()
+
+def test_main(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(suite, "BENCHMARKS", {"noop": ("micro", setup_noop)})
+    baseline = str(tmp_path / "baseline.json")
+    arguments = ["--baseline", baseline, "--repeat", "1", "--min-time", "0.001"]
+    main(arguments)
+    captured = capsys.readouterr()
+    assert "No baseline in" in captured.err and "--save" in captured.err
+    report = json.loads(captured.out)
+    assert report["comparison"] == {"noop": {"status": "new"}} and not report["baseline_saved"]
+    main(arguments + ["--save"])
+    assert "No baseline in" not in capsys.readouterr().err and set(load_baseline(baseline)) == {"noop"}
+    # A baseline far faster than any run makes the benchmark a regression, captured and reported by the exit status
+    save_baseline(baseline, {"noop": result(1e-15)})
+    with pytest.raises(SystemExit) as stop:
+        main(arguments + ["--profile", "--capture-dir", str(tmp_path / "captures")])
+    assert stop.value.code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["regressions"] == ["noop"] and len(report["captures"]["noop"]) == 2
+    main(["--list"])
+    assert capsys.readouterr().out == "noop (micro)\n"
+    with pytest.raises(SystemExit):
+        main(arguments + ["--filter", "nothing*"])
@@ -0,0 +1,49 @@
+################################################
+# Title     : Package Import Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that importing the game packages reads no data file and prints nothing.
+#             Usage: python -m pytest tests/test_packages.py
+#
+# All Rights Reserved.
+################################################
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Records the files opened after the interpreter started, other than Python sources and bytecode
+PROBE = """
+import sys
+opened = []
+def hook(event, args):
+    if event == 'open' and isinstance(args[0], str) and not args[0].endswith(('.py', '.pyc')):
+        opened.append(args[0])
+sys.addaudithook(hook)
+import {package}
+sys.stderr.write(repr([path for path in opened if not path.startswith(sys.base_prefix)]))
+"""
+
+################################################
+# Function Definitions
+################################################
+@pytest.mark.parametrize("package", ["wordle", "wheel_of_fortune"])
+def test_import_does_no_io(package):
+    result = subprocess.run([sys.executable, "-c", PROBE.format(package=package)], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    assert result.stdout == ""
+    assert [path for path in eval(result.stderr) if os.path.isfile(path)] == []
+
+def test_public_api():
+    import wheel_of_fortune
+    import wordle
+    for name in ("Bot", "GameEngine", "Lexicon", "CandidateIndex", "RandomStrategy", "Strategy", "score", "main"):
+        assert hasattr(wordle, name), name
+    for name in ("Game", "Board", "WOFComputerPlayer", "WOFHumanPlayer", "obscurePhrase", "spinWheel", "main"):
+        assert hasattr(wheel_of_fortune, name), name
@@ -0,0 +1,155 @@
+################################################
+# Title     : Turtle Animation Export Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Decodes the GIF files written by export.py with an independent LZW decoder and GIF reader.
+#             Usage: python -m pytest tests/test_turtle_export.py
+#
+# All Rights Reserved.
+################################################
+
+import io
+import random
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from turtle_play.export import GifWriter, build_palette, export_scene, lzw_encode, quantize
+
+################################################
+# Function Definitions
+################################################
+# Expands a GIF LZW code stream
+def lzw_decode(data: bytes, min_code_size: int) -> bytes:
+    """Return the palette indices of a GIF LZW code stream (codes packed LSB first)."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    code_size = min_code_size + 1
+    bits = nbits = position = 0
+    table, previous = None, None
+    out = bytearray()
+    while True:
+        while nbits < code_size:
+            bits |= data[position] << nbits
+            position += 1
+            nbits += 8
+        code = bits & ((1 << code_size) - 1)
+        bits >>= code_size
+        nbits -= code_size
+        if code == clear or table is None:
+            assert code == clear, "a code stream starts with a clear code"
+            table = [bytes([i]) for i in range(clear)] + [b"", b""]
+            code_size = min_code_size + 1
+            previous = None
+            continue
+        if code == end:
+            return bytes(out)
+        if previous is None:
+            entry = table[code]
+        else:
+            entry = table[code] if code < len(table) else table[previous] + table[previous][:1]
+            table.append(table[previous] + entry[:1])
+        out += entry
+        previous = code
+        if len(table) == 1 << code_size and code_size < 12:
+            code_size += 1
+
+# Reads the frames of an animated GIF
+def read_gif(data: bytes) -> tuple[np.ndarray, list[tuple[np.ndarray, int]]]:
+    """Return the palette and the (canvas of palette indices, delay in centiseconds) of every frame."""
+    assert data[:6] == b"GIF89a"
+    width, height, flags, _, _ = struct.unpack("<HHBBB", data[6:13])
+    size = 2 << (flags & 7)
+    palette = np.frombuffer(data[13:13 + 3 * size], dtype=np.uint8).reshape(-1, 3)
+    i = 13 + 3 * size
+    canvas = np.zeros((height, width), dtype=np.uint8)
+    frames, delay = [], None
+    while data[i] != 0x3B:
+        if data[i] == 0x21: # Extension: skip its sub-blocks, keeping the delay of a graphic control extension
+            if data[i + 1] == 0xF9:
+                delay = struct.unpack("<H", data[i + 4:i + 6])[0]
+            i += 2
+            while data[i]:
+                i += data[i] + 1
+            i += 1
+            continue
+        assert data[i] == 0x2C
+        left, top, w, h, _ = struct.unpack("<HHHHB", data[i + 1:i + 10])
+        min_code_size = data[i + 10]
+        i += 11
+        stream = bytearray()
+        while data[i]:
+            stream += data[i + 1:i + 1 + data[i]]
+            i += data[i] + 1
+        i += 1
+        pixels = lzw_decode(bytes(stream), min_code_size)
+        assert len(pixels) == w * h
+        canvas[top:top + h, left:left + w] = np.frombuffer(pixels, dtype=np.uint8).reshape(h, w)
+        frames.append((canvas.copy(), delay))
+    return palette, frames
+
+# Returns the nearest palette color of every pixel
+def palette_image(image, palette):
+    colors = np.array(palette)
+    distances = ((image[..., None, :].astype(int) - colors) ** 2).sum(axis=-1)
+    return colors[distances.argmin(axis=-1)]
+
+@pytest.mark.parametrize("min_code_size", [2, 3, 4, 8])
+def test_lzw_round_trip(min_code_size):
+    rng = random.Random(min_code_size)
+    colors = 1 << min_code_size
+    samples = [
+        bytes([0]),
+        bytes([1, 1]),
+        bytes([colors - 1]) * 50000, # Long runs fill the code table and clear it
+        bytes(rng.randrange(colors) for _ in range(30000)), # Noise clears it many times
+        bytes(rng.choice((0, 0, 0, 1)) for _ in range(20000)),
+        bytes(i % colors for i in range(10000)),
+    ]
+    for data in samples:
+        assert lzw_decode(lzw_encode(data, min_code_size), min_code_size) == data
+
+def test_quantize_maps_palette_colors():
+    palette = build_palette(["#123456"])
+    image = np.array([[palette[0], palette[3], (0x12, 0x34, 0x56)], [(1, 1, 1), palette[-1], palette[2]]], dtype=np.uint8)
+    indices = quantize(image, palette)
+    assert [tuple(palette[i]) for i in indices.ravel()] == [tuple(c) for c in palette_image(image, palette).reshape(-1, 3)]
+
+def test_gif_writer_frames_and_delays():
+    palette = build_palette()
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, len(palette), size=(30, 40), dtype=np.uint8)]
+    for _ in range(5):
+        image = images[-1].copy()
+        image[rng.integers(30), rng.integers(10):rng.integers(20, 40)] = rng.integers(len(palette))
+        images.append(image)
+    f = io.BytesIO()
+    writer = GifWriter(f, 40, 30, palette)
+    writer.add(images[0], 0.1)
+    writer.add(images[0], 0.1) # Unchanged: extends the delay of the first frame
+    for image in images[1:]:
+        writer.add(image, 1 / 30)
+    writer.hold(2.0)
+    writer.close()
+    _, frames = read_gif(f.getvalue())
+    changed = [images[0]] + [b for a, b in zip(images, images[1:]) if (a != b).any()]
+    assert len(frames) == writer.written == len(changed)
+    for (canvas, _), image in zip(frames, changed):
+        assert (canvas == image).all()
+    delays = [delay for _, delay in frames]
+    assert delays[0] == 20
+    assert sum(delays) == round(100 * (0.2 + (len(images) - 1) / 30 + 2.0))
+
+def test_export_scene_gif(tmp_path):
+    summary = export_scene("pentagon", str(tmp_path), "gif", fps=10, rate=20, hold=0.5, width=120, height=90, scale=0.3)
+    palette, frames = read_gif((tmp_path / "pentagon.gif").read_bytes())
+    assert len(frames) == summary["frames_encoded"]
+    assert sum(delay for _, delay in frames) == round(100 * (summary["frames"] / 10 + 0.5))
+    background = frames[0][0][0, 0]
+    drawn = [int((canvas != background).sum()) for canvas, _ in frames]
+    assert drawn[-1] > drawn[0] # The pentagon is drawn over the frames
@@ -0,0 +1,80 @@
+################################################
+# Title     : Turtle Geometry Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the vertices computed at once by geometry.py against a turtle stepping with forward() and left().
+#             Usage: python -m pytest tests/test_turtle_geometry.py
+#
+# All Rights Reserved.
+################################################
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from turtle_play.geometry import arithmetic_spiral, regular_polygon, stamp_at, stamp_ring, trace, walk
+from turtle_play.headless import Drawing
+
+################################################
+# Function Definitions
+################################################
+# Walks a turtle step by step
+def step_walk(count, distance, increment, angle, heading=0.0):
+    """Return the positions and headings of a recording turtle moved with forward() and left()."""
+    turtle = Drawing().Turtle()
+    turtle.setheading(heading)
+    positions, headings = [turtle.position()], [turtle.heading()]
+    for i in range(count):
+        turtle.forward(distance + i * increment)
+        turtle.left(angle)
+        positions.append(turtle.position())
+        headings.append(turtle.heading())
+    return np.array(positions), np.array(headings)
+
+@pytest.mark.parametrize("args", [(5, 100, 0, 72), (12, 100, 0, 60), (30, 5, 2, -24), (200, 1, 0.5, -7, 45)])
+def test_walk_matches_stepwise_turtle(args):
+    vertices, headings = walk(*args)
+    expected_vertices, expected_headings = step_walk(*args)
+    assert vertices == pytest.approx(expected_vertices, abs=1e-9)
+    assert np.cos(np.radians(headings)) == pytest.approx(np.cos(np.radians(expected_headings)), abs=1e-9)
+    assert np.sin(np.radians(headings)) == pytest.approx(np.sin(np.radians(expected_headings)), abs=1e-9)
+
+@pytest.mark.parametrize("sides", [3, 5, 6, 12, 1000])
+def test_regular_polygon_closes(sides):
+    vertices, headings = regular_polygon(sides, 10, laps=2)
+    assert len(vertices) == 2 * sides + 1
+    assert vertices[sides] == pytest.approx((0, 0), abs=1e-9) and vertices[-1] == pytest.approx((0, 0), abs=1e-9)
+    lengths = np.hypot(*np.diff(vertices, axis=0).T)
+    assert lengths == pytest.approx(np.full(2 * sides, 10.0))
+
+def test_figures_are_cached_and_read_only():
+    assert regular_polygon(6, 100)[0] is regular_polygon(6, 100)[0]
+    assert stamp_ring(10, 100, 36) is stamp_ring(10, 100, 36)
+    vertices, _ = arithmetic_spiral(30, 5, 2, 24)
+    with pytest.raises(ValueError):
+        vertices[0, 0] = 1.0
+
+def test_stamp_ring():
+    positions, headings = stamp_ring(10, 100, 36)
+    assert np.hypot(*positions.T) == pytest.approx(np.full(10, 100.0))
+    assert headings.tolist() == [(-36 * i) % 360 for i in range(10)]
+
+def test_trace_steps_and_batches():
+    vertices, headings = regular_polygon(5, 100)
+    animated = Drawing()
+    bob = animated.Turtle()
+    assert len(list(trace(animated, bob, vertices, headings))) == 5
+    assert len(animated.items) == 5 and bob.heading() == pytest.approx(0.0)
+    batched = Drawing()
+    batched.tracer(0)
+    bob = batched.Turtle()
+    assert len(list(trace(batched, bob, vertices, headings))) == 1
+    assert [item[0] for item in batched.items] == ["polyline"]
+    positions, stamp_headings = stamp_ring(10, 100, 36)
+    tom = animated.Turtle()
+    tom.penup()
+    assert len(list(stamp_at(animated, tom, positions, stamp_headings, home=True))) == 10
+    assert tom.position() == (0.0, 0.0) and sum(item[0] == "poly" for item in animated.items) == 10
@@ -0,0 +1,117 @@
+################################################
+# Title     : Headless Turtle Rendering Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Records the turtle_play scenes without Tk and checks the PNG and SVG files rendered from them.
+#             Usage: python -m pytest tests/test_turtle_headless.py
+#
+# All Rights Reserved.
+################################################
+
+import json
+import os
+import struct
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from turtle_play.headless import Drawing, parse_color, record_scene, render_png, render_svg
+from turtle_play.turtle_play import SCENES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+################################################
+# Function Definitions
+################################################
+# Decodes an unfiltered 8-bit RGB PNG
+def read_png(data: bytes):
+    """Return the height x width x 3 pixels of a PNG written by encode_png()."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position, chunks = 8, {}
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        assert struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = body
+        position += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, color_type) == (8, 2) and b"IEND" in chunks
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, width * 3 + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 3)
+
+def test_recording_turtle_moves():
+    drawing = Drawing()
+    bob = drawing.Turtle()
+    bob.forward(100)
+    bob.left(90)
+    bob.penup()
+    bob.forward(50)
+    bob.pendown()
+    bob.right(90)
+    bob.backward(100)
+    assert bob.position() == pytest.approx((0, 50)) and bob.heading() == 0
+    assert [command for _, command, _ in drawing.commands] == ["forward", "left", "penup", "forward", "pendown",
+                                                              "left", "forward"]
+    assert [item[0] for item in drawing.items] == ["line", "line"] # Nothing is drawn with the pen up
+    with pytest.raises(ValueError):
+        bob.shape("hexagon")
+
+def test_parse_color():
+    assert parse_color("Orange") == (255, 165, 0)
+    assert parse_color("#10a0FF") == (16, 160, 255)
+    assert parse_color((1.0, 0.5, 0)) == (255, 128, 0)
+    for color in ("chartreuse-ish", "#123", (2, 0, 0)):
+        with pytest.raises(ValueError):
+            parse_color(color)
+
+@pytest.mark.parametrize("name", list(SCENES))
+def test_batched_scenes_render_like_animated_ones(name):
+    batched, animated = record_scene(SCENES[name]), record_scene(SCENES[name], batched=False)
+    assert len(batched.items) <= len(animated.items)
+    assert [(t.position(), t.heading()) for t in batched.turtles] == \
+           pytest.approx([(t.position(), t.heading()) for t in animated.turtles])
+    assert render_png(batched, 200, 150, 0.5) == render_png(animated, 200, 150, 0.5)
+
+def test_pentagon_png():
+    pixels = read_png(render_png(record_scene(SCENES["pentagon"]), 320, 240))
+    assert pixels.shape == (240, 320, 3)
+    assert (pixels[0, 0] == 255).all() # Background
+    assert (pixels[120, 200] == 0).all() # First side, from (0, 0) to (100, 0), in black
+    assert not (pixels[119:122, 145:155] == 255).all() # The turtle is drawn back home, on the origin
+    empty = read_png(render_png(Drawing(), 32, 16))
+    assert (empty == 255).all()
+
+def test_svg():
+    svg = render_svg(record_scene(SCENES["stamped_hexagon"]), show_turtles=False)
+    root = ElementTree.fromstring(svg)
+    namespace = "{http://www.w3.org/2000/svg}"
+    polylines = root.findall(namespace + "polyline")
+    polygons = root.findall(namespace + "polygon")
+    assert len(polylines) == 1 and len(polylines[0].get("points").split()) == 13
+    assert polylines[0].get("stroke") == "#0000ff"
+    assert len(polygons) == 13 and all(polygon.get("fill") == "#0000ff" for polygon in polygons)
+    # Lines of a step by step recording are joined into the same polyline
+    batched = ElementTree.fromstring(render_svg(record_scene(SCENES["slow_hexagon"]), show_turtles=False))
+    animated = ElementTree.fromstring(render_svg(record_scene(SCENES["slow_hexagon"], batched=False), show_turtles=False))
+    assert [p.get("points") for p in animated.findall(namespace + "polyline")] == \
+           [p.get("points") for p in batched.findall(namespace + "polyline")] == [polylines[0].get("points")]
+
+def test_command_line(tmp_path):
+    result = subprocess.run([sys.executable, "-m", "turtle_play.headless", "--format", "svg", "--output", str(tmp_path),
+                             "--scenes", "pentagon,spiral", "--repeat", "3"], cwd=ROOT, capture_output=True,
+                            text=True, check=True)
+    report = json.loads(result.stdout)
+    assert report["scenes_rendered"] == 6
+    assert sorted(os.listdir(tmp_path)) == ["pentagon.svg", "spiral.svg"]
+    result = subprocess.run([sys.executable, "-m", "turtle_play.headless", "--scenes", "octagon"], cwd=ROOT,
+                            capture_output=True, text=True)
+    assert result.returncode == 2 and "unknown scenes octagon" in result.stderr
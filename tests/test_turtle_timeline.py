@@ -0,0 +1,121 @@
+################################################
+# Title     : Turtle Timeline Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays timelines on a fake screen whose timers run on a fake clock.
+#             Usage: python -m pytest tests/test_turtle_timeline.py
+#
+# All Rights Reserved.
+################################################
+
+import pytest
+
+from turtle_play.timeline import Timeline, Track
+
+################################################
+# Class Definitions
+################################################
+# Class of a clock moved by the test
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+# Class to stand in for the turtle screen
+class FakeScreen:
+    """Screen whose ontimer() callbacks are run by run(), moving the clock to their due time."""
+    def __init__(self, clock: FakeClock, update_cost: float = 0.0) -> None:
+        self.clock = clock
+        self.update_cost = update_cost # Seconds an update() takes
+        self.tracing = 1
+        self.tracer_calls = []
+        self.updates = 0
+        self.timers = []
+
+    def tracer(self, n: int = None):
+        if n is None:
+            return self.tracing
+        self.tracer_calls.append(n)
+        self.tracing = n
+
+    def update(self) -> None:
+        self.updates += 1
+        self.clock.now += self.update_cost
+
+    def ontimer(self, callback, delay: int) -> None:
+        assert delay >= 0
+        self.timers.append((callback, delay))
+
+    def run(self) -> None:
+        while self.timers:
+            callback, delay = self.timers.pop(0)
+            self.clock.now += delay / 1000
+            callback()
+
+################################################
+# Function Definitions
+################################################
+# Returns a scene taking a number of steps, logging them
+def counting_scene(log: list, name: str, count: int):
+    def scene(screen):
+        for i in range(count):
+            log.append((name, i))
+            yield
+    return scene
+
+def test_track_takes_steps_due():
+    log = []
+    track = Track(counting_scene(log, "a", 10)(None), rate=4, start=1.0)
+    track.advance(0.5)
+    assert log == []
+    track.advance(1.0)
+    assert track.taken == 1
+    track.advance(2.0)
+    assert track.taken == 5 and not track.done
+    track.advance(10.0)
+    assert track.taken == 10 and track.done
+    batched = Track(counting_scene(log, "b", 7)(None))
+    batched.advance(0.0)
+    assert batched.done and batched.taken == 7
+
+def test_tracks_play_together():
+    clock, log, finished = FakeClock(), [], []
+    screen = FakeScreen(clock)
+    timeline = Timeline(screen, fps=10, clock=clock)
+    timeline.add(counting_scene(log, "a", 20), rate=20)
+    timeline.add(counting_scene(log, "b", 5), rate=5)
+    timeline.add(counting_scene(log, "c", 3))
+    timeline.start(lambda: finished.append(clock()))
+    screen.run()
+    assert finished and screen.tracer_calls == [0, 1] # Tracing is restored at the end
+    assert log[:5] == [("a", 0), ("b", 0), ("c", 0), ("c", 1), ("c", 2)] # The first frame
+    assert sorted(log) == sorted([("a", i) for i in range(20)] + [("b", i) for i in range(5)] + [("c", i) for i in range(3)])
+    # The steps of a and b interleave instead of one scene playing after the other
+    assert log.index(("b", 1)) < log.index(("a", 19))
+    stats = timeline.stats()
+    assert stats["frames"] == screen.updates and stats["dropped_frames"] == 0
+    assert stats["elapsed_s"] == pytest.approx(1.0, abs=0.11) # b takes its last step 0.8s in, a finishes after 1s
+    assert stats["fps"] == pytest.approx(10, rel=0.05)
+
+def test_slow_frames_are_dropped():
+    clock, log = FakeClock(), []
+    screen = FakeScreen(clock, update_cost=0.25) # A frame takes 2.5 periods
+    timeline = Timeline(screen, fps=10, clock=clock)
+    timeline.add(counting_scene(log, "a", 20), rate=20)
+    timeline.start()
+    screen.run()
+    stats = timeline.stats()
+    assert len(log) == 20
+    assert stats["dropped_frames"] > 0 and stats["frames"] < 11
+    assert stats["frames"] + stats["dropped_frames"] == pytest.approx(stats["elapsed_s"] * 10, abs=2)
+    assert stats["draw_ms_mean"] == pytest.approx(250) and stats["draw_ms_max"] == pytest.approx(250)
+    assert stats["fps"] < 5
+
+def test_stats_before_start():
+    timeline = Timeline(FakeScreen(FakeClock()), fps=30)
+    assert timeline.stats()["frames"] == 0 and timeline.stats()["fps"] == 0.0
@@ -0,0 +1,76 @@
+################################################
+# Title     : Wheel of Fortune Board Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the incrementally revealed board against obscurePhrase() and showBoard().
+#             Usage: python -m pytest tests/test_wof_board.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+from wheel_of_fortune.game_data import getGameData
+from wheel_of_fortune.wheel_of_fortune import (LETTERS, VOWEL_COST, Board, WOFPlayer, checkMove, obscurePhrase,
+                                               requestPlayerMove, showBoard)
+
+################################################
+# Class Definitions
+################################################
+# Class of a player replaying a list of moves
+class ScriptedPlayer(WOFPlayer):
+    def __init__(self, name, moves):
+        super().__init__(name)
+        self.moves = list(moves)
+    def getMove(self, category, obscuredPhrase, guessed):
+        return self.moves.pop(0)
+
+################################################
+# Function Definitions
+################################################
+def test_board_matches_obscure_phrase():
+    categories, phrases = getGameData().getPhrases()
+    rng = random.Random(0)
+    for _ in range(200):
+        category = rng.choice(categories)
+        phrase = rng.choice(phrases[category])
+        board = Board(category, phrase)
+        guessed = []
+        for letter in rng.sample(LETTERS, len(LETTERS)):
+            assert board.guess(letter) == phrase.count(letter)
+            guessed.append(letter)
+            assert board.obscured() == obscurePhrase(phrase, guessed)
+            assert board.show() == showBoard(category, obscurePhrase(phrase, guessed), guessed)
+            assert board.isGuessed(letter)
+            assert board.isSolved() == ('_' not in board.obscured())
+        assert board.isSolved() and board.obscured() == phrase
+
+def test_punctuation_is_shown():
+    board = Board('Phrase', "DON'T STOP-NOW!")
+    assert board.obscured() == "___'_ ____-___!"
+    board.guess('O')
+    assert board.obscured() == "_O_'_ __O_-_O_!" and board.hidden == 8
+    assert not board.isGuessed('D')
+
+def test_check_move():
+    board = Board('Thing', 'BALL')
+    board.guess('L')
+    player = WOFPlayer('A')
+    assert checkMove(player, '@', board) == 'Guesses should be letters. Try again.'
+    assert checkMove(player, 'L', board) == 'L has already been guessed. Try again.'
+    assert checkMove(player, 'A', board) == 'Need ${} to guess a vowel. Try again.'.format(VOWEL_COST)
+    assert checkMove(player, 'B', board) is None
+    assert checkMove(player, 'BALL', board) is None
+    player.addMoney(VOWEL_COST)
+    assert checkMove(player, 'A', board) is None
+
+def test_request_player_move_retries():
+    lines = []
+    player = ScriptedPlayer('A', ['l', '7', 'b'])
+    move = requestPlayerMove(player, 'Thing', ['L'], 'BALL', sleep=lambda seconds: None, output=lines.append)
+    assert move == 'B'
+    assert lines == ['move: l', 'L has already been guessed. Try again.', 'move: 7',
+                     'Guesses should be letters. Try again.', 'move: b']
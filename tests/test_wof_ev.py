@@ -0,0 +1,110 @@
+################################################
+# Title     : Wheel of Fortune Expected Value Engine Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the wheel and board models of the expected value engine and the moves it chooses.
+#             Usage: python -m pytest tests/test_wof_ev.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wheel_of_fortune import ev
+from wheel_of_fortune.ev import BoardModel, EVEngine, WheelModel
+from wheel_of_fortune.game_data import getGameData
+from wheel_of_fortune.phrase_index import PhraseIndex
+from wheel_of_fortune.wheel_of_fortune import VOWEL_COST, VOWELS, Game, WOFComputerPlayer, obscurePhrase
+
+WHEEL = [{'type': 'cash', 'text': '$500', 'value': 500, 'prize': False, 'weight': 3},
+         {'type': 'bankrupt', 'text': 'BANKRUPT', 'prize': False},
+         {'type': 'cash', 'text': '$900', 'value': 900, 'prize': False, 'weight': 0.5},
+         {'type': 'loseturn', 'text': 'Lose a turn', 'prize': False, 'weight': 2}]
+PHRASES = {'Thing': ['BALL', 'BELL', 'BILL', 'CALL', 'FALL', 'HALL', 'MALL', 'TALL', 'WALL', 'SELL', 'TELL', 'WELL']}
+
+################################################
+# Function Definitions
+################################################
+def test_wheel_model():
+    model = WheelModel(WHEEL)
+    segments = model.spin(np.random.default_rng(0).random(65000))
+    weights = np.array([3, 1, 0.5, 2])
+    assert np.abs(np.bincount(segments, minlength=4) / 65000 - weights / weights.sum()).max() < 0.01
+    assert model.values.tolist() == [500, 0, 900, 0]
+    assert model.bankrupt.tolist() == [False, True, False, False]
+    assert model.endsTurn.tolist() == [False, True, False, True]
+
+def test_board_model_matches_candidates():
+    index = PhraseIndex(PHRASES)
+    guessed = ['L', 'W']
+    board = BoardModel.build(index, 'Thing', '__LL', guessed)
+    assert board.candidates == 10 and board.phrases == []
+    phrases = [p for p in PHRASES['Thing'] if obscurePhrase(p, guessed) == '__LL']
+    for letter, probability, copies in zip(board.letters, board.probabilities, board.copies):
+        having = [p for p in phrases if letter in p]
+        assert probability == pytest.approx(len(having) / len(phrases))
+        assert copies == pytest.approx(sum(p.count(letter) for p in having) / len(having))
+    assert board.letters[0] == 'A' # In 6 of the 10 phrases
+    assert set(board.letters) == set(''.join(phrases)) - set(guessed)
+    assert BoardModel.build(index, 'Thing', '___', []) is None
+    assert BoardModel.build(index, 'Thing', 'Q_LL', ['Q', 'L']) is None
+
+def test_choose_move_is_legal_and_seeded():
+    index = PhraseIndex(PHRASES)
+    engine = EVEngine(WHEEL, timeBudget=0)
+    board = BoardModel.build(index, 'Thing', '__LL', ['L'])
+    for money in (0, VOWEL_COST, 5000):
+        moves = [engine.chooseMove(board, money, 900, VOWEL_COST, VOWELS, engine.generator(seed)) for seed in range(10)]
+        assert moves == [engine.chooseMove(board, money, 900, VOWEL_COST, VOWELS, engine.generator(seed)) for seed in range(10)]
+        for move in moves:
+            assert move == 'PASS' or move in PHRASES['Thing'] or move in board.letters
+            if money < VOWEL_COST:
+                assert move not in VOWELS
+
+def test_single_candidate_is_solved():
+    index = PhraseIndex(PHRASES)
+    engine = EVEngine(WHEEL, timeBudget=0)
+    board = BoardModel.build(index, 'Thing', 'B_LL', ['B', 'L', 'A', 'E'])
+    assert board.phrases == ['BILL']
+    assert engine.chooseMove(board, 1000, 500, VOWEL_COST, VOWELS, engine.generator(0)) == 'BILL'
+
+def test_ev_players_play_seeded_games():
+    engine = EVEngine(getGameData().getWheel()[0], timeBudget=0)
+    results = []
+    for _ in range(2):
+        rng = random.Random(4)
+        lines = []
+        players = [WOFComputerPlayer('Computer {}'.format(i+1), 10, output=lines.append, evEngine=engine,
+                                     rng=random.Random(rng.getrandbits(64))) for i in range(2)]
+        game = Game(players, sleep=lambda seconds: None, output=lines.append, maxTurns=100, rng=rng)
+        game.play()
+        results.append(lines)
+    assert results[0] == results[1]
+    assert any(line.startswith('Expected value move') for line in results[0])
+
+def test_default_batches_do_not_depend_on_the_clock(monkeypatch):
+    index = PhraseIndex(PHRASES)
+    board = BoardModel.build(index, 'Thing', '__LL', ['L'])
+    engine = EVEngine(WHEEL)
+    expected = [engine.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, engine.generator(seed)) for seed in range(10)]
+    state = engine.generator(0)
+    engine.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, state)
+    # A clock jumping a second per reading would end a timed move after its first batch
+    ticks = iter(range(10**6))
+    monkeypatch.setattr(ev.time, 'perf_counter', lambda: float(next(ticks)))
+    assert [engine.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, engine.generator(seed)) for seed in range(10)] == expected
+    slow = engine.generator(0)
+    engine.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, slow)
+    assert slow.bit_generator.state == state.bit_generator.state
+    timed, fixed = EVEngine(WHEEL, timeBudget=0.5), EVEngine(WHEEL, batches=1)
+    first, second = timed.generator(0), fixed.generator(0)
+    timed.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, first)
+    fixed.chooseMove(board, 1000, 900, VOWEL_COST, VOWELS, second)
+    assert first.bit_generator.state == second.bit_generator.state # One batch before the budget ran out
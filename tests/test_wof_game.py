@@ -0,0 +1,84 @@
+################################################
+# Title     : Wheel of Fortune Game Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays headless games between computer players and steps a game by hand.
+#             Usage: python -m pytest tests/test_wof_game.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+from wheel_of_fortune.wheel_of_fortune import Game, WOFComputerPlayer, WOFPlayer
+
+################################################
+# Class Definitions
+################################################
+# Class of a player moved by the test
+class ScriptedPlayer(WOFPlayer):
+    """Player whose moves come from the driver of Game.steps()"""
+
+################################################
+# Function Definitions
+################################################
+# Plays a seeded game between computer players and returns what it printed and its result
+def playSeeded(seed, levels=(1, 5, 7), maxTurns=200):
+    rng = random.Random(seed)
+    lines, pauses = [], []
+    players = [WOFComputerPlayer('Computer {}'.format(i+1), level, output=lines.append, rng=random.Random(rng.getrandbits(64)))
+               for i, level in enumerate(levels)]
+    game = Game(players, sleep=pauses.append, output=lines.append, maxTurns=maxTurns, rng=rng)
+    winner = game.play()
+    return lines, pauses, winner, game
+
+def test_headless_games_finish():
+    for seed in range(20):
+        lines, pauses, winner, game = playSeeded(seed)
+        assert pauses and set(pauses) <= {Game.SPIN_PAUSE, Game.RESULT_PAUSE, 0.1} # No real sleeps were taken
+        if winner:
+            assert '{} wins! The phrase was {}'.format(winner.name, game.phrase) in lines
+            assert winner.prizeMoney >= 0
+        else:
+            assert game.turns == 200
+
+def test_seeded_games_repeat():
+    first, _, firstWinner, firstGame = playSeeded(3)
+    second, _, secondWinner, secondGame = playSeeded(3)
+    assert first == second
+    assert (firstGame.phrase, firstGame.turns, firstWinner.name if firstWinner else None) == \
+           (secondGame.phrase, secondGame.turns, secondWinner.name if secondWinner else None)
+
+def test_max_turns_ends_game():
+    players = [ScriptedPlayer('A'), ScriptedPlayer('B')]
+    game = Game(players, sleep=None, output=lambda line: None, maxTurns=5, rng=random.Random(0))
+    steps = game.steps()
+    reply, moves = None, 0
+    try:
+        while True:
+            step, value = steps.send(reply)
+            if step == Game.PAUSE:
+                reply = None
+            else:
+                assert value in players
+                moves += 1
+                reply = 'PASS'
+    except StopIteration as stop:
+        assert stop.value is False
+    assert game.turns == 5 and moves <= 5
+
+def test_solving_wins():
+    players = [ScriptedPlayer('A')]
+    game = Game(players, sleep=None, output=lambda line: None, rng=random.Random(1))
+    steps = game.steps()
+    reply = None
+    try:
+        while True:
+            step, value = steps.send(reply)
+            reply = game.phrase if step == Game.MOVE else None
+    except StopIteration as stop:
+        assert stop.value is players[0]
+    assert players[0].prizeMoney > 0
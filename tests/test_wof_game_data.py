@@ -0,0 +1,90 @@
+################################################
+# Title     : Wheel of Fortune Game Data Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the weighted wheel spins and the reloading of the cached data files.
+#             Usage: python -m pytest tests/test_wof_game_data.py
+#
+# All Rights Reserved.
+################################################
+
+import json
+import os
+import random
+
+import pytest
+
+from wheel_of_fortune import game_data
+from wheel_of_fortune.game_data import AliasTable, GameData
+
+WHEEL = [{'type': 'cash', 'text': '$500', 'value': 500, 'prize': False, 'weight': 3},
+         {'type': 'bankrupt', 'text': 'BANKRUPT', 'prize': False},
+         {'type': 'cash', 'text': '$900', 'value': 900, 'prize': False, 'weight': 0.5},
+         {'type': 'loseturn', 'text': 'Lose a turn', 'prize': False, 'weight': 2}]
+PHRASES = {'Thing': ['book', 'Ball'], 'Place': ['Rome']}
+
+################################################
+# Function Definitions
+################################################
+# Returns the probability of every index of an alias table
+def aliasProbabilities(table):
+    n = len(table.probability)
+    probabilities = [p / n for p in table.probability]
+    for i, (p, alias) in enumerate(zip(table.probability, table.alias)):
+        if alias != i:
+            probabilities[alias] += (1 - p) / n
+    return probabilities
+
+@pytest.mark.parametrize("weights", [[1], [1, 1, 1], [3, 1, 0.5, 2], [0, 5, 0, 1], [1e-6, 1, 1000]])
+def test_alias_table_probabilities(weights):
+    table = AliasTable(weights)
+    expected = [w / sum(weights) for w in weights]
+    assert aliasProbabilities(table) == pytest.approx(expected, abs=1e-12)
+
+def test_alias_table_sampling():
+    table = AliasTable([3, 1])
+    rng = random.Random(0)
+    draws = [table.sample(rng) for _ in range(40000)]
+    assert abs(draws.count(0) / len(draws) - 0.75) < 0.01
+    with pytest.raises(ValueError):
+        AliasTable([0, 0])
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_data, 'CHECK_INTERVAL', 0.0)
+    (tmp_path / 'wheel.json').write_text(json.dumps(WHEEL))
+    (tmp_path / 'phrases.json').write_text(json.dumps(PHRASES))
+    return tmp_path
+
+# Rewrites a data file with a later modification time
+def rewrite(path, data):
+    stat = os.stat(path)
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+def test_files_parsed_once_until_changed(directory):
+    data = GameData(str(directory))
+    wheel, table = data.getWheel()
+    assert data.getWheel()[0] is wheel
+    categories, phrases = data.getPhrases()
+    assert categories == ('Thing', 'Place') and phrases['Thing'] == ('BOOK', 'BALL')
+    assert data.getPhrases()[1] is phrases
+    rewrite(directory / 'wheel.json', WHEEL[:2])
+    assert len(data.getWheel()[0]) == 2
+    rewrite(directory / 'phrases.json', {'Thing': ['cook']})
+    assert data.getPhrases()[1] == {'Thing': ('COOK',)}
+    assert data.getRandomCategoryAndPhrase(random.Random(0)) == ('Thing', 'COOK')
+
+def test_weighted_spins(directory):
+    data = GameData(str(directory))
+    rng = random.Random(1)
+    counts = [0] * len(WHEEL)
+    for _ in range(65000):
+        counts[data.spinWheelIndex(rng)[0]] += 1
+    weights = [segment.get('weight', 1) for segment in WHEEL]
+    for count, weight in zip(counts, weights):
+        assert abs(count / 65000 - weight / sum(weights)) < 0.01
+    assert data.spinWheel(random.Random(2)) in WHEEL
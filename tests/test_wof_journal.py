@@ -0,0 +1,87 @@
+################################################
+# Title     : Wheel of Fortune Journal Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Writes event journals and reads them back through the memory-mapped reader.
+#             Usage: python -m pytest tests/test_wof_journal.py
+#
+# All Rights Reserved.
+################################################
+
+import os
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from wheel_of_fortune.events import GAME_END, GAME_START, LETTER, NO_SEGMENT, SPIN
+from wheel_of_fortune.journal import BUFFER_RECORDS, HEADER, MAGIC, RECORD, Journal, readJournal, summarize
+from wheel_of_fortune.wheel_of_fortune import Game, WOFComputerPlayer
+
+FIELDS = ('game', 'turn', 'seat', 'event', 'letter', 'count', 'segment', 'value', 'money')
+
+################################################
+# Function Definitions
+################################################
+# Does nothing; stands in for sleep and output
+def discard(*args):
+    pass
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'events.journal')
+    records = [(7, 0, 0, GAME_START, 0, 0, NO_SEGMENT, 0, 0),
+               (7, 1, 2, SPIN, 0, 0, 5, 900, 0),
+               (7, 1, 2, LETTER, 20, 3, 5, 2700, 2700),
+               (7, 1, 2, LETTER, 1, 0, NO_SEGMENT, -250, 2450),
+               (2**32 - 1, 70000, 255, GAME_END, 0, 0, NO_SEGMENT, -2**31, 2**31 - 1)] # Turns past 16 bits
+    with Journal(path) as journal:
+        for record in records:
+            journal.record(*record)
+    with Journal(path) as journal: # Appending keeps the header and the earlier records
+        journal.record(*records[0])
+    assert os.path.getsize(path) == HEADER.size + RECORD.size * (len(records) + 1)
+    assert [tuple(int(record[field]) for field in FIELDS) for record in readJournal(path)] == records + records[:1]
+
+def test_buffered_records_are_written(tmp_path):
+    path = str(tmp_path / 'events.journal')
+    count = BUFFER_RECORDS * 2 + 3
+    with Journal(path) as journal:
+        for i in range(count):
+            journal.record(i, i % 100, 0, SPIN, segment=i % 24, value=i)
+    records = readJournal(path)
+    assert len(records) == count
+    assert records['game'].tolist() == list(range(count))
+    assert records['value'].tolist() == list(range(count))
+
+def test_empty_and_foreign_files(tmp_path):
+    path = str(tmp_path / 'empty.journal')
+    Journal(path).close()
+    assert len(readJournal(path)) == 0
+    foreign = tmp_path / 'foreign.journal'
+    foreign.write_bytes(HEADER.pack(MAGIC, 1, 20))
+    with pytest.raises(ValueError):
+        readJournal(str(foreign))
+    with pytest.raises(ValueError):
+        Journal(str(foreign))
+
+def test_journaled_games(tmp_path):
+    path = str(tmp_path / 'games.journal')
+    winners = {}
+    with Journal(path) as journal:
+        for game in range(20):
+            rng = random.Random(game)
+            players = [WOFComputerPlayer('Computer {}'.format(seat+1), 5, output=discard, rng=random.Random(rng.getrandbits(64)))
+                       for seat in range(3)]
+            winner = Game(players, sleep=discard, output=discard, maxTurns=200, journal=journal, gameId=game, rng=rng).play()
+            winners[game] = players.index(winner) if winner else 0xFF
+    records = readJournal(path)
+    ends = records[records['event'] == GAME_END]
+    assert ends['game'].tolist() == list(range(20))
+    assert ends['seat'].tolist() == [winners[game] for game in range(20)]
+    summary = summarize(records)
+    assert summary['games'] == 20
+    assert sum(int(n) for n in summary['bankruptcies_per_game'].values()) == 20
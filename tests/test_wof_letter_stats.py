@@ -0,0 +1,83 @@
+################################################
+# Title     : Wheel of Fortune Letter Statistics Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that good moves follow the phrases still consistent with the board.
+#             Usage: python -m pytest tests/test_wof_letter_stats.py
+#
+# All Rights Reserved.
+################################################
+
+import json
+
+from wheel_of_fortune.letter_stats import FILE_NAME, LETTER_BITS, VERSION, LetterStats
+from wheel_of_fortune.phrase_index import PhraseIndex
+from wheel_of_fortune.wheel_of_fortune import obscurePhrase
+
+ALL_LETTERS = sum(LETTER_BITS.values())
+PHRASES = {
+    'Thing': ['BOOK', 'COOK', 'HOOK', 'LOOK', 'TOOK', 'BALL', 'CALL', 'HALL', 'WALL', 'FALL', 'JAZZ'] + ['SEE'] * 10,
+    'Place': ['ROME', 'OSLO', 'LIMA'],
+}
+
+################################################
+# Function Definitions
+################################################
+# Returns the mask of every letter except the given ones
+def without(*letters):
+    return ALL_LETTERS & ~sum(LETTER_BITS[c] for c in letters)
+
+def test_prior_without_candidates():
+    stats = LetterStats.build(PHRASES)
+    # SEE is 10 of the 21 phrases of Thing, so its letters lead the category ranking
+    assert stats.ranking('Thing')[:2] in ('ES', 'SE')
+    assert stats.bestLetter('Thing', '_____', [], ALL_LETTERS, PhraseIndex(PHRASES)) == stats.ranking('Thing')[0]
+    assert stats.bestLetter('Unknown', '____', [], ALL_LETTERS) == stats.ranking('Unknown')[0] == stats.overall[0]
+
+def test_pick_follows_board():
+    stats = LetterStats.build(PHRASES)
+    index = PhraseIndex(PHRASES)
+    # Eleven phrases fit ____: A and L are in six of them, E and S (the prior of Thing) in none
+    assert stats.bestLetter('Thing', '____', [], ALL_LETTERS, index) in ('A', 'L')
+    # A miss on L leaves BOOK, COOK, HOOK, TOOK and JAZZ
+    assert stats.bestLetter('Thing', '____', ['L'], without('L'), index) in ('O', 'K')
+    # A miss on O leaves JAZZ only: the prior of the category keeps the pick from giving the phrase away
+    assert stats.bestLetter('Thing', '____', ['L', 'O'], without('L', 'O'), index) in ('E', 'S')
+    # Revealed letters count as well: _OO_ leaves the ..OOK phrases
+    assert stats.bestLetter('Thing', '_OO_', ['O'], without('O'), index) == 'K'
+
+# Returns the letters picked until a phrase is revealed
+def playOut(stats, index, phrase):
+    guessed = []
+    while obscurePhrase(phrase, guessed) != phrase:
+        letter = stats.bestLetter('Thing', obscurePhrase(phrase, guessed), guessed, without(*guessed), index)
+        assert letter not in guessed
+        guessed.append(letter)
+    return guessed
+
+def test_pick_changes_as_board_fills_in():
+    stats = LetterStats.build(PHRASES)
+    index = PhraseIndex(PHRASES)
+    hook, ball = playOut(stats, index, 'HOOK'), playOut(stats, index, 'BALL')
+    # Same shape, so the same first pick; the picks then follow what the board reveals
+    assert hook[0] == ball[0]
+    assert hook[:3] != ball[:3]
+
+def test_pick_respects_available_mask():
+    stats = LetterStats.build(PHRASES)
+    index = PhraseIndex(PHRASES)
+    assert stats.bestLetter('Thing', '____', [], LETTER_BITS['Q'], index) == 'Q'
+    assert stats.bestLetter('Thing', '____', [], 0, index) is None
+
+def test_saved_counts(tmp_path):
+    stats = LetterStats.load(PHRASES, str(tmp_path))
+    data = json.loads((tmp_path / FILE_NAME).read_text())
+    assert data['version'] == VERSION
+    assert 'templates' not in data # Nothing is kept per phrase shape
+    loaded = LetterStats.load(PHRASES, str(tmp_path))
+    assert (loaded.overall, loaded.categories) == (stats.overall, stats.categories)
+    changed = LetterStats.load(dict(PHRASES, Place=['PARIS']), str(tmp_path))
+    assert changed.digest != stats.digest
@@ -0,0 +1,59 @@
+################################################
+# Title     : Wheel of Fortune Phrase Index Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the phrases found by the index against a scan of the phrases of a category.
+#             Usage: python -m pytest tests/test_wof_phrase_index.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+from wheel_of_fortune.game_data import getGameData
+from wheel_of_fortune.phrase_index import TEMPLATE_TABLE, PhraseIndex
+from wheel_of_fortune.wheel_of_fortune import LETTERS, WOFComputerPlayer, obscurePhrase
+
+################################################
+# Function Definitions
+################################################
+# Returns the phrases of a category that show the board after the guessed letters
+def scan(phrases, obscuredPhrase, guessed):
+    return [phrase for phrase in dict.fromkeys(phrases) if obscurePhrase(phrase, guessed) == obscuredPhrase]
+
+def test_candidates_match_scan():
+    categories, phrases = getGameData().getPhrases()
+    index = PhraseIndex(phrases)
+    rng = random.Random(0)
+    for _ in range(300):
+        category = rng.choice(categories)
+        phrase = rng.choice(phrases[category])
+        guessed = rng.sample(LETTERS, rng.randrange(0, 12))
+        board = obscurePhrase(phrase, guessed)
+        count, found = index.candidates(category, board, guessed)
+        expected = scan(phrases[category], board, guessed)
+        assert phrase in found
+        assert sorted(found) == sorted(expected) and count == len(expected)
+
+def test_repeated_letters_and_limit():
+    phrases = {'Thing': ['SEE', 'SEA', 'SET', 'TEE', 'BEE', 'TEA', 'EEL']}
+    index = PhraseIndex(phrases)
+    assert index.candidates('Thing', '_EE', ['E'])[1] == ['SEE', 'TEE', 'BEE'] # SEA, SET and TEA have one E only
+    assert index.candidates('Thing', '_E_', ['E'])[1] == ['SEA', 'SET', 'TEA']
+    assert index.candidates('Thing', '_EE', ['E', 'S', 'T'])[1] == ['BEE']
+    assert index.candidates('Thing', '_EE', ['E'], limit=2) == (3, [])
+    assert index.candidates('Thing', '____', []) == (0, [])
+    assert index.candidates('Place', '___', []) == (0, [])
+    assert index.group('Thing', 'SEE'.translate(TEMPLATE_TABLE)).phrases == tuple(phrases['Thing'])
+
+def test_computer_players_solve_from_candidates():
+    phrases = {'Thing': ['SEE', 'TEE', 'BEE', 'CAT']}
+    index = PhraseIndex(phrases)
+    player = WOFComputerPlayer('Computer', 10, output=lambda line: None, phraseIndex=index, rng=random.Random(0))
+    # Two thirds of the letters are revealed and a single phrase fits
+    assert player.getSolution('Thing', 'SEE'.replace('S', '_'), ['E', 'T', 'B']) == 'SEE'
+    # Nothing revealed: not confident enough
+    assert player.getSolution('Thing', '___', []) is None
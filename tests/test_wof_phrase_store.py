@@ -0,0 +1,103 @@
+################################################
+# Title     : Wheel of Fortune Phrase Store Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that the binary phrase store holds and picks the same phrases as phrases.json.
+#             Usage: python -m pytest tests/test_wof_phrase_store.py
+#
+# All Rights Reserved.
+################################################
+
+import json
+import os
+import random
+
+import pytest
+
+from wheel_of_fortune import game_data, phrase_store
+from wheel_of_fortune.game_data import DATA_DIRECTORY, GameData
+from wheel_of_fortune.letter_stats import LetterStats
+from wheel_of_fortune.phrase_store import PhraseStore, compileFile, compilePhrases, openStore
+
+PHRASES = {'Thing': ['book', 'Ball', 'Café crème'], 'Place': ['Rome'], 'Empty': []}
+
+################################################
+# Function Definitions
+################################################
+def test_store_matches_json():
+    with open(os.path.join(DATA_DIRECTORY, 'phrases.json')) as f:
+        phrases = json.load(f)
+    store = PhraseStore(compileFile(os.path.join(DATA_DIRECTORY, 'phrases.json')))
+    assert store.categories == tuple(phrases)
+    assert store.toDict() == {category: tuple(p.upper() for p in phrases[category]) for category in phrases}
+    # A seeded pick is the one random.choice() makes on the parsed phrases
+    categories = tuple(phrases)
+    for seed in range(50):
+        rng, expected = random.Random(seed), random.Random(seed)
+        category = expected.choice(categories)
+        assert store.randomCategoryAndPhrase(rng) == (category, expected.choice(phrases[category]).upper())
+
+def test_unicode_and_empty_category():
+    store = PhraseStore(compilePhrases(PHRASES))
+    assert store.phrases('Thing') == ('BOOK', 'BALL', 'CAFÉ CRÈME')
+    assert store.phrases('Empty') == () and store.numPhrases == 4 and store.source is None
+
+def test_invalid_stores(tmp_path):
+    with pytest.raises(ValueError):
+        PhraseStore(b'')
+    with pytest.raises(ValueError):
+        PhraseStore(b'NOTASTORE' * 10)
+    with pytest.raises(ValueError):
+        PhraseStore(compilePhrases(PHRASES)[:-3]) # Truncated blob
+    (tmp_path / 'empty.bin').write_bytes(b'')
+    with pytest.raises(ValueError):
+        PhraseStore.open(str(tmp_path / 'empty.bin'))
+
+def test_store_recompiled_when_json_changes(tmp_path):
+    jsonPath, storePath = tmp_path / 'phrases.json', tmp_path / phrase_store.FILE_NAME
+    jsonPath.write_text(json.dumps(PHRASES))
+    store = openStore(str(jsonPath), str(storePath))
+    assert storePath.exists() and store.phrases('Place') == ('ROME',)
+    assert openStore(str(jsonPath), str(storePath)).source == store.source
+    stat = os.stat(jsonPath)
+    jsonPath.write_text(json.dumps({'Place': ['Paris', 'Oslo']}))
+    os.utime(jsonPath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert openStore(str(jsonPath), str(storePath)).phrases('Place') == ('PARIS', 'OSLO')
+    # Without phrases.json the store is used as is
+    jsonPath.unlink()
+    assert openStore(str(jsonPath), str(storePath)).toDict() == {'Place': ('PARIS', 'OSLO')}
+    storePath.write_bytes(b'garbage')
+    with pytest.raises(ValueError):
+        openStore(str(jsonPath), str(storePath))
+
+def test_game_data_picks_from_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_data, 'CHECK_INTERVAL', 0.0)
+    (tmp_path / 'phrases.json').write_text(json.dumps(PHRASES))
+    data = GameData(str(tmp_path))
+    assert data.getRandomCategoryAndPhrase(random.Random(1)) == data.getPhraseStore().randomCategoryAndPhrase(random.Random(1))
+    assert (tmp_path / phrase_store.FILE_NAME).exists()
+    (tmp_path / 'phrases.json').unlink()
+    data = GameData(str(tmp_path))
+    assert data.getPhrases() == (('Thing', 'Place', 'Empty'), {'Thing': ('BOOK', 'BALL', 'CAFÉ CRÈME'),
+                                                              'Place': ('ROME',), 'Empty': ()})
+
+def test_index_and_letter_stats_read_from_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_data, 'CHECK_INTERVAL', 0.0)
+    (tmp_path / 'phrases.json').write_text(json.dumps(PHRASES))
+    GameData(str(tmp_path)).getLetterStats() # Compiles the store and saves the letter counts
+    # A later process maps the store and reads the counts: phrases.json is not parsed
+    def fail(*args):
+        raise AssertionError('phrases.json was parsed')
+    monkeypatch.setattr(GameData, 'getPhrases', fail)
+    monkeypatch.setattr(phrase_store, 'compileFile', fail)
+    monkeypatch.setattr(LetterStats, 'build', fail)
+    data = GameData(str(tmp_path))
+    index = data.getPhraseIndex()
+    assert index.candidates('Thing', 'B__K', ['B', 'K']) == (1, ['BOOK'])
+    assert index.candidates('Thing', '___É __È__', []) == (1, ['CAFÉ CRÈME'])
+    stats = data.getLetterStats()
+    assert stats.categorySizes == {'Thing': 3, 'Place': 1, 'Empty': 0}
+    assert stats.digest == data.getPhraseStore().digest()
@@ -0,0 +1,115 @@
+################################################
+# Title     : Wheel of Fortune Server Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays against the server on an ephemeral local port: seating limits and the load generator counts.
+#             Usage: python -m pytest tests/test_wof_server.py
+#
+# All Rights Reserved.
+################################################
+
+import asyncio
+import json
+
+from wheel_of_fortune.loadgen import runLoad
+from wheel_of_fortune.server import Server
+
+HOST = '127.0.0.1'
+TIMEOUT = 30.0 # Seconds a test may take
+
+################################################
+# Class Definitions
+################################################
+# Class standing in for the session of a connection
+class FakeSession:
+    """Collects the messages sent to a session"""
+    def __init__(self):
+        self.messages = []
+        self.table = None
+        self.player = None
+
+    def send(self, message):
+        self.messages.append(message)
+
+################################################
+# Function Definitions
+################################################
+# Runs a coroutine function against a server with no pauses
+def withServer(test):
+    async def run():
+        server = Server(pauseScale=0)
+        listening = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(server.serve(HOST, 0, listening.set_result))
+        port = (await listening).sockets[0].getsockname()[1]
+        try:
+            return await asyncio.wait_for(test(server, port), TIMEOUT)
+        finally:
+            task.cancel()
+    return asyncio.run(run())
+
+# Opens a client connection
+async def connect(port):
+    return await asyncio.open_connection(HOST, port)
+
+# Sends a message and returns the next answer of a given type
+async def request(connection, message, kinds):
+    reader, writer = connection
+    writer.write((json.dumps(message) + '\n').encode('utf-8'))
+    await writer.drain()
+    while True:
+        answer = json.loads(await reader.readline())
+        if answer['type'] in kinds:
+            return answer
+
+def test_full_table_rejects_joins():
+    async def test(server, port):
+        first, second, third = await connect(port), await connect(port), await connect(port)
+        joined = await request(first, {'type': 'join', 'name': 'A', 'humans': 2, 'computers': 1}, ('joined',))
+        table = joined['table']
+        assert (await request(second, {'type': 'join', 'name': 'B', 'table': table}, ('joined', 'error')))['seat'] == 1
+        # The table is full before its game task has resumed
+        refused = await request(third, {'type': 'join', 'name': 'C', 'table': table}, ('joined', 'error'))
+        assert refused['type'] == 'error'
+        assert len(server.tables[table].sessions) == 2
+        stats = await request(third, {'type': 'stats'}, ('stats',))
+        assert stats['tables']['waiting'] == 0
+        for _, writer in (first, second, third):
+            writer.close()
+    withServer(test)
+
+def test_joins_before_the_game_starts():
+    async def test():
+        server = Server(pauseScale=0)
+        sessions = [FakeSession() for _ in range(4)]
+        server.join(sessions[0], {'type': 'join', 'name': 'A', 'humans': 2, 'computers': 0})
+        table = sessions[0].table
+        # Joins handled in the same step of the event loop, before the task of the table runs
+        for i, session in enumerate(sessions[1:]):
+            server.join(session, {'type': 'join', 'name': str(i), 'table': table.tableId})
+        assert table.sessions == sessions[:2]
+        assert [session.messages[-1]['type'] for session in sessions] == ['joined', 'joined', 'error', 'error']
+        assert sessions[2].table is None
+        table.task.cancel()
+    asyncio.run(test())
+
+def test_unknown_table_and_bad_joins():
+    async def test(server, port):
+        client = await connect(port)
+        assert (await request(client, {'type': 'join', 'name': 'A', 'table': 99}, ('joined', 'error')))['type'] == 'error'
+        assert (await request(client, {'type': 'join', 'name': 'A', 'humans': 11}, ('joined', 'error')))['type'] == 'error'
+        assert (await request(client, {'type': 'join', 'humans': 1}, ('joined', 'error')))['type'] == 'error'
+        assert not server.tables
+        client[1].close()
+    withServer(test)
+
+def test_loadgen_counts_each_game_once():
+    async def test(server, port):
+        return await runLoad(HOST, port, clients=6, games=2, humans=3, computers=1, seed=0)
+    report = withServer(test)
+    assert report['failed_clients'] == 0 and report['errors'] == 0
+    assert report['games'] == 4 # Two tables of three seats, two games each
+    assert report['server']['tables']['finished'] == 4
+    assert report['wins'] <= report['games']
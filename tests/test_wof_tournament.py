@@ -0,0 +1,39 @@
+################################################
+# Title     : Wheel of Fortune Tournament Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that a seeded tournament reports the same games for any number of workers and chunk size.
+#             Usage: python -m pytest tests/test_wof_tournament.py
+#
+# All Rights Reserved.
+################################################
+
+import pytest
+
+pytest.importorskip("numpy") # Level 10 seats use the expected value engine
+
+from wheel_of_fortune.tournament import runTournament
+
+TIMING = ('workers', 'elapsed_s', 'games_per_s')
+
+################################################
+# Function Definitions
+################################################
+# Returns a report without its timings
+def outcome(report):
+    return {key: value for key, value in report.items() if key not in TIMING}
+
+def test_reports_match_across_workers():
+    levels = [1, 5, 10]
+    single = runTournament(levels, games=60, seed=3, workers=1, chunkSize=60)
+    split = runTournament(levels, games=60, seed=3, workers=2, chunkSize=7)
+    assert single['games'] == 60
+    assert outcome(split) == outcome(single)
+
+def test_seed_changes_games():
+    first = runTournament([1, 5], games=40, seed=0, workers=1)
+    second = runTournament([1, 5], games=40, seed=1, workers=1)
+    assert outcome(first) != outcome(second)
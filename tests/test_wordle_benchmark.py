@@ -0,0 +1,50 @@
+################################################
+# Title     : Wordle Benchmark Harness Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that a seeded benchmark run reports the same games for any number of workers and chunk size.
+#             Usage: python -m pytest tests/test_wordle_benchmark.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+from wordle.benchmark import game_rng, percentile, run_benchmark
+from wordle.lexicon import DEFAULT_WORDS_FILE, Lexicon
+from wordle.metrics import Metrics
+
+TIMING = ("workers", "elapsed_s", "games_per_s", "move_latency_ms")
+
+################################################
+# Function Definitions
+################################################
+# Returns a report without its timings
+def outcome(report: dict) -> dict:
+    return {key: value for key, value in report.items() if key not in TIMING}
+
+def test_percentile():
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+def test_game_rng_depends_on_seed_and_game():
+    draws = {(seed, game): game_rng(seed, game).random() for seed in range(3) for game in range(3)}
+    assert len(set(draws.values())) == len(draws)
+    assert game_rng(1, 2).random() == draws[(1, 2)]
+
+def test_reports_match_across_workers(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("\n".join(random.Random(0).sample(Lexicon.load(DEFAULT_WORDS_FILE).words, 300)) + "\n")
+    single = run_benchmark(str(words), sample=40, seed=5, workers=1, chunk_size=64)
+    metrics = Metrics()
+    split = run_benchmark(str(words), sample=40, seed=5, workers=2, chunk_size=7, metrics=metrics)
+    assert single["games"] == 40
+    assert outcome(split) == outcome(single)
+    assert sum(single["guess_histogram"].values()) == 40
+    counters = metrics.summary()["counters"] # Merged from the workers
+    assert counters["engine.games_won"] + counters.get("engine.games_lost", 0) == 40
@@ -0,0 +1,60 @@
+################################################
+# Title     : Wordle Feedback Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the feedback codes of score() against the NumPy batch variants, including repeated letters.
+#             Usage: python -m pytest tests/test_wordle_feedback.py
+#
+# All Rights Reserved.
+################################################
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordle import feedback
+from wordle.lexicon import DEFAULT_WORDS_FILE, Lexicon
+
+DUPLICATES = ("EERIE", "LEVEE", "GEESE", "SPEED", "ABBEY", "BOBBY", "LLAMA", "MAMMA", "EAGLE", "TEPEE", "CRANE")
+
+################################################
+# Function Definitions
+################################################
+@pytest.mark.parametrize("guess, target, marks", [
+    ("CRANE", "CRANE", [2, 2, 2, 2, 2]),
+    ("SPEED", "ABIDE", [0, 0, 1, 0, 1]), # One E of the target: only the first E of the guess is in the word
+    ("SPEED", "ERASE", [1, 0, 1, 1, 0]),
+    ("EERIE", "GEESE", [1, 2, 0, 0, 2]),
+    ("LLAMA", "ALLEY", [1, 2, 1, 0, 0]),
+    ("BOBBY", "ABBEY", [1, 0, 2, 0, 2]), # The B of ABBEY left after the green one goes to the first B
+])
+def test_score_marks(guess, target, marks):
+    assert feedback.decode(feedback.score(guess, target), 5) == marks
+
+def test_batch_score_matches_score_on_duplicates():
+    codes = feedback.batch_score(DUPLICATES, DUPLICATES)
+    for i, guess in enumerate(DUPLICATES):
+        for j, target in enumerate(DUPLICATES):
+            assert codes[i, j] == feedback.score(guess, target), (guess, target)
+
+def test_batch_score_matches_score_on_word_list():
+    lexicon = Lexicon.load(DEFAULT_WORDS_FILE)
+    rng = random.Random(0)
+    guesses = rng.sample(lexicon.words, 40)
+    targets = rng.sample(lexicon.words, 300)
+    codes = feedback.batch_score(guesses, targets)
+    assert codes.dtype == feedback.code_dtype(5)
+    assert codes.tolist() == [[feedback.score(guess, target) for target in targets] for guess in guesses]
+    assert feedback.score_targets(guesses[0], lexicon).tolist() == [feedback.score(guesses[0], target) for target in lexicon]
+    assert feedback.score_guesses(guesses, targets[0]).tolist() == [feedback.score(guess, targets[0]) for guess in guesses]
+
+def test_other_word_lengths():
+    words = ["AAB", "ABA", "BAA", "ABC", "CCA"]
+    codes = feedback.batch_score(words, words)
+    assert codes.tolist() == [[feedback.score(guess, target) for target in words] for guess in words]
+    assert feedback.solved_code(3) == codes[0, 0]
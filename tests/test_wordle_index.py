@@ -0,0 +1,67 @@
+################################################
+# Title     : Wordle Candidate Index Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the bitset candidate index of the Bot against a scan of the word list.
+#             Usage: python -m pytest tests/test_wordle_index.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import io
+import random
+
+import pytest
+
+from wordle import Bot, CandidateIndex, GameEngine, Lexicon, Metrics, NoGuessLeftError, feedback
+
+WORDS = ("CRANE", "SLATE", "EERIE", "LEVEE", "GEESE", "SPEED", "ABBEY", "BOBBY", "ALLEY", "LLAMA", "PAPER", "APPLE",
+         "EAGLE", "TEPEE", "ERASE", "CREEP", "SHEEP", "MAMMA", "QUEUE", "STEEL")
+
+################################################
+# Function Definitions
+################################################
+# Returns the candidates left by a scan of the word list
+def scan(words, guess: str, code: int) -> int:
+    """Return the mask of the words that would give the feedback code to guess."""
+    return sum(1 << i for i, word in enumerate(words) if feedback.score(guess, word) == code)
+
+@pytest.mark.parametrize("guess", WORDS)
+def test_narrow_matches_scan(guess):
+    index = CandidateIndex(WORDS)
+    for target in WORDS:
+        code = feedback.score(guess, target)
+        candidates, allowed = index.narrow(index.all_words, index.all_words, guess, feedback.decode(code, 5))
+        assert candidates == scan(WORDS, guess, code), (guess, target)
+        assert candidates & ~allowed == 0 # Every candidate follows the rules of the game engine
+
+def test_pick_draws_from_mask():
+    index = CandidateIndex(WORDS)
+    rng = random.Random(0)
+    for mask in (0b1, 1 << 19, 0b10100100000010, index.all_words):
+        for _ in range(50):
+            assert (mask >> index.pick(mask, rng=rng)) & 1
+
+def test_pick_empty_mask():
+    assert CandidateIndex(WORDS).pick(0) is None
+
+def test_bot_without_words_left():
+    bot = Bot(Lexicon(WORDS), rng=random.Random(0))
+    bot.candidates = bot.allowed = 0
+    with pytest.raises(NoGuessLeftError):
+        bot.make_guess()
+
+def test_game_ends_when_bot_has_no_word_left():
+    lexicon = Lexicon(WORDS)
+    bot = Bot(lexicon, rng=random.Random(0))
+    bot.make_guess = lambda: (_ for _ in ()).throw(NoGuessLeftError("No word left"))
+    metrics = Metrics()
+    engine = GameEngine(metrics=metrics, rng=random.Random(0))
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.play(bot, lexicon, "CRANE")
+    assert not engine.solved and not engine.err_guess
+    assert metrics.counters["engine.games_lost"] == 1
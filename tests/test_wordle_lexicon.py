@@ -0,0 +1,97 @@
+################################################
+# Title     : Wordle Lexicon Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the shared, deduplicated word list of the Bot and the GameEngine.
+#             Usage: python -m pytest tests/test_wordle_lexicon.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import gzip
+import io
+import random
+
+import pytest
+
+from wordle import Bot, GameEngine, Lexicon
+from wordle.lexicon import LexiconStore
+from wordle.wordle import candidate_index
+
+################################################
+# Function Definitions
+################################################
+def test_words_are_deduplicated_in_order():
+    lexicon = Lexicon(["crane", "SLATE", " Crane ", "", "slate", "TRACE"])
+    assert lexicon.words == ("CRANE", "SLATE", "TRACE")
+    assert len(lexicon) == 3 and list(lexicon) == list(lexicon.words) and lexicon[2] == "TRACE"
+    assert "SLATE" in lexicon and "slate" not in lexicon and "PLANT" not in lexicon
+    assert lexicon.index("TRACE") == 2
+    with pytest.raises(ValueError):
+        lexicon.index("PLANT")
+    assert bytes(lexicon.word_codes(1)) == bytes(ord(c) - ord("A") for c in "SLATE")
+
+def test_mixed_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        Lexicon(["CRANE", "CRANES"])
+
+def test_file_is_loaded_once(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("crane\nslate\ncrane\n")
+    first = Lexicon.load(str(path))
+    path.write_text("plant\n") # Not read again
+    assert Lexicon.load(str(path)) is first
+    assert Lexicon.coerce(first) is first and Lexicon.coerce(str(path)) is first
+    assert first.words == ("CRANE", "SLATE")
+
+def test_bot_and_engine_share_the_lexicon(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("CRANE\nSLATE\nTRACE\nPLANT\n")
+    lexicon = Lexicon.load(str(path))
+    bot = Bot(str(path), rng=random.Random(0))
+    assert bot.lexicon is lexicon
+    assert bot.index is candidate_index(lexicon) is Bot(lexicon).index
+    engine = GameEngine(rng=random.Random(0))
+    engine.play(bot, str(path), "PLANT")
+    assert engine.solved
+
+def test_gzip_file_partitioned_by_length(tmp_path):
+    path = tmp_path / "words.txt.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("cat\nDOG\ncrane\ncat\nplanet\nslate\nbird\n")
+    with pytest.raises(ValueError):
+        Lexicon.load(str(path)) # Several lengths and none given
+    assert Lexicon.load(str(path), word_length=3).words == ("CAT", "DOG")
+    assert Lexicon.load(str(path), word_length=5).words == ("CRANE", "SLATE")
+    assert LexiconStore.load(str(path)).partitions == {4: bytearray(b"BIRD"), 6: bytearray(b"PLANET")} # Not decoded yet
+    assert LexiconStore.load(str(path)).word_lengths() == [3, 4, 5, 6]
+    with pytest.raises(ValueError):
+        Lexicon.load(str(path), word_length=7)
+
+def test_lines_other_than_words_are_skipped(tmp_path):
+    path = tmp_path / "words.txt.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("crane\ncafés\nDON'T\nx-ray\n\nslate\nnaïve\n")
+    assert Lexicon.load(str(path)).words == ("CRANE", "SLATE")
+    assert LexiconStore.load(str(path)).skipped == [2, 3, 4, 7]
+    for word in ("CAFÉS", "DON'T", "X-RAY"):
+        with pytest.raises(ValueError, match="is not a word"):
+            Lexicon(["CRANE", word])
+
+@pytest.mark.parametrize("word_length", [3, 7])
+def test_games_of_other_lengths(word_length):
+    rng = random.Random(word_length)
+    words = sorted({"".join(rng.choice("ABCDEFGHIJKLMNOPRSTU") for _ in range(word_length)) for _ in range(300)})
+    lexicon = Lexicon(words)
+    bot = Bot(lexicon, rng=rng)
+    for target in words[:20]:
+        bot.new_game()
+        engine = GameEngine(rng=rng)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.play(bot, lexicon, target)
+        assert not engine.err_guess and not engine.err_input
+        assert engine.solved or len(engine.prev_guesses) == 6
@@ -0,0 +1,58 @@
+################################################
+# Title     : Wordle Metrics Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the per-move counters and histograms of the Bot and the GameEngine.
+#             Usage: python -m pytest tests/test_wordle_metrics.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import io
+import json
+import pickle
+import random
+
+from wordle import Bot, GameEngine, Lexicon, Metrics
+from wordle.lexicon import DEFAULT_WORDS_FILE
+
+################################################
+# Function Definitions
+################################################
+def test_summary_and_merge(tmp_path):
+    seen = []
+    metrics = Metrics(str(tmp_path / "metrics.json"), callback=lambda name, value: seen.append(name))
+    with metrics:
+        for value in range(1, 101):
+            metrics.observe("latency", value)
+        metrics.incr("games", 2)
+        other = pickle.loads(pickle.dumps(metrics)) # As sent back by a worker process
+        assert other.callback is None
+        metrics.merge(other)
+    summary = json.loads((tmp_path / "metrics.json").read_text())
+    assert summary["counters"] == {"games": 4}
+    latency = summary["histograms"]["latency"]
+    assert (latency["count"], latency["min"], latency["max"], latency["mean"]) == (200, 1, 100, 50.5)
+    assert latency["p50"] == 51 and latency["p99"] == 100
+    assert seen.count("latency") == 100 and seen.count("games") == 1
+
+def test_game_metrics():
+    lexicon = Lexicon.load(DEFAULT_WORDS_FILE)
+    metrics = Metrics()
+    bot = Bot(lexicon, metrics=metrics, rng=random.Random(0))
+    games = 10
+    with contextlib.redirect_stdout(io.StringIO()):
+        for target in lexicon.words[:games]:
+            bot.new_game()
+            GameEngine(metrics=metrics, rng=random.Random(0)).play(bot, lexicon, target)
+    summary = metrics.summary()
+    counters, histograms = summary["counters"], summary["histograms"]
+    assert counters.get("engine.games_won", 0) + counters.get("engine.games_lost", 0) == games
+    guesses = histograms["bot.guess_time_s"]["count"]
+    assert histograms["engine.move_time_s"]["count"] == guesses == histograms["bot.candidates"]["count"]
+    assert histograms["bot.candidates"]["max"] == len(lexicon) # The first guess of a game sees every word
+    assert histograms["bot.filter_time_s"]["count"] == histograms["bot.candidates_after_filter"]["count"]
@@ -0,0 +1,77 @@
+################################################
+# Title     : Wordle Opening Book Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks that the opening book plays the moves of the strategy it was built from.
+#             Usage: python -m pytest tests/test_wordle_opening_book.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import io
+import os
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from wordle import Bot, GameEngine, Lexicon
+from wordle.lexicon import DEFAULT_WORDS_FILE
+from wordle.opening_book import BookStrategy, OpeningBook, book_path
+from wordle.patterns import PatternMatrix
+from wordle.strategies import EntropyStrategy
+
+################################################
+# Function Definitions
+################################################
+@pytest.fixture(scope="module")
+def lexicon():
+    return Lexicon(random.Random(1).sample(Lexicon.load(DEFAULT_WORDS_FILE).words, 300))
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("book"))
+
+# Plays a game and returns the guesses of the bot
+def play(bot, lexicon, target):
+    bot.new_game()
+    engine = GameEngine(rng=random.Random(0))
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.play(bot, lexicon, target)
+    assert not engine.err_guess
+    return engine.prev_guesses
+
+def test_book_plays_like_its_strategy(lexicon, cache_dir):
+    book = OpeningBook.load(lexicon, cache_dir)
+    with EntropyStrategy(PatternMatrix.load(lexicon, cache_dir), workers=1) as strategy:
+        solver = Bot(lexicon, strategy=strategy)
+        booked = Bot(lexicon, strategy=BookStrategy(book))
+        for target in lexicon.words:
+            assert play(booked, lexicon, target) == play(solver, lexicon, target), target
+
+def test_book_file_is_reused_and_checked(lexicon, cache_dir):
+    OpeningBook.load(lexicon, cache_dir)
+    path = book_path(lexicon, cache_dir)
+    mtime = os.stat(path).st_mtime_ns
+    OpeningBook.load(lexicon, cache_dir)
+    assert os.stat(path).st_mtime_ns == mtime
+    with pytest.raises(ValueError):
+        OpeningBook(path, Lexicon(lexicon.words[1:]))
+
+def test_moves_outside_the_book_use_the_fallback(lexicon, cache_dir):
+    book = OpeningBook.load(lexicon, cache_dir)
+    bot = Bot(lexicon, strategy=BookStrategy(book), rng=random.Random(0))
+    # The game engine knows a target the bot does not, so the feedback leaves the book
+    target = next(word for word in Lexicon.load(DEFAULT_WORDS_FILE).words if word not in lexicon)
+    engine_lexicon = Lexicon(lexicon.words + (target,))
+    bot.new_game()
+    engine = GameEngine(rng=random.Random(0))
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.play(bot, engine_lexicon, target)
+    assert not engine.err_guess and not engine.solved
+    assert bot.strategy.node is None
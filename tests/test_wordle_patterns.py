@@ -0,0 +1,53 @@
+################################################
+# Title     : Wordle Pattern Matrix Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Checks the memory-mapped guess x target feedback matrix and its cache file.
+#             Usage: python -m pytest tests/test_wordle_patterns.py
+#
+# All Rights Reserved.
+################################################
+
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from wordle import feedback
+from wordle.lexicon import DEFAULT_WORDS_FILE, Lexicon
+from wordle.patterns import PatternMatrix, build_pattern_file, cache_path
+
+################################################
+# Function Definitions
+################################################
+@pytest.fixture(scope="module")
+def words():
+    return Lexicon(list(Lexicon.load(DEFAULT_WORDS_FILE).words[:300]) + ["EERIE", "GEESE", "LLAMA"])
+
+def test_matrix_matches_score(words, tmp_path):
+    matrix = PatternMatrix.load(words, str(tmp_path))
+    assert matrix.size == len(words) and matrix.word_length == 5
+    for i in range(0, len(words), 17):
+        assert matrix.row(i).tolist() == [feedback.score(words[i], target) for target in words]
+    assert matrix.pattern(len(words) - 3, len(words) - 2) == feedback.score("EERIE", "GEESE")
+
+def test_cache_file_is_reused(words, tmp_path):
+    PatternMatrix.load(words, str(tmp_path))
+    path = cache_path(words, str(tmp_path))
+    mtime = os.stat(path).st_mtime_ns
+    PatternMatrix.load(words, str(tmp_path))
+    assert os.stat(path).st_mtime_ns == mtime
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+def test_other_word_list_is_rejected(words, tmp_path):
+    path = str(tmp_path / "patterns.bin")
+    build_pattern_file(words, path)
+    with pytest.raises(ValueError):
+        PatternMatrix(path, Lexicon(words.words[1:] + words.words[:1]))
+    (tmp_path / "garbage.bin").write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        PatternMatrix(str(tmp_path / "garbage.bin"))
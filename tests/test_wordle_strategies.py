@@ -0,0 +1,76 @@
+################################################
+# Title     : Wordle Solver Strategy Tests
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays the entropy and minimax strategies against every word of a small word list.
+#             Usage: python -m pytest tests/test_wordle_strategies.py
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import io
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordle import Bot, GameEngine
+from wordle import strategies
+from wordle.lexicon import DEFAULT_WORDS_FILE, Lexicon
+from wordle.patterns import PatternMatrix
+from wordle.strategies import EntropyStrategy, MinimaxStrategy, entropy_scores, mask_to_indices, minimax_scores
+
+################################################
+# Function Definitions
+################################################
+@pytest.fixture(scope="module")
+def lexicon():
+    words = Lexicon.load(DEFAULT_WORDS_FILE).words
+    return Lexicon(random.Random(0).sample(words, 400))
+
+@pytest.fixture(scope="module")
+def matrix(lexicon, tmp_path_factory):
+    return PatternMatrix.load(lexicon, str(tmp_path_factory.mktemp("patterns")))
+
+def test_mask_to_indices():
+    assert mask_to_indices(0, 10).tolist() == []
+    assert mask_to_indices(0b1000000101, 10).tolist() == [0, 2, 9]
+    assert mask_to_indices(1 << 99, 100).tolist() == [99]
+
+def test_scores():
+    counts = np.array([[4, 0, 0, 0], [1, 1, 1, 1], [2, 2, 0, 0]])
+    assert entropy_scores(counts).tolist() == [0.0, 2.0, 1.0]
+    assert minimax_scores(counts).tolist() == [-4.0, -1.0, -2.0]
+
+@pytest.mark.parametrize("strategy_class", [EntropyStrategy, MinimaxStrategy])
+def test_solves_every_target(lexicon, matrix, strategy_class):
+    with strategy_class(matrix, workers=1) as strategy:
+        bot = Bot(lexicon, strategy=strategy, rng=random.Random(0))
+        for target in lexicon.words:
+            bot.new_game()
+            engine = GameEngine(rng=random.Random(0))
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine.play(bot, lexicon, target)
+            assert engine.solved and not engine.err_guess, target
+
+def test_pool_scores_match_in_process(lexicon, matrix, monkeypatch):
+    guesses = np.arange(len(lexicon))
+    candidates = np.arange(0, len(lexicon), 3)
+    with EntropyStrategy(matrix, workers=1) as strategy:
+        expected = strategy.score(guesses, candidates)
+    monkeypatch.setattr(strategies, "POOL_THRESHOLD", 0)
+    with EntropyStrategy(matrix, workers=2) as strategy:
+        assert strategy.score(guesses, candidates).tolist() == expected.tolist()
+
+def test_opening_guess_is_cached(lexicon, matrix):
+    with MinimaxStrategy(matrix, workers=1) as strategy:
+        index = Bot(lexicon, strategy=strategy).index
+        first = strategy.choose(index, index.all_words, index.all_words)
+        assert strategy._opening == first
+        assert strategy.choose(index, index.all_words, index.all_words) == first
+        assert strategy.choose(index, 0, 0) is None
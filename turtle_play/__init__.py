@@ -0,0 +1,15 @@
+################################################
+# Title     : Draw and Play with Turtle
+# Author    : balarcode
+# File Type : Python Package
+# Comments  : Importing the package does not open a Tk screen; the turtle module is only imported by main().
+#             Play the scenes with: python -m turtle_play [--batched] [--fps FPS]
+#             Render the scenes without a display with: python -m turtle_play.headless
+#             Export the animations as GIF or PNG sequences with: python -m turtle_play.export
+#
+# All Rights Reserved.
+################################################
+
+from .geometry import arithmetic_spiral, regular_polygon, stamp_at, stamp_ring, trace, walk
+from .timeline import Timeline, Track
+from .turtle_play import ACTS, SCENES, coil, draw, main, pentagon, slow_hexagon, spiral, stamp_circle, stamped_hexagon
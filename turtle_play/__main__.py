@@ -0,0 +1,3 @@
+from .turtle_play import main
+
+main()
@@ -0,0 +1,281 @@
+################################################
+# Title     : Turtle Animation Export
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Exports the animations of the turtle_play scenes as a numbered PNG sequence or an animated GIF, without Tk.
+#             1) A scene plays on a headless Drawing (see headless.py) with a clock of its own: frame i is the picture
+#                after the steps due at i / fps seconds (the steps per second of the scene in ACTS), so an export is the
+#                same on every run and takes as long as the drawing does, not as long as the animation.
+#             2) Frames are streamed: the items of a frame are drawn onto a persistent Raster and then dropped, the
+#                turtles are drawn on a copy of it, and the frame is written before the next one is stepped. Memory
+#                does not grow with the length of the animation.
+#             3) A PNG sequence writes <scene>_00000.png, ... one file per frame (an unchanged frame reuses the bytes of
+#                the previous one).
+#             4) The GIF is written frame by frame: only the rectangle that changed since the previous frame is LZW
+#                encoded, and unchanged frames extend the delay of the previous one.
+#             Usage: python -m turtle_play.export [--format gif|png] [--output DIR] [--scenes slow_hexagon,spiral] [--fps N]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import json
+import os
+import struct
+import time
+
+from .headless import COLORS, DEFAULT_HEIGHT, DEFAULT_WIDTH, Drawing, Raster, encode_png, parse_color
+from .timeline import DEFAULT_FPS, Track
+from .turtle_play import ACTS, HOLD, SCENES
+
+MAX_CODE_BITS = 12 # Longest LZW code of a GIF
+
+################################################
+# Function Definitions
+################################################
+# Returns the palette of the GIF files
+def build_palette(extra=()) -> list[tuple]:
+    """Return the named colors and extra colors as a list of (r, g, b), padded to a power of two (at least 4)."""
+    palette = []
+    for color in list(COLORS.values()) + [parse_color(color) for color in extra]:
+        if color not in palette:
+            palette.append(color)
+    size = 4
+    while size < len(palette):
+        size *= 2
+    if size > 256:
+        raise ValueError(f"{len(palette)} colors do not fit a GIF palette")
+    return palette + [(0, 0, 0)] * (size - len(palette))
+
+# Maps an RGB image to palette indices
+def quantize(image, palette: list[tuple]):
+    """Return the palette index of every pixel of an RGB image (the nearest color for colors not in the palette)."""
+    import numpy as np
+    colors = np.array(palette, dtype=np.int64)
+    packed_palette = colors[:, 0] << 16 | colors[:, 1] << 8 | colors[:, 2]
+    order = np.argsort(packed_palette, kind="stable")
+    packed = image[..., 0].astype(np.int64) << 16 | image[..., 1].astype(np.int64) << 8 | image[..., 2]
+    found = np.searchsorted(packed_palette[order], packed).clip(0, len(order) - 1)
+    indices = order[found]
+    missing = packed_palette[indices] != packed
+    if missing.any():
+        pixels = image[missing].astype(np.int64)
+        indices[missing] = ((pixels[:, None, :] - colors[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+    return indices.astype(np.uint8)
+
+# Compresses palette indices for a GIF image
+def lzw_encode(data: bytes, min_code_size: int) -> bytes:
+    """Return the GIF LZW code stream of a sequence of palette indices (variable-length codes, packed LSB first)."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    code_size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+    bits, nbits = clear, code_size
+    prefix = data[0]
+    for pixel in memoryview(data)[1:]:
+        key = prefix << 8 | pixel
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << nbits
+        nbits += code_size
+        while nbits >= 8:
+            out.append(bits & 255)
+            bits >>= 8
+            nbits -= 8
+        if next_code >= 1 << code_size and code_size < MAX_CODE_BITS:
+            code_size += 1
+        if next_code < 1 << MAX_CODE_BITS:
+            table[key] = next_code
+            next_code += 1
+        else: # The table is full: start a new one
+            bits |= clear << nbits
+            nbits += code_size
+            table.clear()
+            next_code = end + 1
+            code_size = min_code_size + 1
+        prefix = pixel
+    bits |= prefix << nbits
+    nbits += code_size
+    if next_code >= 1 << code_size and code_size < MAX_CODE_BITS:
+        code_size += 1
+    bits |= end << nbits
+    nbits += code_size
+    while nbits > 0:
+        out.append(bits & 255)
+        bits >>= 8
+        nbits -= 8
+    return bytes(out)
+
+################################################
+# Class Definitions
+################################################
+# Class to write an animated GIF frame by frame
+class GifWriter:
+    """Animated GIF file written as frames arrive; holds the previous frame and the one waiting for its delay."""
+    def __init__(self, file, width: int, height: int, palette: list[tuple], loop: int = 0) -> None:
+        import numpy as np
+        self.file = file
+        self.width, self.height = width, height
+        self.palette = palette
+        self.min_code_size = max((len(palette) - 1).bit_length(), 2)
+        self.previous = np.zeros((height, width), dtype=np.uint8)
+        self.pending = None # (left, top, indices) of the last frame that changed
+        self.pending_time = 0.0 # Seconds shown so far by the pending frame
+        self.shown = 0 # Centiseconds of the frames written
+        self.elapsed = 0.0 # Seconds of all the frames added
+        self.frames = 0
+        self.written = 0
+        table_bits = (len(palette) - 1).bit_length() - 1
+        file.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF0 | table_bits, 0, 0))
+        file.write(bytes(c for color in palette for c in color))
+        # Repeat loop times (0: forever)
+        file.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def add(self, indices, duration: float) -> None:
+        """Add a frame of palette indices (height x width) shown for duration seconds."""
+        import numpy as np
+        self.frames += 1
+        changed = indices != self.previous
+        if self.pending is None or changed.any():
+            rows, cols = np.nonzero(changed.any(axis=1))[0], np.nonzero(changed.any(axis=0))[0]
+            if self.pending is not None:
+                self._flush()
+                top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+            else: # The first frame covers the whole screen
+                top, bottom, left, right = 0, self.height, 0, self.width
+            self.pending = (int(left), int(top), indices[top:bottom, left:right].copy())
+            self.previous[top:bottom, left:right] = indices[top:bottom, left:right]
+        self.pending_time += duration
+
+    def hold(self, duration: float) -> None:
+        """Show the last frame duration seconds longer (same as adding it again)."""
+        self.frames += 1
+        self.pending_time += duration
+
+    def _flush(self) -> None:
+        left, top, block = self.pending
+        self.elapsed += self.pending_time
+        delay = round(self.elapsed * 100) - self.shown # Rounded on the total time, so delays do not drift
+        self.shown += delay
+        self.pending_time = 0.0
+        height, width = block.shape
+        # Graphic control extension: leave the frame in place, delay in centiseconds
+        self.file.write(b"\x21\xF9\x04\x04" + struct.pack("<H", min(delay, 0xFFFF)) + b"\x00\x00")
+        self.file.write(b"\x2C" + struct.pack("<HHHHB", left, top, width, height, 0) + bytes([self.min_code_size]))
+        data = lzw_encode(block.tobytes(), self.min_code_size)
+        for start in range(0, len(data), 255):
+            chunk = data[start:start + 255]
+            self.file.write(bytes([len(chunk)]) + chunk)
+        self.file.write(b"\x00")
+        self.written += 1
+
+    def close(self) -> None:
+        """Write the last frame and the trailer."""
+        if self.pending is not None:
+            self._flush()
+            self.pending = None
+        self.file.write(b"\x3B")
+
+################################################
+# Function Definitions
+################################################
+# Steps a scene frame by frame
+def frames(scene, fps: float = DEFAULT_FPS, rate: float = None, width: int = DEFAULT_WIDTH,
+           height: int = DEFAULT_HEIGHT, scale: float = 1.0):
+    """Yield (RGB image, changed) for every frame of a scene played at rate steps per second (None: in one frame).
+
+    changed is False when no step was taken since the previous frame (the image is the same). The same array is
+    reused for every frame, so it must be consumed before the next one is asked for.
+    """
+    drawing = Drawing() # Tracing stays on, so the figures are recorded step by step
+    track = Track(scene(drawing), rate)
+    base = Raster(width, height, scale=scale)
+    frame = Raster(width, height, scale=scale)
+    number = 0
+    while not track.done:
+        taken = track.taken
+        track.advance(number / fps)
+        number += 1
+        if number > 1 and track.taken == taken and not track.done:
+            yield frame.image, False
+            continue
+        base.draw(drawing.items)
+        drawing.items.clear()
+        drawing.commands.clear()
+        frame.image[:] = base.image
+        frame.draw(drawing.turtle_items())
+        yield frame.image, True
+
+# Exports a scene
+def export_scene(name: str, output: str, image_format: str = "gif", fps: float = DEFAULT_FPS, rate: float = None,
+                 hold: float = HOLD / 1000, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT,
+                 scale: float = 1.0) -> dict:
+    """Write the animation of a scene to output as <name>.gif or <name>_NNNNN.png files and return a summary.
+
+    rate defaults to the steps per second of the scene in ACTS; the last frame is shown for hold more seconds.
+    """
+    if rate is None:
+        rate = next(act[name] for act in ACTS if name in act)
+    count = 0
+    start = time.perf_counter()
+    if image_format == "gif":
+        path = os.path.join(output, f"{name}.gif")
+        palette = build_palette()
+        with open(path, "wb") as f:
+            writer = GifWriter(f, width, height, palette)
+            for image, changed in frames(SCENES[name], fps, rate, width, height, scale):
+                if changed:
+                    writer.add(quantize(image, palette), 1 / fps)
+                else:
+                    writer.hold(1 / fps)
+                count += 1
+            writer.hold(hold)
+            writer.close()
+        files, written, size = [path], writer.written, os.path.getsize(path)
+    else:
+        files, written, size, data = [], 0, 0, None
+        for image, changed in frames(SCENES[name], fps, rate, width, height, scale):
+            if changed:
+                data = encode_png(image)
+                written += 1
+            path = os.path.join(output, f"{name}_{count:05d}.png")
+            with open(path, "wb") as f:
+                f.write(data)
+            files[1:] = [path] # First and last file
+            size += len(data)
+            count += 1
+    elapsed = time.perf_counter() - start
+    duration = count / fps
+    return {"scene": name, "files": files, "frames": count, "frames_encoded": written, "bytes": size,
+            "animation_s": duration, "elapsed_s": elapsed, "speedup": duration / elapsed if elapsed else 0.0}
+
+################################################
+# Export Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the turtle_play animations as an animated GIF or a PNG sequence.")
+    parser.add_argument("--format", choices=["gif", "png"], default="gif")
+    parser.add_argument("--output", default=".", help="Directory to write the files to")
+    parser.add_argument("--scenes", default=",".join(SCENES), help="Comma separated scene names")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS, help="Frames per second")
+    parser.add_argument("--rate", type=float, default=None, help="Steps per second (default: the rate of the scene in ACTS)")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH)
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument("--scale", type=float, default=1.0, help="Pixels per turtle step")
+    args = parser.parse_args()
+
+    names = args.scenes.split(",")
+    unknown = [name for name in names if name not in SCENES]
+    if unknown:
+        parser.error(f"unknown scenes {', '.join(unknown)} (choose from {', '.join(SCENES)})")
+    os.makedirs(args.output, exist_ok=True)
+    summaries = [export_scene(name, args.output, args.format, args.fps, args.rate, width=args.width,
+                              height=args.height, scale=args.scale) for name in names]
+    print(json.dumps(summaries, indent=2))
@@ -0,0 +1,113 @@
+################################################
+# Title     : Turtle Geometry Generators
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Computes the vertices of the turtle_play figures at once with NumPy instead of one forward()/left() at a time.
+#             1) A walk is count steps of a turtle: step i moves forward distance + i * increment and then turns left by
+#                angle degrees. Regular polygons (constant step) and arithmetic spirals (growing step) are walks; a stamp
+#                ring is count headings around a center. Headings are cumulative sums and positions cumulative sums of
+#                the step vectors, so a figure of any size is a handful of array operations.
+#             2) Figures are cached by their parameters (functools.lru_cache) and returned as read-only arrays.
+#             3) trace() and stamp_at() send a figure to a screen one step at a time (they are generators, so scenes
+#                can be played frame by frame); under tracer(0) a headless Drawing (see headless.py) records a whole
+#                figure in one step, as a single polyline item or one batch of stamps.
+#
+# All Rights Reserved.
+################################################
+
+import functools
+
+import numpy as np
+
+################################################
+# Function Definitions
+################################################
+# Returns a read-only array
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+# Computes the vertices and headings of a turtle walk
+@functools.lru_cache(maxsize=256)
+def walk(count: int, distance: float, increment: float, angle: float, heading: float = 0.0,
+         x: float = 0.0, y: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Return the count + 1 vertices of a walk from (x, y) and the heading of the turtle on each of them.
+
+    Step i moves forward by distance + i * increment from vertex i, then the turtle turns left by angle degrees (right if
+    negative), so its heading on vertex i is heading + i * angle.
+    """
+    headings = heading + angle * np.arange(count + 1)
+    steps = distance + increment * np.arange(count)
+    radians = np.radians(headings[:-1])
+    vertices = np.empty((count + 1, 2))
+    vertices[0] = (x, y)
+    vertices[1:, 0] = x + np.cumsum(steps * np.cos(radians))
+    vertices[1:, 1] = y + np.cumsum(steps * np.sin(radians))
+    return _frozen(vertices), _frozen(headings % 360)
+
+# Computes a regular polygon
+def regular_polygon(sides: int, side: float, laps: int = 1, heading: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Return the vertices and headings of a regular polygon walked laps times from the origin, turning left."""
+    return walk(sides * laps, side, 0.0, 360 / sides, heading)
+
+# Computes an arithmetic spiral
+def arithmetic_spiral(count: int, distance: float, increment: float, angle: float,
+                      heading: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Return the vertices and headings of count steps growing by increment, turning right by angle after each."""
+    return walk(count, distance, increment, -angle, heading)
+
+# Computes the stamps of a ring
+@functools.lru_cache(maxsize=256)
+def stamp_ring(count: int, radius: float, angle: float, heading: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Return the positions and headings of count stamps radius away from the origin, turning right by angle."""
+    headings = heading - angle * np.arange(count)
+    radians = np.radians(headings)
+    positions = np.column_stack([radius * np.cos(radians), radius * np.sin(radians)])
+    return _frozen(positions), _frozen(headings % 360)
+
+# Draws a figure with a turtle, one step at a time
+def trace(screen, turtle, vertices: np.ndarray, headings: np.ndarray = None, stamps: bool = False):
+    """Move a turtle through vertices (it starts on the first one), stamping on every vertex if stamps is set.
+
+    A generator that yields after every step, so a scene can be played frame by frame (see timeline.py). With
+    headings (one per vertex, as returned by walk()) the turtle faces headings[i] on its way from vertex i and ends
+    facing headings[-1]. With screen.tracer() == 0 a headless Drawing records the whole figure in one step, as a
+    single polyline item.
+    """
+    if screen.tracer() == 0 and hasattr(turtle, "polyline"):
+        turtle.polyline(vertices, headings, stamps)
+        yield
+        return
+    if stamps:
+        turtle.stamp()
+    for i, (x, y) in enumerate(vertices[1:].tolist()):
+        if headings is not None:
+            turtle.setheading(float(headings[i]))
+        turtle.goto(x, y)
+        if stamps:
+            turtle.stamp()
+        yield
+    if headings is not None:
+        turtle.setheading(float(headings[-1]))
+
+# Stamps a figure with a turtle, one stamp at a time
+def stamp_at(screen, turtle, positions: np.ndarray, headings: np.ndarray, home: bool = False):
+    """Stamp the turtle shape at every position with the matching heading, yielding after every stamp.
+
+    If home is set the turtle returns to the origin after every stamp (as the stamp circle does). With
+    screen.tracer() == 0 a headless Drawing records all the stamps in one step.
+    """
+    if screen.tracer() == 0 and hasattr(turtle, "stamps"):
+        turtle.stamps(positions, headings, home)
+        yield
+        return
+    for (x, y), heading in zip(positions.tolist(), headings.tolist()):
+        turtle.setheading(heading)
+        turtle.goto(x, y)
+        turtle.stamp()
+        if home:
+            turtle.goto(0, 0)
+        yield
@@ -0,0 +1,522 @@
+################################################
+# Title     : Headless Turtle Rendering
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Renders the turtle_play scenes offscreen to PNG or SVG, without Tk or an X server.
+#             1) A Drawing stands in for the turtle screen: its turtles record every command of a scene (forward, left,
+#                right, stamp, penup, color, ...) and the lines and stamps it leaves, in drawing order. Pauses and
+#                animation speed are recorded but take no time.
+#             2) Coordinates, headings, default colors and the shape polygons follow the turtle module, so a scene draws
+#                the same picture as on the Tk canvas (origin in the center, y up, shapes not resized).
+#             3) PNG rasterization uses NumPy: all the pixels of all the lines are computed at once, and a stamp is
+#                filled with one even-odd test of its bounding box. The PNG file is written with zlib only.
+#             4) SVG output joins contiguous lines of the same color and width into polylines.
+#             5) Under tracer(0) the figures of geometry.py are recorded in bulk: a whole figure is one polyline item
+#                (drawn as one array of segments) and a ring of stamps is placed with one array operation. Scenes are
+#                recorded that way unless --animated is given.
+#             Usage: python -m turtle_play.headless [--format png|svg] [--output DIR] [--scenes pentagon,spiral] [--repeat N]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import json
+import math
+import os
+import struct
+import time
+import zlib
+
+from .turtle_play import SCENES, draw
+
+# Shape polygons of the turtle module, pointing along +y
+SHAPES = {
+    "arrow": ((-10, 0), (10, 0), (0, 10)),
+    "turtle": ((0, 16), (-2, 14), (-1, 10), (-4, 7), (-7, 9), (-9, 8), (-6, 5), (-7, 1), (-5, -3), (-8, -6),
+               (-6, -8), (-4, -5), (0, -7), (4, -5), (6, -8), (8, -6), (5, -3), (7, 1), (6, 5), (9, 8), (7, 9),
+               (4, 7), (1, 10), (2, 14)),
+    "circle": tuple((round(10 * math.cos(math.radians(18 * i)), 2), round(10 * math.sin(math.radians(18 * i)), 2))
+                    for i in range(20)),
+    "square": ((10, -10), (10, 10), (-10, 10), (-10, -10)),
+    "triangle": ((10, -5.77), (0, 11.55), (-10, -5.77)),
+    "classic": ((0, 0), (-5, -9), (0, -7), (5, -9)),
+}
+
+# Tk color names used by the scenes and other common ones, as RGB
+COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "red": (255, 0, 0), "green": (0, 255, 0), "blue": (0, 0, 255),
+    "yellow": (255, 255, 0), "cyan": (0, 255, 255), "magenta": (255, 0, 255), "orange": (255, 165, 0),
+    "purple": (160, 32, 240), "brown": (165, 42, 42), "pink": (255, 192, 203), "gray": (190, 190, 190),
+    "grey": (190, 190, 190), "violet": (238, 130, 238), "gold": (255, 215, 0), "navy": (0, 0, 128),
+}
+
+DEFAULT_WIDTH = 640
+DEFAULT_HEIGHT = 480
+
+################################################
+# Function Definitions
+################################################
+# Converts a turtle color to RGB
+def parse_color(color) -> tuple:
+    """Return the (r, g, b) bytes of a color name, a '#rrggbb' string or an (r, g, b) tuple of floats in [0, 1]."""
+    if isinstance(color, str):
+        name = color.strip().lower()
+        if name in COLORS:
+            return COLORS[name]
+        if name.startswith("#") and len(name) == 7:
+            return tuple(int(name[i:i + 2], 16) for i in (1, 3, 5))
+        raise ValueError(f"Unknown color {color!r}")
+    r, g, b = color
+    if not all(0 <= c <= 1 for c in (r, g, b)):
+        raise ValueError(f"Color components of {color!r} must be between 0 and 1 (colormode 1.0)")
+    return tuple(round(c * 255) for c in (r, g, b))
+
+# Places a shape polygon at a turtle position and heading
+def shape_polygon(shape: str, x: float, y: float, heading: float) -> list[tuple[float, float]]:
+    """Return the polygon of a shape drawn by a turtle at (x, y) facing heading degrees, as the turtle module does."""
+    e0, e1 = math.cos(math.radians(heading)), math.sin(math.radians(heading))
+    return [(x + e1 * px + e0 * py, y - e0 * px + e1 * py) for px, py in SHAPES[shape]]
+
+# Places a shape polygon at many turtle positions and headings
+def shape_polygons(shape: str, positions, headings):
+    """Return the polygons of a shape stamped at n positions facing n headings, as an n x corners x 2 array."""
+    import numpy as np
+    shape_points = np.array(SHAPES[shape], dtype=np.float64)
+    radians = np.radians(np.asarray(headings, dtype=np.float64))
+    e0, e1 = np.cos(radians)[:, None], np.sin(radians)[:, None]
+    positions = np.asarray(positions, dtype=np.float64)
+    px, py = shape_points[:, 0], shape_points[:, 1]
+    return np.stack([positions[:, :1] + e1 * px + e0 * py, positions[:, 1:] - e0 * px + e1 * py], axis=2)
+
+################################################
+# Class Definitions
+################################################
+# Class to record the commands and the drawing of a turtle
+class RecordingTurtle:
+    """Turtle with the drawing methods of turtle.Turtle that records into a Drawing instead of a Tk canvas."""
+    def __init__(self, drawing: "Drawing") -> None:
+        self.drawing = drawing
+        self.id = len(drawing.turtles)
+        self.x, self.y = 0.0, 0.0
+        self._heading = 0.0
+        self.pen_down = True
+        self.pen_color = COLORS["black"]
+        self.fill_color = COLORS["black"]
+        self.pen_size = 1
+        self.shape_name = "classic"
+        self.visible = True
+        self.animation_speed = 3
+
+    def _record(self, name: str, *args) -> None:
+        self.drawing.commands.append((self.id, name, args))
+
+    def _move_to(self, x: float, y: float) -> None:
+        if self.pen_down:
+            self.drawing.items.append(("line", self.x, self.y, x, y, self.pen_color, self.pen_size))
+        self.x, self.y = x, y
+
+    def forward(self, distance: float) -> None:
+        self._record("forward", distance)
+        angle = math.radians(self._heading)
+        self._move_to(self.x + distance * math.cos(angle), self.y + distance * math.sin(angle))
+    fd = forward
+
+    def backward(self, distance: float) -> None:
+        self.forward(-distance)
+    bk = back = backward
+
+    def left(self, angle: float) -> None:
+        self._record("left", angle)
+        self._heading = (self._heading + angle) % 360
+    lt = left
+
+    def right(self, angle: float) -> None:
+        self.left(-angle)
+    rt = right
+
+    def goto(self, x, y=None) -> None:
+        if y is None:
+            x, y = x
+        self._record("goto", x, y)
+        self._move_to(float(x), float(y))
+    setpos = setposition = goto
+
+    def home(self) -> None:
+        self.goto(0, 0)
+        self.setheading(0)
+
+    def setheading(self, angle: float) -> None:
+        self._record("setheading", angle)
+        self._heading = angle % 360
+    seth = setheading
+
+    def heading(self) -> float:
+        return self._heading
+
+    def position(self) -> tuple[float, float]:
+        return (self.x, self.y)
+    pos = position
+
+    def xcor(self) -> float:
+        return self.x
+
+    def ycor(self) -> float:
+        return self.y
+
+    def penup(self) -> None:
+        self._record("penup")
+        self.pen_down = False
+    pu = up = penup
+
+    def pendown(self) -> None:
+        self._record("pendown")
+        self.pen_down = True
+    pd = down = pendown
+
+    def isdown(self) -> bool:
+        return self.pen_down
+
+    def pensize(self, width: float = None):
+        if width is None:
+            return self.pen_size
+        self._record("pensize", width)
+        self.pen_size = width
+    width = pensize
+
+    def color(self, *args):
+        """color(c) sets the pen and fill colors, color(pen, fill) sets them separately."""
+        if not args:
+            return self.pen_color, self.fill_color
+        self._record("color", *args)
+        if len(args) == 1:
+            self.pen_color = self.fill_color = parse_color(args[0])
+        elif len(args) == 2:
+            self.pen_color, self.fill_color = parse_color(args[0]), parse_color(args[1])
+        else: # Three components of one color
+            self.pen_color = self.fill_color = parse_color(args)
+
+    def pencolor(self, color) -> None:
+        self._record("pencolor", color)
+        self.pen_color = parse_color(color)
+
+    def fillcolor(self, color) -> None:
+        self._record("fillcolor", color)
+        self.fill_color = parse_color(color)
+
+    def shape(self, name: str = None):
+        if name is None:
+            return self.shape_name
+        if name not in SHAPES:
+            raise ValueError(f"There is no shape named {name}")
+        self._record("shape", name)
+        self.shape_name = name
+
+    def speed(self, speed: int = None):
+        if speed is None:
+            return self.animation_speed
+        self._record("speed", speed)
+        self.animation_speed = speed
+
+    def stamp(self) -> None:
+        self._record("stamp")
+        self.drawing.items.append(("poly", shape_polygon(self.shape_name, self.x, self.y, self._heading),
+                                   self.fill_color, self.pen_color))
+
+    def polyline(self, vertices, headings=None, stamps: bool = False) -> None:
+        """Move through an n x 2 array of vertices at once, as geometry.trace() does with tracing on.
+
+        The line is one ("polyline", vertices, color, width) item; stamps are added after it.
+        """
+        import numpy as np
+        self._record("polyline", vertices, headings, stamps)
+        if self.pen_down:
+            self.drawing.items.append(("polyline", vertices, self.pen_color, self.pen_size))
+        if stamps:
+            if headings is None:
+                stamp_headings = np.full(len(vertices), self._heading)
+            else:
+                stamp_headings = np.concatenate([[self._heading], headings[:-1]])
+            self._add_stamps(vertices, stamp_headings)
+        self.x, self.y = float(vertices[-1, 0]), float(vertices[-1, 1])
+        if headings is not None:
+            self._heading = float(headings[-1]) % 360
+
+    def stamps(self, positions, headings, home: bool = False) -> None:
+        """Stamp at an n x 2 array of positions facing n headings, as geometry.stamp_at() does with tracing on."""
+        self._record("stamps", positions, headings, home)
+        if self.pen_down: # The turtle draws its way to every stamp
+            for x, y in positions.tolist():
+                self._move_to(x, y)
+                if home:
+                    self._move_to(0.0, 0.0)
+        self._add_stamps(positions, headings)
+        if not home:
+            self.x, self.y = float(positions[-1, 0]), float(positions[-1, 1])
+        self._heading = float(headings[-1]) % 360
+
+    def _add_stamps(self, positions, headings) -> None:
+        for polygon in shape_polygons(self.shape_name, positions, headings):
+            self.drawing.items.append(("poly", polygon, self.fill_color, self.pen_color))
+
+    def hideturtle(self) -> None:
+        self._record("hideturtle")
+        self.visible = False
+    ht = hideturtle
+
+    def showturtle(self) -> None:
+        self._record("showturtle")
+        self.visible = True
+    st = showturtle
+
+    def isvisible(self) -> bool:
+        return self.visible
+
+# Class to stand in for the turtle screen
+class Drawing:
+    """Screen of RecordingTurtles: the commands they ran and the lines and stamps they left, in order.
+
+    items holds ("line", x0, y0, x1, y1, color, width), ("polyline", vertices, color, width) and
+    ("poly", points, fill, outline) entries in turtle coordinates; commands holds (turtle id, command, arguments)
+    entries. tracer() and update() behave as on the turtle screen, without drawing anything.
+    """
+    def __init__(self) -> None:
+        self.turtles: list[RecordingTurtle] = []
+        self.items: list[tuple] = []
+        self.commands: list[tuple] = []
+        self.titles: list[str] = []
+        self.tracing = 1
+        self.updates = 0 # Screen updates the scenes asked for
+
+    def Turtle(self) -> RecordingTurtle:
+        turtle = RecordingTurtle(self)
+        self.turtles.append(turtle)
+        return turtle
+
+    def title(self, text: str) -> None:
+        self.titles.append(text)
+
+    def tracer(self, n: int = None, delay: int = None):
+        if n is None:
+            return self.tracing
+        self.tracing = int(n)
+        if self.tracing:
+            self.update()
+
+    def update(self) -> None:
+        self.updates += 1
+
+    def turtle_items(self) -> list[tuple]:
+        """Return the polygons of the visible turtles, drawn on top of the items."""
+        return [("poly", shape_polygon(t.shape_name, t.x, t.y, t._heading), t.fill_color, t.pen_color)
+                for t in self.turtles if t.visible]
+
+# Class to rasterize drawing items
+class Raster:
+    """RGB image of turtle drawing items; items can be added in several calls (e.g. one per frame)."""
+    def __init__(self, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT, background: str = "white",
+                 scale: float = 1.0) -> None:
+        import numpy as np
+        self.width, self.height, self.scale = width, height, scale
+        self.image = np.empty((height, width, 3), dtype=np.uint8)
+        self.image[:] = parse_color(background)
+
+    def _pixels(self, x, y):
+        """Return the pixel columns and rows of turtle coordinates."""
+        return self.width / 2 + x * self.scale, self.height / 2 - y * self.scale
+
+    def draw(self, items) -> None:
+        """Draw items over the image, keeping runs of lines together."""
+        lines = []
+        for item in items:
+            if item[0] == "line":
+                lines.append(item)
+                continue
+            if lines:
+                self.draw_lines(lines)
+                lines = []
+            if item[0] == "polyline":
+                self.draw_polyline(*item[1:])
+            else:
+                self.fill_polygon(*item[1:])
+        if lines:
+            self.draw_lines(lines)
+
+    def draw_lines(self, lines) -> None:
+        """Draw ("line", x0, y0, x1, y1, color, width) items; all their pixels are set in one assignment."""
+        import numpy as np
+        data = np.array([line[1:5] for line in lines], dtype=np.float64)
+        colors = np.array([line[5] for line in lines], dtype=np.uint8)
+        widths = np.array([line[6] for line in lines], dtype=np.float64)
+        self.draw_segments(data[:, :2], data[:, 2:], colors, widths)
+
+    def draw_polyline(self, vertices, color, width) -> None:
+        """Draw the lines joining an n x 2 array of vertices in one color and width."""
+        import numpy as np
+        count = len(vertices) - 1
+        if count > 0:
+            self.draw_segments(vertices[:-1], vertices[1:], np.tile(np.array(color, dtype=np.uint8), (count, 1)),
+                               np.full(count, width, dtype=np.float64))
+
+    def draw_segments(self, starts, ends, colors, widths) -> None:
+        """Draw the n lines from the n x 2 arrays starts to ends, with n x 3 colors and n widths."""
+        import numpy as np
+        widths = widths * self.scale
+        x0, y0 = self._pixels(starts[:, 0], starts[:, 1])
+        x1, y1 = self._pixels(ends[:, 0], ends[:, 1])
+        # Sample every line twice per pixel of its length
+        samples = np.ceil(np.hypot(x1 - x0, y1 - y0) * 2).astype(np.int64) + 1
+        line = np.repeat(np.arange(len(starts)), samples)
+        starts = np.cumsum(samples) - samples
+        t = (np.arange(line.size) - starts[line]) / np.maximum(samples[line] - 1, 1)
+        px = x0[line] + t * (x1 - x0)[line]
+        py = y0[line] + t * (y1 - y0)[line]
+        # Thick lines are the union of discs along the line
+        if widths.max() > 1:
+            radius = int(np.ceil(widths.max() / 2))
+            offsets = [(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)]
+            dx = np.array([o[0] for o in offsets], dtype=np.float64)
+            dy = np.array([o[1] for o in offsets], dtype=np.float64)
+            inside = (dx[None, :] ** 2 + dy[None, :] ** 2) <= np.maximum(widths[line] / 2, 0.5)[:, None] ** 2
+            rows, cols = np.nonzero(inside)
+            px, py, line = px[rows] + dx[cols], py[rows] + dy[cols], line[rows]
+        self._set(px, py, colors[line])
+
+    def _set(self, px, py, colors) -> None:
+        import numpy as np
+        cols = np.floor(px).astype(np.int64)
+        rows = np.floor(py).astype(np.int64)
+        keep = (cols >= 0) & (cols < self.width) & (rows >= 0) & (rows < self.height)
+        self.image[rows[keep], cols[keep]] = colors[keep]
+
+    def fill_polygon(self, points, fill, outline) -> None:
+        """Fill a polygon with the even-odd rule and draw its outline one pixel wide."""
+        import numpy as np
+        poly = np.array(points, dtype=np.float64)
+        px, py = self._pixels(poly[:, 0], poly[:, 1])
+        left, right = max(int(np.floor(px.min())), 0), min(int(np.ceil(px.max())), self.width - 1)
+        top, bottom = max(int(np.floor(py.min())), 0), min(int(np.ceil(py.max())), self.height - 1)
+        if left <= right and top <= bottom:
+            gx, gy = np.meshgrid(np.arange(left, right + 1) + 0.5, np.arange(top, bottom + 1) + 0.5)
+            ax, ay = px[:, None, None], py[:, None, None]
+            bx, by = np.roll(px, -1)[:, None, None], np.roll(py, -1)[:, None, None]
+            crosses = ((ay > gy) != (by > gy)) & (gx < ax + (gy - ay) * (bx - ax) / np.where(by == ay, 1, by - ay))
+            inside = np.logical_xor.reduce(crosses, axis=0)
+            self.image[top:bottom + 1, left:right + 1][inside] = fill
+        closed = list(points) + [points[0]]
+        self.draw_lines([("line", *a, *b, outline, 1) for a, b in zip(closed, closed[1:])])
+
+    def png(self) -> bytes:
+        """Return the image as a PNG file."""
+        return encode_png(self.image)
+
+# Encodes an RGB image as PNG
+def encode_png(image) -> bytes:
+    """Return the bytes of an 8-bit RGB PNG of a height x width x 3 uint8 array (no filtering)."""
+    import numpy as np
+    height, width, _ = image.shape
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8) # Filter type 0 before every row
+    rows[:, 1:] = image.reshape(height, -1)
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)) + chunk(b"IEND", b""))
+
+# Records a scene
+def record_scene(scene, batched: bool = True) -> Drawing:
+    """Run a scene function against a new Drawing and return it; batched scenes run under tracer(0)."""
+    drawing = Drawing()
+    if batched:
+        drawing.tracer(0)
+    draw(scene, drawing)
+    return drawing
+
+# Rasterizes a drawing to PNG
+def render_png(drawing: Drawing, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT, scale: float = 1.0,
+               show_turtles: bool = True) -> bytes:
+    """Return the PNG of a drawing, with the visible turtles on top as on the Tk screen."""
+    raster = Raster(width, height, scale=scale)
+    raster.draw(drawing.items + (drawing.turtle_items() if show_turtles else []))
+    return raster.png()
+
+# Renders a drawing to SVG
+def render_svg(drawing: Drawing, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT, scale: float = 1.0,
+               show_turtles: bool = True) -> str:
+    """Return the SVG document of a drawing; contiguous lines of one color and width become one polyline."""
+    def point(x: float, y: float) -> str:
+        return f"{width / 2 + x * scale:.2f},{height / 2 - y * scale:.2f}"
+    def rgb(color: tuple) -> str:
+        return "#{:02x}{:02x}{:02x}".format(*color)
+    elements = []
+    path, style = [], None
+    def flush() -> None:
+        if path:
+            elements.append(f'<polyline points="{" ".join(path)}" fill="none" stroke="{rgb(style[0])}" '
+                            f'stroke-width="{style[1] * scale:g}" stroke-linecap="round" stroke-linejoin="round"/>')
+            path.clear()
+    end = None
+    for item in drawing.items + (drawing.turtle_items() if show_turtles else []):
+        if item[0] == "line":
+            _, x0, y0, x1, y1, color, line_width = item
+            if (color, line_width) != style or (x0, y0) != end:
+                flush()
+                style = (color, line_width)
+                path.append(point(x0, y0))
+            path.append(point(x1, y1))
+            end = (x1, y1)
+        elif item[0] == "polyline":
+            _, vertices, color, line_width = item
+            flush()
+            style = (color, line_width)
+            path.extend(point(x, y) for x, y in vertices.tolist())
+            end = tuple(vertices[-1].tolist())
+        else:
+            flush()
+            end = None
+            _, points, fill, outline = item
+            elements.append(f'<polygon points="{" ".join(point(x, y) for x, y in points)}" fill="{rgb(fill)}" '
+                            f'stroke="{rgb(outline)}" stroke-width="1"/>')
+    flush()
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n'
+            f'<rect width="100%" height="100%" fill="white"/>\n' + "\n".join(elements) + "\n</svg>\n")
+
+################################################
+# Headless Rendering Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render the turtle_play scenes to PNG or SVG files without a display.")
+    parser.add_argument("--format", choices=["png", "svg"], default="png")
+    parser.add_argument("--output", default=".", help="Directory to write <scene>.<format> files to")
+    parser.add_argument("--scenes", default=",".join(SCENES), help="Comma separated scene names")
+    parser.add_argument("--repeat", type=int, default=1, help="Render every scene this many times (for timing)")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH)
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT)
+    parser.add_argument("--scale", type=float, default=1.0, help="Pixels per turtle step")
+    parser.add_argument("--animated", action="store_true", help="Record the scenes step by step, as with tracing on")
+    args = parser.parse_args()
+
+    names = args.scenes.split(",")
+    unknown = [name for name in names if name not in SCENES]
+    if unknown:
+        parser.error(f"unknown scenes {', '.join(unknown)} (choose from {', '.join(SCENES)})")
+    os.makedirs(args.output, exist_ok=True)
+    files = []
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for name in names:
+            drawing = record_scene(SCENES[name], not args.animated)
+            path = os.path.join(args.output, f"{name}.{args.format}")
+            if args.format == "png":
+                with open(path, "wb") as f:
+                    f.write(render_png(drawing, args.width, args.height, args.scale))
+            else:
+                with open(path, "w") as f:
+                    f.write(render_svg(drawing, args.width, args.height, args.scale))
+            if path not in files:
+                files.append(path)
+    elapsed = time.perf_counter() - start
+    rendered = args.repeat * len(names)
+    print(json.dumps({"files": files, "scenes_rendered": rendered, "elapsed_s": elapsed,
+                      "scenes_per_minute": rendered * 60 / elapsed if elapsed else 0.0}, indent=2))
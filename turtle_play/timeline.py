@@ -0,0 +1,116 @@
+################################################
+# Title     : Turtle Timeline Scheduler
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays several turtle_play scenes at the same time on one screen, driven by Screen.ontimer() instead of
+#             blocking sleeps, so the Tk main loop keeps running and the window stays responsive.
+#             1) A scene is a generator that yields after every step. Every track of the timeline takes its scene
+#                rate steps per second from its start time (or all of them at once if rate is None).
+#             2) A frame runs the steps of every track that are due, with tracing off, and shows them with a single
+#                screen.update(). Frames are due every 1/fps seconds from the start of the timeline.
+#             3) Progress follows the clock, not the frame count: if a frame ends after the next one was due, the
+#                frames missed are dropped (and counted) and the following frame catches up on their steps.
+#             4) stats() reports the frames drawn and dropped, the achieved frames per second and the draw time of a
+#                frame (mean and maximum).
+#
+# All Rights Reserved.
+################################################
+
+import time
+
+DEFAULT_FPS = 30
+
+################################################
+# Class Definitions
+################################################
+# Class to hold a scene playing on a timeline
+class Track:
+    """Steps of a scene generator, taken rate per second from start seconds into the timeline."""
+    def __init__(self, steps, rate: float = None, start: float = 0.0) -> None:
+        self.steps = steps
+        self.rate = rate
+        self.start = start
+        self.taken = 0
+        self.done = False
+
+    def advance(self, elapsed: float) -> None:
+        """Take the steps due elapsed seconds into the timeline."""
+        if self.done or elapsed < self.start:
+            return
+        due = None if self.rate is None else int((elapsed - self.start) * self.rate) + 1
+        while due is None or self.taken < due:
+            try:
+                next(self.steps)
+            except StopIteration:
+                self.done = True
+                return
+            self.taken += 1
+
+# Class to play scenes together at a fixed frame rate
+class Timeline:
+    """Tracks of scenes played on a turtle screen (anything with tracer(), update() and ontimer())."""
+    def __init__(self, screen, fps: float = DEFAULT_FPS, clock=time.perf_counter) -> None:
+        self.screen = screen
+        self.fps = fps
+        self.period = 1 / fps
+        self.clock = clock
+        self.tracks: list[Track] = []
+        self.frames = 0
+        self.dropped = 0
+        self.draw_total = 0.0
+        self.draw_max = 0.0
+        self.origin = self.next_due = self.finished = None
+        self.tracing = None # Tracer value of the screen before start()
+        self.on_finish = None
+
+    def add(self, scene, rate: float = None, start: float = 0.0) -> Track:
+        """Play a scene function on the screen from start seconds, at rate steps per second (None: in one frame)."""
+        track = Track(scene(self.screen), rate, start)
+        self.tracks.append(track)
+        return track
+
+    def start(self, on_finish=None) -> None:
+        """Turn tracing off and draw the first frame; on_finish() is called after the frame that ends the last track."""
+        self.on_finish = on_finish
+        self.tracing = self.screen.tracer()
+        self.screen.tracer(0)
+        self.origin = self.next_due = self.clock()
+        self._frame()
+
+    def _frame(self) -> None:
+        begin = self.clock()
+        for track in self.tracks:
+            track.advance(begin - self.origin)
+        self.screen.update()
+        end = self.clock()
+        self.frames += 1
+        self.draw_total += end - begin
+        self.draw_max = max(self.draw_max, end - begin)
+        if all(track.done for track in self.tracks):
+            self.finished = end
+            self.screen.tracer(self.tracing)
+            if self.on_finish is not None:
+                self.on_finish()
+            return
+        self.next_due += self.period
+        if end > self.next_due: # Drop the frames that are already late
+            missed = int((end - self.next_due) / self.period) + 1
+            self.dropped += missed
+            self.next_due += missed * self.period
+        self.screen.ontimer(self._frame, max(round((self.next_due - end) * 1000), 0))
+
+    def stats(self) -> dict:
+        """Return the frames drawn and dropped, the achieved frames per second and the draw time per frame."""
+        elapsed = ((self.finished or self.clock()) - self.origin) if self.origin is not None else 0.0
+        return {
+            "target_fps": self.fps,
+            "frames": self.frames,
+            "dropped_frames": self.dropped,
+            "elapsed_s": elapsed,
+            "fps": (self.frames - 1) / elapsed if self.frames > 1 else 0.0, # Frames after the first one
+            "draw_ms_mean": 1000 * self.draw_total / self.frames if self.frames else 0.0,
+            "draw_ms_max": 1000 * self.draw_max,
+        }
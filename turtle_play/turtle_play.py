@@ -7,110 +7,152 @@
 # File Test : Verified on Python 3.12.6
 # Comments  : The program contains few methods to draw and play with the Python Turtle library.
 #             Refer to Turtle documentation here: https://docs.python.org/3/library/turtle.html.
-#             You might have to build Python with tcl-tk GUI options to run the code. Steps to 
+#             You might have to build Python with tcl-tk GUI options to run the code. Steps to
 #             install Python interface to Tcl-Tk GUI toolkit on Mac OS (Apple Silicon) has been
 #             included in README.md file.
+#             Every scene is a generator function of a screen (anything with Turtle(), title() and tracer(), i.e. the
+#             turtle module itself or a headless Drawing, see headless.py) that yields after every step, so the scenes
+#             can be rendered without Tk. The figures are computed at once by geometry.py.
+#             The scenes of an act play together on a Timeline (timeline.py): one screen update per frame, driven by
+#             ontimer() so the window stays responsive; with --batched every scene is drawn in one frame.
 #
 # All Rights Reserved.
 ################################################
 
-import turtle
-import time
+import argparse
+import json
 
-turtle.Screen()
-turtle.title("Welcome to Turtle Draw and Play!")
+from .geometry import arithmetic_spiral, regular_polygon, stamp_at, stamp_ring, trace
+from .timeline import DEFAULT_FPS, Timeline
+
+TITLE = "Welcome to Turtle Draw and Play!"
 
 ################################################
-# Draw a pentagon
+# Scene Definitions
 ################################################
-turtle.title("Welcome to Turtle Draw and Play! - Drawing a pentagon")
-bob = turtle.Turtle()
-angle = 72
-distance = 100
-for _ in range(5):
-    bob.forward(distance)
-    bob.left(angle)
-
-time.sleep(2)
-turtle.clearscreen()
+# Draw a pentagon
+def pentagon(screen):
+    screen.title(TITLE + " - Drawing a pentagon")
+    bob = screen.Turtle()
+    yield from trace(screen, bob, *regular_polygon(5, 100))
 
-################################################
 # Draw a hexagon slowly to watch the animation
-################################################
-turtle.title("Welcome to Turtle Draw and Play! - Drawing a hexagon slowly for an animation")
-jazz = turtle.Turtle()
-jazz.color("red")
-jazz.speed(1)
-angle = 60
-distance = 100
-for _ in range(12):
-    jazz.forward(distance)
-    jazz.left(angle)
-
-time.sleep(2)
-turtle.clearscreen()
+def slow_hexagon(screen):
+    screen.title(TITLE + " - Drawing a hexagon slowly for an animation")
+    jazz = screen.Turtle()
+    jazz.color("red")
+    jazz.speed(1)
+    yield from trace(screen, jazz, *regular_polygon(6, 100, laps=2))
 
-################################################
 # Draw a hexagon with Turtle shape stamped on the screen
-################################################
-turtle.title("Welcome to Turtle Draw and Play! - Drawing a hexagon with turtle shape stamped on the screen")
-bluey = turtle.Turtle()
-bluey.shape("turtle")
-bluey.color("blue")
-bluey.speed(2)
-bluey.stamp()
-angle = 60
-distance = 100
-for _ in range(12):
-    bluey.forward(distance)
-    bluey.stamp()
-    bluey.left(angle)
-
-time.sleep(2)
-turtle.clearscreen()
+def stamped_hexagon(screen):
+    screen.title(TITLE + " - Drawing a hexagon with turtle shape stamped on the screen")
+    bluey = screen.Turtle()
+    bluey.shape("turtle")
+    bluey.color("blue")
+    bluey.speed(2)
+    yield from trace(screen, bluey, *regular_polygon(6, 100, laps=2), stamps=True)
 
-################################################
 # Draw a circle of Turtle shapes
-################################################
-turtle.title("Welcome to Turtle Draw and Play! - Drawing a circle of turtle shapes")
-tom = turtle.Turtle()
-tom.shape("turtle")
-tom.color("green")
-tom.speed(2)
-tom.penup()
-angle = 36
-distance = 100
-for size in range(10):
-    tom.forward(distance)
-    tom.stamp()
-    tom.forward(-distance)
-    tom.right(angle)
-
-time.sleep(2)
-turtle.clearscreen()
+def stamp_circle(screen):
+    screen.title(TITLE + " - Drawing a circle of turtle shapes")
+    tom = screen.Turtle()
+    tom.shape("turtle")
+    tom.color("green")
+    tom.speed(2)
+    tom.penup()
+    yield from stamp_at(screen, tom, *stamp_ring(10, 100, 36), home=True)
+    tom.setheading(0)
 
-################################################
 # Draw an outward spiral of Turtle shapes
-################################################
-turtle.title("Welcome to Turtle Draw and Play! - Drawing an outward spiral of turtle shapes")
-spiral = turtle.Turtle()
-spiral.color("orange")
-spiral.shape("turtle")
-spiral.speed(2)
-spiral.up()
-angle = 24
-distance = 5
-for _ in range(30):
-    spiral.stamp()
-    spiral.forward(distance)
-    spiral.right(angle)
-    distance += 2
-
-time.sleep(2)
-turtle.clearscreen()
+def spiral(screen):
+    screen.title(TITLE + " - Drawing an outward spiral of turtle shapes")
+    spiral = screen.Turtle()
+    spiral.color("orange")
+    spiral.shape("turtle")
+    spiral.speed(2)
+    spiral.up()
+    vertices, headings = arithmetic_spiral(30, 5, 2, 24)
+    yield from stamp_at(screen, spiral, vertices[:-1], headings[:-1])
+    spiral.goto(*vertices[-1].tolist())
+    spiral.setheading(float(headings[-1]))
+
+# Draw a coil of tens of thousands of lines in one frame
+def coil(screen):
+    screen.title(TITLE + " - Drawing a coil of 20,000 lines in one frame")
+    ada = screen.Turtle()
+    ada.color("purple")
+    ada.hideturtle()
+    tracing = screen.tracer()
+    screen.tracer(0)
+    for _ in trace(screen, ada, *arithmetic_spiral(20000, 0, 0.0002, 1)):
+        pass
+    screen.tracer(tracing)
+    yield
+
+# Scenes in the order they are played
+SCENES = {
+    "pentagon": pentagon,
+    "slow_hexagon": slow_hexagon,
+    "stamped_hexagon": stamped_hexagon,
+    "stamp_circle": stamp_circle,
+    "spiral": spiral,
+    "coil": coil,
+}
+
+# Scenes played together, with their steps per second
+ACTS = [
+    {"pentagon": 2, "slow_hexagon": 1, "stamped_hexagon": 2},
+    {"stamp_circle": 3, "spiral": 6},
+    {"coil": 1},
+]
+HOLD = 2000 # Milliseconds an act stays on the screen once drawn
+
+# Draws a scene
+def draw(scene, screen) -> None:
+    """Run every step of a scene at once."""
+    for _ in scene(screen):
+        pass
 
 ################################################
-# Exit the program
+# Draw and Play Logic
 ################################################
-turtle.title("Click on the screen to exit. Thank you!")
-turtle.exitonclick()
+def main(argv: list[str] = None) -> None:
+    """Play the acts on the Tk screen and print the frame statistics of each (python -m turtle_play [--batched])."""
+    import turtle
+
+    parser = argparse.ArgumentParser(description="Play the turtle_play scenes on the Tk screen.")
+    parser.add_argument("--batched", action="store_true", help="Draw every scene in one frame instead of animating it")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS, help="Target frames per second")
+    args = parser.parse_args(argv)
+
+    turtle.Screen()
+    turtle.title(TITLE)
+    reports = []
+
+    # The acts chain through ontimer() callbacks, so the Tk main loop keeps running between frames
+    def play(act: int) -> None:
+        if act > 0:
+            turtle.clearscreen()
+        if act == len(ACTS):
+            ################################################
+            # Exit the program
+            ################################################
+            turtle.title("Click on the screen to exit. Thank you!")
+            # Bound after the last clearscreen(), which removes the click bindings
+            turtle.onscreenclick(lambda x, y: turtle.bye())
+            print(json.dumps(reports, indent=2))
+            return
+        timeline = Timeline(turtle, args.fps)
+        for name, rate in ACTS[act].items():
+            timeline.add(SCENES[name], None if args.batched else rate)
+        def finish() -> None:
+            reports.append({"scenes": list(ACTS[act]), **timeline.stats()})
+            turtle.ontimer(lambda: play(act + 1), HOLD)
+        timeline.start(finish)
+
+    play(0)
+    turtle.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+################################################
+# Title     : Wheel of Fortune Game
+# Author    : balarcode
+# File Type : Python Package
+# Comments  : Importing the package does no I/O; wheel.json and phrases.json are read on first use.
+#             Play a game with: python -m wheel_of_fortune
+#             Run a computer-only tournament with: python -m wheel_of_fortune.tournament
+#             Host network tables with: python -m wheel_of_fortune.server
+#
+# All Rights Reserved.
+################################################
+
+from .wheel_of_fortune import (LETTERS, VOWELS, VOWEL_COST, Board, Game, WOFComputerPlayer, WOFHumanPlayer, WOFPlayer,
+                               checkMove, createPlayers, getRandomCategoryAndPhrase, main, obscurePhrase, playGame,
+                               requestPlayerMove, showBoard, spinWheel)
@@ -0,0 +1,3 @@
+from .wheel_of_fortune import main
+
+main()
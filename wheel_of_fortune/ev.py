@@ -0,0 +1,192 @@
+################################################
+# Title     : Wheel of Fortune Expected Value Engine
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Scores the moves of a computer player (guess a consonant, buy a vowel, solve or pass) by expected value.
+#             1) The board model comes from the phrase index: the phrases still consistent with the board give, for every
+#                letter not guessed yet, the probability that it is in the phrase and its expected number of copies.
+#             2) A letter is scored by Monte Carlo rollouts of the rest of the turn: the guess hits or misses, then the
+#                player keeps spinning (bankrupt and lose a turn end the turn, with the weights of wheel.json) and
+#                guessing the most likely remaining consonants, and solves once at most two phrases are left.
+#                All rollouts of all candidate moves advance together as NumPy arrays, one array step per spin.
+#             3) Money only pays off for the winner, so the value of a rollout is its money if the turn ends with a
+#                win and FUTURE_SHARE of it otherwise. Solving is scored exactly from the number of candidate phrases.
+#             4) Rollouts run in a fixed number of batches per move, so a seeded generator always picks the same move
+#                whatever the speed and load of the machine. A per-move time budget is opt-in: rollouts then run in
+#                batches until it is spent (at least one batch), which makes the moves depend on the machine.
+#                Letter probabilities treat the letters as independent, which keeps a step to a few array operations.
+#
+# All Rights Reserved.
+################################################
+
+import string
+import time
+
+import numpy as np
+
+from .phrase_index import TEMPLATE_TABLE
+
+ROLLOUTS = 64 # Rollouts per candidate move and batch
+BATCHES = 4 # Batches per move without a time budget
+MAX_BATCHES = 8 # Most batches per move, whatever the time budget
+DEPTH = 4 # Spins simulated after the move
+FUTURE_SHARE = 0.3 # Part of its money a player not winning during the turn is expected to keep (by winning later)
+SOLVE_CANDIDATES = 8 # Most candidate phrases to consider solving
+TOP_CONSONANTS = 4 # Consonants scored per move
+TOP_VOWELS = 2 # Vowels scored per move (if the player can afford them)
+SPIN_TABLE = 1 << 16 # Entries of the spin lookup table
+
+################################################
+# Class Definitions
+################################################
+# Class to hold the wheel as arrays
+class WheelModel:
+    """Cash values and bankrupt / lose a turn flags of the wheel segments, with a lookup table for weighted spins"""
+    def __init__(self, wheel):
+        weights = np.array([segment.get('weight', 1) for segment in wheel], dtype=np.float64)
+        cumulative = np.cumsum(weights / weights.sum())
+        # Segment of each of SPIN_TABLE equal slices of [0, 1), so a spin is a multiply and a lookup
+        self.table = np.searchsorted(cumulative, (np.arange(SPIN_TABLE) + 0.5) / SPIN_TABLE, side='right').clip(0, len(wheel) - 1)
+        self.values = np.array([segment.get('value', 0) if segment['type'] == 'cash' else 0 for segment in wheel], dtype=np.float64)
+        self.bankrupt = np.array([segment['type'] == 'bankrupt' for segment in wheel])
+        self.endsTurn = np.array([segment['type'] != 'cash' for segment in wheel])
+
+    def spin(self, draws):
+        """Returns the segment indices of uniform draws in [0, 1)"""
+        return self.table[(draws * SPIN_TABLE).astype(np.intp)]
+
+# Class to describe what the phrase index knows about a board
+class BoardModel:
+    """Candidate phrases of a board and, per letter not guessed yet, its hit probability and expected copies"""
+    def __init__(self, candidates, phrases, letters, probabilities, copies):
+        self.candidates = candidates # Number of phrases consistent with the board
+        self.phrases = phrases # The phrases if there are at most SOLVE_CANDIDATES of them, else []
+        # Letters that may be in the phrase, most likely first
+        self.letters = letters
+        self.probabilities = probabilities
+        self.copies = copies # Expected copies of a letter if it is in the phrase
+
+    @classmethod
+    def build(cls, phraseIndex, category, obscuredPhrase, guessed):
+        """Returns the model of a board, or None if no phrase of the index fits it"""
+        group = phraseIndex.group(category, obscuredPhrase.translate(TEMPLATE_TABLE))
+        if group is None:
+            return None
+        mask = group.match(obscuredPhrase, guessed)
+        candidates = mask.bit_count()
+        if candidates == 0:
+            return None
+        stats = []
+        for c in string.ascii_uppercase:
+            if c in guessed:
+                continue
+            present = (mask & group.present.get(c, 0)).bit_count()
+            if present == 0:
+                continue
+            total, counted, k = 0, 0, 1
+            while counted < present:
+                n = (mask & group.counts.get((c, k), 0)).bit_count()
+                total += k * n
+                counted += n
+                k += 1
+            stats.append((-present, c, total / present))
+        stats.sort()
+        phrases = []
+        if candidates <= SOLVE_CANDIDATES:
+            phrases = phraseIndex.candidates(category, obscuredPhrase, guessed)[1]
+        return cls(candidates, phrases, [c for _, c, _ in stats], [-n / candidates for n, _, _ in stats],
+                   [copies for _, _, copies in stats])
+
+# Class to score the moves of a player
+class EVEngine:
+    """Monte Carlo expected value of the moves available after a cash spin"""
+    def __init__(self, wheel, timeBudget=None, batches=BATCHES):
+        self.wheel = WheelModel(wheel)
+        self.timeBudget = timeBudget # Seconds per move (0 runs exactly one batch); None runs batches per move
+        self.batches = batches
+
+    def generator(self, seed=None):
+        """Returns a random generator for chooseMove()"""
+        return np.random.default_rng(seed)
+
+    def rollouts(self, rng, money, value, probabilities, copies, costs, solveStep, solveLeft, followProbabilities, followCopies):
+        """
+        Returns the mean value of rollouts of the turn after guessing each letter (one entry per letter).
+        The player solves before spin solveStep[a] (none if DEPTH) with solveLeft[a] phrases left; the rows of
+        followProbabilities and followCopies (DEPTH x letters) are the consonants it guesses on the spins after letter a.
+        """
+        numActions = len(probabilities)
+        steps = (np.arange(DEPTH)[:, None] < solveStep)[:, :, None] # Spins taken if the player is still in its turn
+        reachIndex = np.maximum(solveStep - 1, 0), np.arange(numActions)
+        reachable = (solveStep > 0) & (solveStep < DEPTH)
+        total = np.zeros(numActions)
+        batches = 0
+        if self.timeBudget is None:
+            limit, deadline = self.batches, None
+        else:
+            limit, deadline = MAX_BATCHES, time.perf_counter() + self.timeBudget
+        while batches == 0 or (batches < limit and (deadline is None or time.perf_counter() < deadline)):
+            draws = rng.random((2 * DEPTH + 2, numActions, ROLLOUTS))
+            segments = self.wheel.spin(draws[DEPTH+2:])
+            hit = draws[0] < probabilities[:, None]
+            # A spin keeps the turn going if it lands on cash and the next consonant is in the phrase
+            going = ~self.wheel.endsTurn[segments] & (draws[2:DEPTH+2] < followProbabilities[:, :, None])
+            alive = hit & np.logical_and.accumulate(going, axis=0) # Still in the turn after each spin
+            before = np.concatenate([hit[None], alive[:-1]]) & steps # In the turn before each spin
+            bankrupt = (before & self.wheel.bankrupt[segments]).any(axis=0)
+            gains = ((alive & steps) * followCopies[:, :, None] * self.wheel.values[segments]).sum(axis=0)
+            m = np.where(hit, money + copies[:, None] * value - costs[:, None], money) + gains
+            m[bankrupt] = 0.0
+            # The turn reaches its solve if the player hit on every spin before it
+            solving = np.where((solveStep == 0)[:, None], hit, alive[reachIndex] & reachable[:, None])
+            won = solving & (draws[1] * solveLeft[:, None] < 1)
+            total += np.where(won, m, m * FUTURE_SHARE).mean(axis=1)
+            batches += 1
+        return total / batches
+
+    def chooseMove(self, board, money, value, vowelCost, vowels, rng):
+        """
+        Returns the best move for a board model after a spin worth value: a letter, a phrase to solve or 'PASS'.
+        vowels are the letters that cost vowelCost (only considered if money covers it); rng draws the rollouts.
+        """
+        consonants = [i for i, c in enumerate(board.letters) if c not in vowels]
+        choices = consonants[:TOP_CONSONANTS]
+        if money >= vowelCost:
+            choices += [i for i, c in enumerate(board.letters) if c in vowels][:TOP_VOWELS]
+        best, bestValue = 'PASS', money * FUTURE_SHARE
+        if board.phrases:
+            # Solving wins with one chance in the number of candidate phrases
+            solveValue = (money + value) / board.candidates + money * FUTURE_SHARE * (1 - 1 / board.candidates)
+            if solveValue > bestValue:
+                best, bestValue = board.phrases[int(rng.integers(len(board.phrases)))], solveValue
+        if not choices:
+            return best
+        probabilities, copies = board.probabilities, board.copies
+        followProbabilities = np.zeros((DEPTH, len(choices)))
+        followCopies = np.zeros((DEPTH, len(choices)))
+        solveStep, solveLeft = [], []
+        for a, i in enumerate(choices):
+            # Consonants guessed on the next spins, most likely first; while they hit the expected number of
+            # phrases left is the same in every rollout, and so is the spin before which the player solves
+            follow = [j for j in consonants if j != i][:DEPTH]
+            left = board.candidates * probabilities[i]
+            for step, j in enumerate(follow):
+                followProbabilities[step, a] = probabilities[j]
+                followCopies[step, a] = copies[j]
+            step = 0
+            while step < DEPTH and left > 2:
+                left *= followProbabilities[step, a]
+                step += 1
+            solveStep.append(step)
+            solveLeft.append(max(left, 1.0))
+        costs = np.array([vowelCost if board.letters[i] in vowels else 0.0 for i in choices])
+        gains = np.array([0.0 if board.letters[i] in vowels else copies[i] for i in choices])
+        values = self.rollouts(rng, money, value, np.array([probabilities[i] for i in choices]), gains, costs,
+                               np.array(solveStep), np.array(solveLeft), followProbabilities, followCopies)
+        a = int(values.argmax())
+        if values[a] > bestValue:
+            best = board.letters[choices[a]]
+        return best
@@ -0,0 +1,28 @@
+################################################
+# Title     : Wheel of Fortune Game Events
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Event types of the records a Game writes to a journal (see journal.py).
+#             Each comment lists the record fields the event uses besides game, turn, seat and money.
+#
+# All Rights Reserved.
+################################################
+
+NO_SEGMENT = 0xFFFF # Segment of the records not tied to a spin
+
+# Event types
+GAME_START = 0 # count: number of players, value: number of letters of the phrase
+SPIN = 1 # segment: wheel segment, value: its cash value (0 for bankrupt and lose a turn)
+BANKRUPT = 2 # value: minus the money lost
+LOSE_TURN = 3
+LETTER = 4 # letter, count: times it appears, value: money won (or the cost of a vowel)
+SOLVE = 5 # count: 1 if the phrase was right, value: money won
+PASS = 6
+EXIT = 7
+PRIZE = 8 # segment: wheel segment whose prize was won
+WIN = 9 # value: winnings
+GAME_END = 10 # turn: number of spins, seat: winner (0xFF if nobody won)
+EVENT_NAMES = ('game_start', 'spin', 'bankrupt', 'lose_turn', 'letter', 'solve', 'pass', 'exit', 'prize', 'win', 'game_end')
@@ -0,0 +1,178 @@
+################################################
+# Title     : Wheel of Fortune Game Data
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Cached access to wheel.json and phrases.json.
+#             1) Each file is parsed once per process and parsed again only when its modification time changes.
+#                The modification time is checked at most once every CHECK_INTERVAL seconds.
+#             2) Wheel segments may carry an optional "weight" (default 1). An alias table built when the wheel
+#                is loaded gives an O(1) weighted spin.
+#             3) Phrases are pre-split into per-category tuples of upper-cased phrases, so picking a category
+#                and a phrase is two O(1) random choices.
+#             4) Random phrases are picked from the binary phrase store compiled from phrases.json (see phrase_store.py),
+#                so a game does not parse phrases.json. Without phrases.json, the phrases are read from the store.
+#             5) The phrase index and the letter counts of the computer players are built from the phrase store whenever
+#                it is recompiled. The letter counts are also saved next to phrases.json, keyed by the digest of the
+#                store (see letter_stats.py), so a later process maps the store and reads the counts.
+#             6) The expected value engine of the computer players (see ev.py) is rebuilt whenever wheel.json is.
+#
+# All Rights Reserved.
+################################################
+
+import json
+import os
+import random
+import time
+
+from .letter_stats import LetterStats
+from .phrase_index import PhraseIndex
+
+# Directory holding wheel.json and phrases.json; the files are only read when a game needs them
+DATA_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+CHECK_INTERVAL = 1.0 # Seconds between two modification time checks of a data file
+
+################################################
+# Class Definitions
+################################################
+# Class to sample from a discrete distribution in constant time
+class AliasTable:
+    """Alias table (Vose's method) for O(1) sampling of an index with the given weights"""
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError('An alias table needs at least one positive weight')
+        scaled = [w * n / total for w in weights]
+        self.probability = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.probability[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Whatever is left over has a probability of 1 up to rounding errors
+
+    def sample(self, rng=random):
+        """Return a random index drawn with the weights of the table"""
+        i = rng.randrange(len(self.probability))
+        if rng.random() < self.probability[i]:
+            return i
+        return self.alias[i]
+
+# Class to hold the parsed wheel and phrases
+class GameData:
+    """Parsed wheel.json and phrases.json of a data directory, reloaded when a file changes"""
+    def __init__(self, directory=DATA_DIRECTORY):
+        self.directory = directory
+        self._files = {} # File name -> (modification time, parsed data)
+        self._lastCheck = {} # File name -> monotonic time of the last modification time check
+        self._phraseIndex = (None, None) # (store it was built from, PhraseIndex)
+        self._letterStats = (None, None) # (store they were built from, LetterStats)
+        self._evEngine = (None, None) # (wheel it was built from, EVEngine)
+        self._phraseStore = None
+        self._storePhrases = (None, None) # (store they were read from, categories and phrases)
+
+    def _load(self, name, parse):
+        """Return parse(json data) of a data file, re-parsing it only if the file changed"""
+        cached = self._files.get(name)
+        now = time.monotonic()
+        if cached is not None and now - self._lastCheck[name] < CHECK_INTERVAL:
+            return cached[1]
+        self._lastCheck[name] = now
+        path = os.path.join(self.directory, name)
+        mtime = os.stat(path).st_mtime_ns
+        if cached is None or cached[0] != mtime:
+            with open(path, 'r') as f:
+                cached = self._files[name] = (mtime, parse(json.load(f)))
+        return cached[1]
+
+    def getWheel(self):
+        """Returns the wheel segments and their alias table as a tuple"""
+        return self._load('wheel.json', lambda wheel: (wheel, AliasTable([segment.get('weight', 1) for segment in wheel])))
+
+    def getPhrases(self):
+        """Returns the categories and, per category, the tuple of upper-cased phrases"""
+        def split(phrases):
+            categories = tuple(phrases.keys())
+            return categories, {category: tuple(phrase.upper() for phrase in phrases[category]) for category in categories}
+        try:
+            return self._load('phrases.json', split)
+        except FileNotFoundError:
+            pass
+        store = self.getPhraseStore()
+        if self._storePhrases[0] is not store:
+            self._storePhrases = (store, (store.categories, store.toDict()))
+        return self._storePhrases[1]
+
+    def getPhraseStore(self):
+        """Returns the PhraseStore of phrases.json, compiled to phrases.bin when it is missing or out of date"""
+        from . import phrase_store
+        now = time.monotonic()
+        if self._phraseStore is not None and now - self._lastCheck[phrase_store.FILE_NAME] < CHECK_INTERVAL:
+            return self._phraseStore
+        self._lastCheck[phrase_store.FILE_NAME] = now
+        jsonPath = os.path.join(self.directory, 'phrases.json')
+        source = phrase_store.sourceStamp(jsonPath)
+        if self._phraseStore is None or (source is not None and self._phraseStore.source != source):
+            self._phraseStore = phrase_store.openStore(jsonPath, os.path.join(self.directory, phrase_store.FILE_NAME))
+        return self._phraseStore
+
+    def getPhraseIndex(self):
+        """Returns the PhraseIndex of the current phrases, read from the phrase store"""
+        store = self.getPhraseStore()
+        if self._phraseIndex[0] is not store:
+            self._phraseIndex = (store, PhraseIndex.fromStore(store))
+        return self._phraseIndex[1]
+
+    def getLetterStats(self):
+        """Returns the LetterStats of the current phrases, read from the phrase store"""
+        store = self.getPhraseStore()
+        if self._letterStats[0] is not store:
+            phrases = {category: store.iterPhrases(category) for category in store.categories}
+            self._letterStats = (store, LetterStats.load(phrases, self.directory, store.digest()))
+        return self._letterStats[1]
+
+    def getEVEngine(self):
+        """Returns the EVEngine of the current wheel (imports NumPy)"""
+        from .ev import EVEngine
+        wheel, table = self.getWheel()
+        if self._evEngine[0] is not wheel:
+            self._evEngine = (wheel, EVEngine(wheel))
+        return self._evEngine[1]
+
+    def spinWheel(self, rng=random):
+        """Returns the dictionary of a random wheel segment, drawn with the segment weights"""
+        return self.spinWheelIndex(rng)[1]
+
+    def spinWheelIndex(self, rng=random):
+        """Returns the index and the dictionary of a random wheel segment, drawn with the segment weights"""
+        wheel, table = self.getWheel()
+        index = table.sample(rng)
+        return index, wheel[index]
+
+    def getRandomCategoryAndPhrase(self, rng=random):
+        """Returns a tuple with a random category and one of its phrases"""
+        return self.getPhraseStore().randomCategoryAndPhrase(rng)
+
+################################################
+# Function Definitions
+################################################
+_gameData = {}
+
+# Returns the cached game data of a directory
+def getGameData(directory=DATA_DIRECTORY):
+    """Returns the GameData of a data directory, creating it once per process"""
+    data = _gameData.get(directory)
+    if data is None:
+        data = _gameData[directory] = GameData(directory)
+    return data
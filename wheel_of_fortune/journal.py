@@ -0,0 +1,153 @@
+################################################
+# Title     : Wheel of Fortune Event Journal
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Append-only binary journal of the events of Wheel of Fortune games.
+#             1) A journal file is a short header followed by fixed-width 22 byte records: game, turn (spin), seat,
+#                event, letter, reveal count, wheel segment, money change and the money of the player after the event.
+#             2) A Game given a Journal records its start, every spin, bankruptcy, lost turn, move, prize, win and its end.
+#                Records are packed into a preallocated buffer that is written to the file in bulk, so journaling
+#                costs one struct.pack_into() per event.
+#             3) Reading maps the file with mmap and views the records as a NumPy structured array without copying or
+#                parsing, so analytics (e.g. bankruptcies per game, winnings by wheel segment) are vectorized scans.
+#                NumPy is only imported by the reader.
+#             Usage: python -m wheel_of_fortune.journal JOURNAL [JOURNAL ...]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import json
+import mmap
+import os
+import struct
+
+from .events import BANKRUPT, EVENT_NAMES, GAME_END, LETTER, NO_SEGMENT, SPIN
+
+MAGIC = b'WOFJRNL\0'
+VERSION = 2 # Version 1 packed the turn in 16 bits
+HEADER = struct.Struct('<8sHH') # Magic, version and record size
+# Game, turn, seat, event, letter (1-26, 0 for none), reveal count, wheel segment, money change and money after the event
+RECORD = struct.Struct('<IIBBBBHii')
+BUFFER_RECORDS = 4096 # Records packed in memory before they are written to the file
+
+################################################
+# Class Definitions
+################################################
+# Class to write events to a journal file
+class Journal:
+    """Append-only writer of event records; use as a context manager or call close()"""
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        else:
+            with open(path, 'rb') as f:
+                checkHeader(f.read(HEADER.size), path)
+        self.buffer = bytearray(RECORD.size * BUFFER_RECORDS)
+        self.offset = 0
+
+    def record(self, game, turn, seat, event, letter=0, count=0, segment=NO_SEGMENT, value=0, money=0):
+        """Append one event"""
+        RECORD.pack_into(self.buffer, self.offset, game, turn, seat, event, letter, count, segment, value, money)
+        self.offset += RECORD.size
+        if self.offset == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records to the file"""
+        if self.offset:
+            self.file.write(memoryview(self.buffer)[:self.offset])
+            self.offset = 0
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+################################################
+# Function Definitions
+################################################
+# Checks the header of a journal file
+def checkHeader(data, path):
+    """Raises ValueError if data does not start with the header of a version VERSION journal"""
+    if len(data) < HEADER.size:
+        raise ValueError('{} is not a journal'.format(path))
+    magic, version, recordSize = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or recordSize != RECORD.size:
+        raise ValueError('{} is not a version {} journal'.format(path, VERSION))
+
+# Returns the NumPy dtype of a record
+def recordDtype():
+    """Returns the structured dtype matching RECORD"""
+    import numpy as np
+    return np.dtype([('game', '<u4'), ('turn', '<u4'), ('seat', 'u1'), ('event', 'u1'), ('letter', 'u1'),
+                     ('count', 'u1'), ('segment', '<u2'), ('value', '<i4'), ('money', '<i4')])
+
+# Maps the records of a journal file
+def readJournal(path):
+    """Returns the records of a journal as a read-only structured array backed by a memory map of the file"""
+    import numpy as np
+    with open(path, 'rb') as f:
+        checkHeader(f.read(HEADER.size), path)
+        size = os.fstat(f.fileno()).st_size
+        if size == HEADER.size:
+            return np.zeros(0, dtype=recordDtype())
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    count = (size - HEADER.size) // RECORD.size # A partly written last record is ignored
+    return np.frombuffer(data, dtype=recordDtype(), count=count, offset=HEADER.size)
+
+# Summarizes the records of one or more journals
+def summarize(records, wheel=None):
+    """
+    Returns the number of games and events, the events per type, the histogram of bankruptcies per game and the
+    letter winnings by wheel segment. wheel, if given, is the list of segments used to label them.
+    """
+    import numpy as np
+    events = records['event']
+    games = np.unique(records['game'][events == GAME_END])
+    # Bankruptcies of every finished game, including the games without any
+    bankruptGames, counts = np.unique(records['game'][events == BANKRUPT], return_counts=True)
+    counts = counts[np.isin(bankruptGames, games)]
+    bankruptcies = np.bincount(counts, minlength=1)
+    bankruptcies[0] = len(games) - len(counts)
+
+    letters = records[(events == LETTER) & (records['value'] > 0)]
+    segments = np.bincount(letters['segment'], weights=letters['value'])
+    spins = np.bincount(records['segment'][events == SPIN], minlength=len(segments))
+    bySegment = {}
+    for segment in np.nonzero(spins)[0]:
+        label = '{} {}'.format(segment, wheel[segment]['text']) if wheel is not None and segment < len(wheel) else str(segment)
+        won = float(segments[segment]) if segment < len(segments) else 0.0
+        bySegment[label] = {'spins': int(spins[segment]), 'winnings': won, 'winnings_per_spin': won / spins[segment]}
+    return {
+        'games': int(len(games)),
+        'events': int(len(records)),
+        'events_by_type': {EVENT_NAMES[i]: int(n) for i, n in enumerate(np.bincount(events, minlength=len(EVENT_NAMES))) if n},
+        'bankruptcies_per_game': {str(i): int(n) for i, n in enumerate(bankruptcies)},
+        'winnings_by_segment': bySegment,
+    }
+
+################################################
+# Journal Analytics
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize Wheel of Fortune event journals as JSON.")
+    parser.add_argument("journals", nargs="+", help="Journal files (e.g. written by the tournament with --journal)")
+    args = parser.parse_args()
+
+    import numpy as np
+    from .game_data import getGameData
+    records = [readJournal(path) for path in args.journals]
+    records = records[0] if len(records) == 1 else np.concatenate(records)
+    print(json.dumps(summarize(records, getGameData().getWheel()[0]), indent=2))
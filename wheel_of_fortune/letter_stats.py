@@ -0,0 +1,160 @@
+################################################
+# Title     : Wheel of Fortune Letter Statistics
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Letter rankings used by the computer players for their good moves.
+#             1) A good move is the letter contained in the most phrases still consistent with the board: the phrases of
+#                the category and template (see phrase_index.py) that show the revealed letters and none of the guessed
+#                letters that missed. The counts follow the board as it fills in.
+#             2) The category counts (fraction of the phrases of the category containing each letter) are the prior: they
+#                are added with the weight of PRIOR_WEIGHT phrases, so a board with few candidates does not give away its
+#                phrase, and they rank the letters alone when no phrase fits the board.
+#             3) The counts overall and per category are computed once per phrases.json and saved next to it in
+#                letter_stats.json, keyed by a digest of the phrases (of the phrase store in a game), so later processes
+#                only read them.
+#             4) The counts over the candidates intersect one bitset per available letter with the candidates of the
+#                board, so a pick costs at most 26 bitset operations.
+#
+# All Rights Reserved.
+################################################
+
+import hashlib
+import json
+import os
+import string
+
+from .phrase_index import TEMPLATE_TABLE
+
+VERSION = 2
+FILE_NAME = 'letter_stats.json'
+# Bit of every letter in the masks of available letters; bit i stands for string.ascii_uppercase[i]
+LETTER_BITS = {c: 1 << i for i, c in enumerate(string.ascii_uppercase)}
+PRIOR_WEIGHT = 8 # Number of candidate phrases the category counts weigh as
+
+################################################
+# Function Definitions
+################################################
+# Returns a digest identifying the phrases of every category
+def phrasesDigest(phrases):
+    """Returns a hex digest of the categories and phrases, in order"""
+    h = hashlib.sha256()
+    for category, categoryPhrases in phrases.items():
+        h.update(category.encode('utf-8') + b'\0')
+        h.update('\n'.join(categoryPhrases).encode('utf-8') + b'\0')
+    return h.hexdigest()
+
+# Ranks the letters by how many phrases contain them
+def rankLetters(counts, *fallbacks):
+    """Returns the 26 letters sorted by count, breaking ties with the rank in each fallback ranking in turn"""
+    ranks = [{c: i for i, c in enumerate(fallback)} for fallback in fallbacks]
+    return ''.join(sorted(string.ascii_uppercase, key=lambda c: (-counts.get(c, 0),) + tuple(rank[c] for rank in ranks)))
+
+################################################
+# Class Definitions
+################################################
+# Class to hold the letter counts of the phrases
+class LetterStats:
+    """Letter counts overall and per category, and picks conditioned on the phrases consistent with a board"""
+    def __init__(self, digest, overallCounts, categoryCounts, categorySizes):
+        self.digest = digest
+        self.overallCounts = overallCounts # Letter -> number of phrases containing it
+        self.categoryCounts = categoryCounts # Category -> {letter -> number of phrases of the category containing it}
+        self.categorySizes = categorySizes # Category -> number of phrases
+        self.overall = rankLetters(overallCounts) # Ranking over all phrases
+        self.categories = {category: rankLetters(counts, self.overall) for category, counts in categoryCounts.items()}
+        self._picks = {} # Ranking -> tuple of (bit, letter) in rank order
+        self._priors = {} # Category -> tuple of (bit, letter, prior weight) in rank order
+
+    @classmethod
+    def build(cls, phrases, digest=None):
+        """
+        Computes the letter counts of a {category: phrases} dictionary, whose phrases may be iterators.
+        digest identifies the phrases (see phrasesDigest()), which must then be iterated only once.
+        """
+        if digest is None:
+            digest = phrasesDigest(phrases)
+        overallCounts = {}
+        categoryCounts = {}
+        categorySizes = {}
+        for category, categoryPhrases in phrases.items():
+            counts = categoryCounts[category] = {}
+            categorySizes[category] = 0
+            for phrase in categoryPhrases:
+                categorySizes[category] += 1
+                for c in set(phrase):
+                    if c in LETTER_BITS:
+                        overallCounts[c] = overallCounts.get(c, 0) + 1
+                        counts[c] = counts.get(c, 0) + 1
+        return cls(digest, overallCounts, categoryCounts, categorySizes)
+
+    @classmethod
+    def load(cls, phrases, directory, digest=None):
+        """
+        Returns the letter counts of the phrases, read from letter_stats.json in directory or built and saved there.
+        With a digest of the phrases (such as PhraseStore.digest()) the phrases are only iterated to build the counts.
+        """
+        if digest is None:
+            digest = phrasesDigest(phrases)
+        path = os.path.join(directory, FILE_NAME)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == VERSION and data.get('digest') == digest:
+                return cls(digest, data['overall'], data['categories'], data['sizes'])
+        except (OSError, ValueError, KeyError):
+            pass # Missing or unreadable; rebuild it
+        stats = cls.build(phrases, digest)
+        try:
+            stats.save(path)
+        except OSError:
+            pass # A read-only data directory only costs a rebuild per process
+        return stats
+
+    def save(self, path):
+        """Writes the letter counts to a JSON file (atomically)"""
+        tmpPath = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmpPath, 'w') as f:
+            json.dump({'version': VERSION, 'digest': self.digest, 'overall': self.overallCounts,
+                       'categories': self.categoryCounts, 'sizes': self.categorySizes}, f)
+        os.replace(tmpPath, path)
+
+    def ranking(self, category):
+        """Returns the letter ranking of the category (the overall ranking for an unknown category)"""
+        return self.categories.get(category, self.overall)
+
+    def _rankedPick(self, ranking, available):
+        picks = self._picks.get(ranking)
+        if picks is None:
+            picks = self._picks[ranking] = tuple((LETTER_BITS[c], c) for c in ranking)
+        for bit, c in picks:
+            if available & bit:
+                return c
+        return None
+
+    def bestLetter(self, category, obscuredPhrase, guessed, available, phraseIndex=None):
+        """
+        Returns the available letter contained in the most phrases consistent with the board, the category counts
+        weighing as PRIOR_WEIGHT phrases (None if the available mask is empty).
+        guessed is the list of the letters guessed so far and available a mask of LETTER_BITS.
+        """
+        group = phraseIndex.group(category, obscuredPhrase.translate(TEMPLATE_TABLE)) if phraseIndex is not None else None
+        candidates = group.match(obscuredPhrase, guessed) if group is not None else 0
+        if not candidates:
+            return self._rankedPick(self.ranking(category), available)
+        priors = self._priors.get(category)
+        if priors is None:
+            counts, size = self.categoryCounts.get(category, self.overallCounts), self.categorySizes.get(category, 0)
+            weight = PRIOR_WEIGHT / size if size else 0.0
+            priors = self._priors[category] = tuple((LETTER_BITS[c], c, weight * counts.get(c, 0))
+                                                    for c in self.ranking(category))
+        best, bestScore = None, -1.0
+        present = group.present
+        for bit, c, prior in priors:
+            if available & bit:
+                score = (present.get(c, 0) & candidates).bit_count() + prior
+                if score > bestScore: # Ties keep the better ranked letter of the category
+                    best, bestScore = c, score
+        return best
@@ -0,0 +1,192 @@
+################################################
+# Title     : Wheel of Fortune Load Generator
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays many concurrent network sessions against the Wheel of Fortune server (see server.py).
+#             1) Each client opens a connection and plays a number of games in a row, answering every prompt with a
+#                random letter it may still guess. With --humans K the clients are grouped by K: the first one of a
+#                group opens each table and the others take its free seats.
+#             2) The client side latency (move sent -> first answer, join sent -> joined), games per second and the
+#                peak number of open connections are reported as JSON together with the statistics of the server.
+#             3) With --serve the server runs in the same process, e.g. with --pause-scale 0 to measure throughput.
+#             Usage: python -m wheel_of_fortune.loadgen [--clients 1000] [--games 3] [--computers 2] [--serve --pause-scale 0]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .server import DEFAULT_HOST, DEFAULT_PORT, LatencyStats, Server
+from .wheel_of_fortune import LETTERS, VOWELS, VOWEL_COST
+
+################################################
+# Class Definitions
+################################################
+# Class to collect the results of the clients
+class LoadStats:
+    """Counters and latencies of all clients of a run"""
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.errors = 0
+        self.open = 0
+        self.peakOpen = 0
+        self.response = LatencyStats() # Move sent -> first message back
+        self.join = LatencyStats() # Join sent -> joined
+
+    def connected(self):
+        self.open += 1
+        self.peakOpen = max(self.peakOpen, self.open)
+
+    def disconnected(self):
+        self.open -= 1
+
+################################################
+# Function Definitions
+################################################
+# Picks a move for a prompt of the server
+def chooseMove(prompt, rng):
+    """Returns a random consonant (or, if affordable, sometimes a vowel) not guessed yet, or 'pass'"""
+    guessed = set(prompt['guessed'])
+    consonants = [c for c in LETTERS if c not in VOWELS and c not in guessed]
+    vowels = [c for c in VOWELS if c not in guessed] if prompt['money'] >= VOWEL_COST else []
+    if vowels and (not consonants or rng.random() < 0.3):
+        return rng.choice(vowels)
+    return rng.choice(consonants) if consonants else 'pass'
+
+# Sends one message to the server
+def send(writer, message):
+    writer.write((json.dumps(message) + '\n').encode('utf-8'))
+
+# Plays the games of one client
+async def runClient(host, port, name, games, join, tables, stats, rng, think=0.0):
+    """
+    Play games in a row over one connection.
+    join is the join message of a leader (None for a follower); tables[g] is a future with the table id of game g.
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=2**16)
+    stats.connected()
+    try:
+        for game in range(games):
+            if join is not None:
+                send(writer, dict(join, name=name))
+            else:
+                send(writer, {'type': 'join', 'name': name, 'table': await tables[game]})
+            joinedAt = time.perf_counter()
+            movedAt = None
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                message = json.loads(line)
+                if movedAt is not None:
+                    stats.response.add(time.perf_counter() - movedAt)
+                    movedAt = None
+                kind = message['type']
+                if kind == 'joined':
+                    stats.join.add(time.perf_counter() - joinedAt)
+                    if join is not None and not tables[game].done():
+                        tables[game].set_result(message['table'])
+                elif kind == 'prompt':
+                    if think:
+                        await asyncio.sleep(think)
+                    send(writer, {'type': 'move', 'move': chooseMove(message, rng)})
+                    movedAt = time.perf_counter()
+                elif kind == 'error':
+                    stats.errors += 1
+                elif kind == 'result':
+                    if join is not None: # Every seat gets the result; the leader counts the game once
+                        stats.games += 1
+                    if message['winner'] == name:
+                        stats.wins += 1
+                    break
+    finally:
+        stats.disconnected()
+        writer.close()
+
+# Fetches the statistics of the server
+async def fetchServerStats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    send(writer, {'type': 'stats'})
+    stats = json.loads(await reader.readline())
+    writer.close()
+    return stats
+
+# Runs the clients and returns the report
+async def runLoad(host=DEFAULT_HOST, port=DEFAULT_PORT, clients=100, games=3, humans=1, computers=2, level=5,
+                  seed=0, think=0.0):
+    """Play games with clients concurrent sessions and summarize the client and server statistics"""
+    rng = random.Random(seed)
+    stats = LoadStats()
+    loop = asyncio.get_running_loop()
+    join = {'type': 'join', 'humans': humans, 'computers': computers, 'level': level}
+    tasks = []
+    for first in range(0, clients, humans):
+        tables = [loop.create_future() for _ in range(games)]
+        for i in range(first, min(first + humans, clients)):
+            tasks.append(runClient(host, port, 'Player {}'.format(i+1), games, join if i == first else None, tables,
+                                   stats, random.Random(rng.getrandbits(64)), think))
+    start = time.perf_counter()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    failures = [repr(result) for result in results if isinstance(result, BaseException)]
+    return {
+        'clients': clients,
+        'humans_per_table': humans,
+        'computers_per_table': computers,
+        'games': stats.games,
+        'wins': stats.wins,
+        'errors': stats.errors,
+        'failed_clients': len(failures),
+        'first_failure': failures[0] if failures else None,
+        'peak_connections': stats.peakOpen,
+        'elapsed_s': elapsed,
+        'games_per_s': stats.games / elapsed if elapsed else 0.0,
+        'latency': {'response': stats.response.summary(), 'join': stats.join.summary()},
+        'server': await fetchServerStats(host, port),
+    }
+
+# Runs the load, optionally against a server in this process
+async def main(args):
+    if not args.serve:
+        return await runLoad(args.host, args.port, args.clients, args.games, args.humans, args.computers, args.level, args.seed, args.think)
+    listening = asyncio.get_running_loop().create_future()
+    server = asyncio.create_task(Server(args.pause_scale).serve(args.host, args.port, listening.set_result))
+    await listening
+    try:
+        return await runLoad(args.host, args.port, args.clients, args.games, args.humans, args.computers, args.level, args.seed, args.think)
+    finally:
+        server.cancel()
+
+################################################
+# Load Generator Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play concurrent network sessions against the Wheel of Fortune server and report latency as JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=100, help="Concurrent sessions")
+    parser.add_argument("--games", type=int, default=3, help="Games played in a row by each session")
+    parser.add_argument("--humans", type=int, default=1, help="Network seats per table")
+    parser.add_argument("--computers", type=int, default=2, help="Computer seats per table")
+    parser.add_argument("--level", type=int, default=5, help="Level of the computer seats")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--think", type=float, default=0.0, help="Seconds each client waits before answering a prompt")
+    parser.add_argument("--serve", action="store_true", help="Run the server in this process")
+    parser.add_argument("--pause-scale", type=float, default=1.0, help="Pause scale of the server started with --serve")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,125 @@
+################################################
+# Title     : Wheel of Fortune Phrase Index
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Finds the phrases of a category that are still consistent with an obscured board.
+#             1) Phrases are grouped by category and template: the phrase with every letter replaced by '_',
+#                which fixes the number of words, their lengths and the punctuation.
+#             2) The phrases of a group are numbered and, per (position, letter) and per (letter, number of
+#                occurrences), the set of phrases is kept as an integer bitset. A group is only built the first time
+#                it is looked up.
+#             3) A lookup intersects one bitset per revealed letter and one per guessed letter, so its cost depends on
+#                the length of the phrase and not on the number of phrases in the corpus.
+#             4) An index of a PhraseStore keeps the numbers of the phrases in the store rather than the phrases, and
+#                only decodes them to find the templates of a category (on its first lookup) and to build a group.
+#
+# All Rights Reserved.
+################################################
+
+import string
+
+# Table mapping every letter to '_'; applied to a phrase or an obscured phrase it gives the template
+TEMPLATE_TABLE = str.maketrans(string.ascii_uppercase, '_' * len(string.ascii_uppercase))
+
+################################################
+# Class Definitions
+################################################
+# Class to hold the bitsets of the phrases sharing a category and a template
+class PhraseGroup:
+    """Phrases of one category and template with their per-position and per-count letter bitsets"""
+    __slots__ = ('phrases', 'everything', 'positions', 'present', 'counts')
+    def __init__(self, phrases):
+        self.phrases = tuple(dict.fromkeys(phrases))
+        self.everything = (1 << len(self.phrases)) - 1
+        self.positions = {} # (position, letter) -> phrases with the letter at the position
+        self.present = {} # letter -> phrases containing the letter
+        self.counts = {} # (letter, count) -> phrases containing the letter exactly count times
+        for i, phrase in enumerate(self.phrases):
+            bit = 1 << i
+            letterCounts = {}
+            for position, c in enumerate(phrase):
+                if c in string.ascii_uppercase:
+                    self.positions[(position, c)] = self.positions.get((position, c), 0) | bit
+                    letterCounts[c] = letterCounts.get(c, 0) + 1
+            for c, count in letterCounts.items():
+                self.present[c] = self.present.get(c, 0) | bit
+                self.counts[(c, count)] = self.counts.get((c, count), 0) | bit
+
+    def match(self, obscuredPhrase, guessed):
+        """Returns the bitset of the phrases showing obscuredPhrase after the guessed letters"""
+        candidates = self.everything
+        for position, c in enumerate(obscuredPhrase):
+            if c != '_' and c in string.ascii_uppercase:
+                candidates &= self.positions.get((position, c), 0)
+                if not candidates:
+                    return 0
+        # A guessed letter is revealed at every one of its positions, so its count on the board is its exact count
+        for c in guessed:
+            count = obscuredPhrase.count(c)
+            if count:
+                candidates &= self.counts.get((c, count), 0)
+            else:
+                candidates ^= candidates & self.present.get(c, 0)
+        return candidates
+
+# Class to find the phrases consistent with a board
+class PhraseIndex:
+    """Index of the phrases of every category by template; categories and groups are indexed on first use"""
+    def __init__(self, phrases, lookup=None):
+        """
+        Indexes a {category: phrases} dictionary. With lookup, the phrases of a category are given as keys (such as
+        the numbers of the phrases of a PhraseStore) and lookup(key) returns the phrase.
+        """
+        self._lookup = lookup
+        self._categories = dict(phrases) # Category -> phrases or keys, until its templates are found
+        self._templates = {} # (category, template) -> list of phrases or keys, until the group is built
+        self._groups = {} # (category, template) -> PhraseGroup
+
+    @classmethod
+    def fromStore(cls, store):
+        """Returns the index of the phrases of a PhraseStore, decoded from the store when needed"""
+        return cls({category: range(first, first + count) for category, (first, count) in store.ranges.items()},
+                   store.phrase)
+
+    def _indexCategory(self, category):
+        lookup = self._lookup
+        for key in self._categories.pop(category):
+            phrase = key if lookup is None else lookup(key)
+            self._templates.setdefault((category, phrase.translate(TEMPLATE_TABLE)), []).append(key)
+
+    def group(self, category, template):
+        """Returns the PhraseGroup of a category and template (None if no phrase has the template)"""
+        key = (category, template)
+        group = self._groups.get(key)
+        if group is None:
+            if category in self._categories:
+                self._indexCategory(category)
+            keys = self._templates.pop(key, None)
+            if keys is None:
+                return None
+            phrases = keys if self._lookup is None else [self._lookup(k) for k in keys]
+            group = self._groups[key] = PhraseGroup(phrases)
+        return group
+
+    def candidates(self, category, obscuredPhrase, guessed, limit=None):
+        """
+        Returns the number of phrases of a category consistent with the board and the list of those phrases
+        (an empty list if there are more than limit of them).
+        Hidden letters of obscuredPhrase are '_' and guessed is the list of the letters guessed so far.
+        """
+        group = self.group(category, obscuredPhrase.translate(TEMPLATE_TABLE))
+        if group is None:
+            return 0, []
+        mask = group.match(obscuredPhrase, guessed)
+        count = mask.bit_count()
+        if limit is not None and count > limit:
+            return count, []
+        phrases = []
+        while mask:
+            low = mask & -mask
+            phrases.append(group.phrases[low.bit_length() - 1])
+            mask ^= low
+        return count, phrases
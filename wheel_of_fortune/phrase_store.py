@@ -0,0 +1,202 @@
+################################################
+# Title     : Wheel of Fortune Phrase Store
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Compact binary store of the phrases of phrases.json, read through a memory map.
+#             1) A store file is a header, a table of categories (first phrase, number of phrases, name length), the
+#                category names, the offsets of the phrases (one more than there are phrases) and a blob holding the
+#                upper-cased phrases back to back, all in UTF-8.
+#             2) Opening a store maps the file and only parses the header and the category table, so the time to open
+#                it and the memory it takes do not grow with the number of phrases. Picking a random phrase of a
+#                category reads two offsets and decodes one phrase.
+#             3) The store records the modification time and size of the phrases.json it was compiled from, so it is
+#                recompiled when phrases.json changes. Without phrases.json the store is used as is.
+#             4) Random picks draw the same numbers as random.choice() on the categories and their phrases, so a
+#                seeded game picks the same phrase from the store as from phrases.json.
+#             5) The phrase index and the letter counts of the computer players are built from the store (see
+#                game_data.py), so phrases.json is only parsed to compile it.
+#             Usage: python -m wheel_of_fortune.phrase_store [PHRASES_JSON] [--output PHRASES_BIN]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import random
+import struct
+
+MAGIC = b'WOFPHRS\0'
+VERSION = 1
+FILE_NAME = 'phrases.bin'
+# Magic, version, number of categories, number of phrases, modification time (ns) and size of the source file
+HEADER = struct.Struct('<8sHHIqq')
+CATEGORY = struct.Struct('<III') # First phrase, number of phrases and length of the name
+OFFSET = struct.Struct('<Q') # Offset of a phrase in the blob
+OFFSETS = struct.Struct('<QQ') # Offsets of a phrase and of the next one
+
+################################################
+# Class Definitions
+################################################
+# Class to read the phrases of a store file
+class PhraseStore:
+    """Categories and phrases of a store held in a buffer (a memory map of the file, or bytes)"""
+    def __init__(self, data, path=None):
+        self.data = data
+        self.path = path
+        if len(data) < HEADER.size:
+            raise ValueError('{} is not a phrase store'.format(path))
+        magic, version, numCategories, self.numPhrases, mtime, size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} phrase store'.format(path, VERSION))
+        self.source = (mtime, size) if size >= 0 else None # Stamp of the phrases.json it was compiled from
+        table = [CATEGORY.unpack_from(data, HEADER.size + i * CATEGORY.size) for i in range(numCategories)]
+        offset = HEADER.size + numCategories * CATEGORY.size
+        self.categories = []
+        self.ranges = {} # Category -> (first phrase, number of phrases)
+        for first, count, nameLength in table:
+            category = bytes(data[offset:offset + nameLength]).decode('utf-8')
+            offset += nameLength
+            self.categories.append(category)
+            self.ranges[category] = (first, count)
+        self.categories = tuple(self.categories)
+        self.offsetsStart = offset
+        self.blobStart = offset + (self.numPhrases + 1) * OFFSET.size
+        if len(data) < self.blobStart + OFFSET.unpack_from(data, offset + self.numPhrases * OFFSET.size)[0]:
+            raise ValueError('{} is truncated'.format(path))
+
+    @classmethod
+    def open(cls, path):
+        """Maps a store file"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError('{} is not a phrase store'.format(path))
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, path)
+
+    def phrase(self, index):
+        """Returns the phrase with a global index"""
+        start, end = OFFSETS.unpack_from(self.data, self.offsetsStart + index * OFFSET.size)
+        return self.data[self.blobStart + start:self.blobStart + end].decode('utf-8')
+
+    def iterPhrases(self, category):
+        """Yields the phrases of a category one at a time"""
+        first, count = self.ranges[category]
+        for i in range(first, first + count):
+            yield self.phrase(i)
+
+    def phrases(self, category):
+        """Returns the tuple of phrases of a category (decodes all of them)"""
+        return tuple(self.iterPhrases(category))
+
+    def digest(self):
+        """Returns a hex digest of the categories and phrases (not of the source stamp in the header)"""
+        return hashlib.sha256(memoryview(self.data)[HEADER.size:]).hexdigest()
+
+    def toDict(self):
+        """Returns a {category: tuple of phrases} dictionary of the whole store"""
+        return {category: self.phrases(category) for category in self.categories}
+
+    def randomPhrase(self, category, rng=random):
+        """Returns a random phrase of a category"""
+        first, count = self.ranges[category]
+        return self.phrase(first + rng.randrange(count))
+
+    def randomCategoryAndPhrase(self, rng=random):
+        """Returns a tuple with a random category and one of its phrases"""
+        category = rng.choice(self.categories)
+        return (category, self.randomPhrase(category, rng))
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+################################################
+# Function Definitions
+################################################
+# Returns the stamp identifying a version of a file
+def sourceStamp(path):
+    """Returns (modification time in ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Serializes phrases into the store format
+def compilePhrases(phrases, source=None):
+    """
+    Returns the store of a {category: phrases} dictionary as bytes; phrases are upper-cased.
+    source is the stamp of the file the phrases were read from (see sourceStamp()).
+    """
+    table, names, offsets, blob = [], [], [0], []
+    end = 0
+    for category, categoryPhrases in phrases.items():
+        name = category.encode('utf-8')
+        table.append(CATEGORY.pack(len(offsets) - 1, len(categoryPhrases), len(name)))
+        names.append(name)
+        for phrase in categoryPhrases:
+            encoded = phrase.upper().encode('utf-8')
+            blob.append(encoded)
+            end += len(encoded)
+            offsets.append(end)
+    mtime, size = source if source is not None else (0, -1)
+    header = HEADER.pack(MAGIC, VERSION, len(table), len(offsets) - 1, mtime, size)
+    return b''.join([header] + table + names + [struct.pack('<{}Q'.format(len(offsets)), *offsets)] + blob)
+
+# Writes a store file
+def writeStore(data, storePath):
+    """Writes the bytes of a store to a file (atomically)"""
+    tmpPath = '{}.{}.tmp'.format(storePath, os.getpid())
+    with open(tmpPath, 'wb') as f:
+        f.write(data)
+    os.replace(tmpPath, storePath)
+
+# Compiles a phrases.json file
+def compileFile(jsonPath):
+    """Returns the store of a phrases.json file as bytes"""
+    source = sourceStamp(jsonPath)
+    with open(jsonPath, 'r') as f:
+        return compilePhrases(json.load(f), source)
+
+# Opens the store of a phrases.json file, compiling it if needed
+def openStore(jsonPath, storePath):
+    """
+    Returns the PhraseStore of jsonPath, mapped from storePath. The store is (re)compiled if it is missing, unreadable
+    or older than jsonPath; without jsonPath, storePath is opened as is.
+    """
+    source = sourceStamp(jsonPath)
+    try:
+        store = PhraseStore.open(storePath)
+        if source is None or store.source == source:
+            return store
+        store.close()
+    except (OSError, ValueError):
+        if source is None:
+            raise
+    data = compileFile(jsonPath)
+    try:
+        writeStore(data, storePath)
+    except OSError:
+        return PhraseStore(data) # A read-only data directory keeps the store in memory
+    return PhraseStore.open(storePath)
+
+################################################
+# Phrase Store Compiler
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile a Wheel of Fortune phrases.json into a binary phrase store.")
+    parser.add_argument("phrases", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'phrases.json'))
+    parser.add_argument("--output", default=None, help="Store file (default: phrases.bin next to the phrases)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(args.phrases)), FILE_NAME)
+    writeStore(compileFile(args.phrases), output)
+    store = PhraseStore.open(output)
+    print(json.dumps({'store': output, 'bytes': os.path.getsize(output), 'categories': len(store.categories),
+                      'phrases': store.numPhrases}, indent=2))
@@ -0,0 +1,388 @@
+################################################
+# Title     : Wheel of Fortune Server
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Hosts many concurrent tables of Wheel of Fortune over a line-based JSON protocol on TCP.
+#             1) Every message is a JSON object on one line. A client opens a table with
+#                {"type": "join", "name": N, "humans": H, "computers": C, "level": L}, takes a free seat of an open table
+#                with {"type": "join", "name": N, "table": ID} and answers each "prompt" with {"type": "move", "move": M}.
+#                {"type": "stats"} (add "tables": true for the per-table statistics) can be sent at any time.
+#             2) The server sends "joined", "message" (the game output), "prompt", "error", "result" and "stats" messages.
+#                After a "result" the session may join another table.
+#             3) Each table runs Game.steps() in its own task: the pauses are asyncio.sleep timers, computer seats are
+#                WOFComputerPlayer and human seats wait for the moves of their session without blocking other tables.
+#                A seat whose session is gone passes; a table without connected humans is abandoned.
+#             4) Statistics: active, waiting and peak tables and sessions, games finished, the latency of the server
+#                answering a move and the time the players take to move, overall and per table.
+#             Usage: python -m wheel_of_fortune.server [--host 127.0.0.1] [--port 8765] [--pause-scale 1.0]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import asyncio
+import collections
+import json
+import time
+
+from .wheel_of_fortune import Game, WOFComputerPlayer, WOFPlayer, checkMove, requestPlayerMove
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MOVE_PAUSE = 0.1 # Seconds before each move request, as in requestPlayerMove()
+MOVE_TIMEOUT = 60.0 # Seconds a human seat has to move before it passes
+MAX_TURNS = 200 # Spins after which a game ends without a winner
+SAMPLE_WINDOW = 10000 # Latency samples kept per statistic for the percentiles
+
+################################################
+# Function Definitions
+################################################
+# Does nothing; stands in for time.sleep when a computer move is requested
+def discard(*args):
+    """Ignore all arguments"""
+    pass
+
+################################################
+# Class Definitions
+################################################
+# Class to keep a window of latency samples
+class LatencyStats:
+    """Count of the samples and percentiles over the last SAMPLE_WINDOW of them, in milliseconds"""
+    def __init__(self):
+        self.count = 0
+        self.samples = collections.deque(maxlen=SAMPLE_WINDOW)
+
+    def add(self, seconds):
+        self.count += 1
+        self.samples.append(seconds)
+
+    def summary(self):
+        """Returns the count and the p50, p99 and max of the window of samples"""
+        ordered = sorted(self.samples)
+        def rank(q):
+            return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1e3 if ordered else 0.0
+        return {'count': self.count, 'p50_ms': rank(0.50), 'p99_ms': rank(0.99), 'max_ms': ordered[-1] * 1e3 if ordered else 0.0}
+
+# Class to represent a Wheel of Fortune player connected over the network
+class WOFNetworkPlayer(WOFPlayer):
+    def __init__(self, name, session):
+        super().__init__(name)
+        self.session = session
+
+# Class to represent the connection of a client
+class Session:
+    """
+    One client connection; moves are handed to its table through a queue.
+    Messages sent during one pass of the event loop are written to the socket together.
+    """
+    def __init__(self, writer):
+        self.writer = writer
+        self.pending = [] # Encoded messages not written yet
+        self.player = None # WOFNetworkPlayer of the current table
+        self.table = None
+        self.awaitingMove = False
+        self.moves = asyncio.Queue() # (move, receive time); None once the session is closed
+        self.closed = False
+
+    def send(self, message):
+        """Queue a message for the client"""
+        self.sendEncoded((json.dumps(message) + '\n').encode('utf-8'))
+
+    def sendEncoded(self, data):
+        """Queue an already encoded message line for the client"""
+        if self.closed:
+            return
+        if not self.pending:
+            asyncio.get_running_loop().call_soon(self.flush)
+        self.pending.append(data)
+
+    def flush(self):
+        """Write the queued messages in one go"""
+        if not self.closed:
+            self.writer.write(b''.join(self.pending))
+        self.pending.clear()
+
+    def receiveMove(self, move, receivedAt):
+        """Hand a move to the table if it is waiting for one"""
+        if not self.awaitingMove:
+            self.send({'type': 'error', 'message': 'It is not your turn'})
+            return
+        self.awaitingMove = False
+        self.moves.put_nowait((move, receivedAt))
+
+    def close(self):
+        self.closed = True
+        self.moves.put_nowait(None)
+
+# Class to represent one table
+class Table:
+    """A game between network and computer seats, played in its own task"""
+    WAITING = 'waiting'
+    PLAYING = 'playing'
+    FINISHED = 'finished'
+    ABANDONED = 'abandoned'
+
+    def __init__(self, server, tableId, humans, computers, level):
+        self.server = server
+        self.tableId = tableId
+        self.humans = humans # Human seats to fill before the game starts
+        self.sessions = []
+        self.computers = [WOFComputerPlayer('Computer {}'.format(i+1), level, output=self.broadcast) for i in range(computers)]
+        self.state = self.WAITING
+        self.ready = asyncio.Event()
+        self.game = None
+        self.response = LatencyStats() # Move received -> move applied and answered
+        self.think = LatencyStats() # Prompt sent -> move received
+        self.task = None
+
+    def seat(self, session, name):
+        """Seat a session and return True; the game starts once every human seat is taken (False if none is left)"""
+        if self.state != self.WAITING or len(self.sessions) >= self.humans:
+            session.send({'type': 'error', 'message': 'Table {} has no free seat'.format(self.tableId)})
+            return False
+        session.player = WOFNetworkPlayer(name, session)
+        session.table = self
+        self.sessions.append(session)
+        session.send({'type': 'joined', 'table': self.tableId, 'seat': len(self.sessions) - 1, 'humans': self.humans,
+                      'computers': len(self.computers)})
+        if len(self.sessions) == self.humans:
+            self.state = self.PLAYING # No longer open to joins, even before run() resumes
+            self.ready.set()
+        return True
+
+    def leave(self, session):
+        """Free the seat of a session that closed before the game started"""
+        self.sessions.remove(session)
+        if not self.sessions:
+            self.task.cancel()
+            self.state = self.ABANDONED
+            self.server.finishTable(self)
+
+    def broadcast(self, text):
+        """Send a line of game output to every human seat"""
+        data = (json.dumps({'type': 'message', 'text': text}) + '\n').encode('utf-8')
+        for session in self.sessions:
+            session.sendEncoded(data)
+
+    def connected(self):
+        return any(not session.closed for session in self.sessions)
+
+    async def requestMove(self, player):
+        """Returns a valid move of a player and the time it was received (None for computer moves)"""
+        board = self.game.board
+        pause = MOVE_PAUSE * self.server.pauseScale
+        if not isinstance(player, WOFNetworkPlayer):
+            await asyncio.sleep(pause)
+            return requestPlayerMove(player, board.category, board.guessed, board.phrase, discard, self.broadcast, board), None
+        session = player.session
+        while True:
+            await asyncio.sleep(pause)
+            if session.closed:
+                self.broadcast('{} left the table'.format(player.name))
+                return 'PASS', None
+            session.awaitingMove = True
+            session.send({'type': 'prompt', 'category': board.category, 'phrase': board.obscured(),
+                          'guessed': sorted(board.guessed), 'money': player.prizeMoney})
+            promptedAt = time.perf_counter()
+            try:
+                received = await asyncio.wait_for(session.moves.get(), self.server.moveTimeout)
+            except asyncio.TimeoutError:
+                session.awaitingMove = False
+                self.broadcast('{} ran out of time'.format(player.name))
+                return 'PASS', None
+            if received is None: # The session closed while waiting
+                continue
+            move, receivedAt = received
+            self.think.add(receivedAt - promptedAt)
+            self.server.think.add(receivedAt - promptedAt)
+            self.broadcast('move: {}'.format(move))
+            move = move.upper()
+            if move == 'EXIT' or move == 'PASS':
+                return move, receivedAt
+            error = checkMove(player, move, board)
+            if error is None:
+                return move, receivedAt
+            session.send({'type': 'error', 'message': error})
+
+    def recordResponse(self, receivedAt):
+        """Record the time from receiving a move to having sent its outcome"""
+        elapsed = time.perf_counter() - receivedAt
+        self.response.add(elapsed)
+        self.server.response.add(elapsed)
+
+    async def run(self):
+        """Wait for the human seats, play the game and send the result"""
+        await self.ready.wait()
+        self.state = self.PLAYING
+        players = [session.player for session in self.sessions] + self.computers
+        self.game = Game(players, sleep=discard, output=self.broadcast, maxTurns=self.server.maxTurns)
+        steps = self.game.steps()
+        reply, receivedAt = None, None
+        try:
+            while True:
+                step, value = steps.send(reply) # Plays up to the next pause or move; its output is already sent
+                if receivedAt is not None:
+                    self.recordResponse(receivedAt)
+                if not self.connected():
+                    self.state = self.ABANDONED
+                    steps.close()
+                    break
+                if step == Game.PAUSE:
+                    await asyncio.sleep(value * self.server.pauseScale)
+                    reply, receivedAt = None, None
+                else:
+                    reply, receivedAt = await self.requestMove(value)
+        except StopIteration:
+            if receivedAt is not None:
+                self.recordResponse(receivedAt)
+            self.state = self.FINISHED
+        winner = self.game.winner
+        result = {'type': 'result', 'table': self.tableId, 'state': self.state, 'phrase': self.game.phrase,
+                  'winner': winner.name if winner else None, 'turns': self.game.turns,
+                  'money': {player.name: player.prizeMoney for player in players}}
+        for session in self.sessions:
+            session.send(result)
+            session.table = None
+            session.player = None
+        self.server.finishTable(self)
+
+    def summary(self):
+        """Returns the statistics of the table"""
+        return {'table': self.tableId, 'state': self.state, 'humans': self.humans, 'computers': len(self.computers),
+                'turns': self.game.turns if self.game else 0, 'response': self.response.summary(), 'think': self.think.summary()}
+
+# Class to host the tables
+class Server:
+    """asyncio TCP server hosting concurrent tables"""
+    def __init__(self, pauseScale=1.0, moveTimeout=MOVE_TIMEOUT, maxTurns=MAX_TURNS):
+        self.pauseScale = pauseScale # Multiplies every pause of the games (0 disables them)
+        self.moveTimeout = moveTimeout
+        self.maxTurns = maxTurns
+        self.tables = {} # Table id -> Table, while waiting or playing
+        self.nextTableId = 1
+        self.peakTables = 0
+        self.finished = 0
+        self.abandoned = 0
+        self.sessions = 0
+        self.peakSessions = 0
+        self.totalSessions = 0
+        self.response = LatencyStats()
+        self.think = LatencyStats()
+        self.started = time.perf_counter()
+
+    def join(self, session, message):
+        """Seat a session at a new table or at a free seat of an open one"""
+        if session.table is not None:
+            session.send({'type': 'error', 'message': 'Already seated at table {}'.format(session.table.tableId)})
+            return
+        name = message.get('name')
+        if not isinstance(name, str) or not name:
+            session.send({'type': 'error', 'message': 'join needs a name'})
+            return
+        if 'table' in message:
+            table = self.tables.get(message['table']) if isinstance(message['table'], int) else None
+            if table is None:
+                session.send({'type': 'error', 'message': 'Table {} has no free seat'.format(message['table'])})
+                return
+            table.seat(session, name)
+            return
+        humans, computers, level = message.get('humans', 1), message.get('computers', 1), message.get('level', 5)
+        if not all(isinstance(n, int) for n in (humans, computers, level)) or not (1 <= humans <= 10 and 0 <= computers <= 10 and 1 <= level <= 10):
+            session.send({'type': 'error', 'message': 'humans must be 1-10, computers 0-10 and level 1-10'})
+            return
+        table = Table(self, self.nextTableId, humans, computers, level)
+        self.nextTableId += 1
+        self.tables[table.tableId] = table
+        self.peakTables = max(self.peakTables, len(self.tables))
+        table.seat(session, name)
+        table.task = asyncio.create_task(table.run())
+
+    def finishTable(self, table):
+        del self.tables[table.tableId]
+        if table.state == Table.FINISHED:
+            self.finished += 1
+        else:
+            self.abandoned += 1
+
+    def stats(self, perTable=False):
+        """Returns the aggregate statistics and, if perTable is set, those of every active table"""
+        uptime = time.perf_counter() - self.started
+        waiting = sum(1 for table in self.tables.values() if table.state == Table.WAITING)
+        stats = {
+            'type': 'stats',
+            'uptime_s': uptime,
+            'tables': {'active': len(self.tables) - waiting, 'waiting': waiting, 'peak': self.peakTables,
+                       'finished': self.finished, 'abandoned': self.abandoned},
+            'sessions': {'active': self.sessions, 'peak': self.peakSessions, 'total': self.totalSessions},
+            'games_per_s': self.finished / uptime if uptime else 0.0,
+            'latency': {'response': self.response.summary(), 'think': self.think.summary()},
+        }
+        if perTable:
+            stats['per_table'] = [table.summary() for table in self.tables.values()]
+        return stats
+
+    async def handle(self, reader, writer):
+        """Serve one client connection"""
+        session = Session(writer)
+        self.sessions += 1
+        self.totalSessions += 1
+        self.peakSessions = max(self.peakSessions, self.sessions)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                receivedAt = time.perf_counter()
+                try:
+                    message = json.loads(line)
+                    kind = message['type']
+                except (ValueError, KeyError, TypeError):
+                    session.send({'type': 'error', 'message': 'Messages are JSON objects with a type'})
+                    continue
+                if kind == 'join':
+                    self.join(session, message)
+                elif kind == 'move' and isinstance(message.get('move'), str):
+                    session.receiveMove(message['move'], receivedAt)
+                elif kind == 'stats':
+                    session.send(self.stats(message.get('tables', False)))
+                else:
+                    session.send({'type': 'error', 'message': 'Unknown message {}'.format(kind)})
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError): # Cancelled when the server shuts down
+            pass
+        finally:
+            session.close()
+            if session.table is not None and session.table.state == Table.WAITING:
+                session.table.leave(session)
+            self.sessions -= 1
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, ready=None):
+        """Serve clients until cancelled; ready, if given, is called with the listening asyncio server"""
+        server = await asyncio.start_server(self.handle, host, port, limit=2**16)
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+################################################
+# Server Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host concurrent Wheel of Fortune tables over a line-based JSON protocol.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--pause-scale", type=float, default=1.0, help="Multiplies the pauses of the games (0 disables them)")
+    parser.add_argument("--move-timeout", type=float, default=MOVE_TIMEOUT, help="Seconds a human seat has to move before it passes")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="Spins after which a game ends without a winner")
+    args = parser.parse_args()
+
+    server = Server(args.pause_scale, args.move_timeout, args.max_turns)
+    print('Serving Wheel of Fortune on {}:{}'.format(args.host, args.port))
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
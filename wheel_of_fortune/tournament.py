@@ -0,0 +1,189 @@
+################################################
+# Title     : Wheel of Fortune Tournament
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays headless games between computer players to tune the difficulty levels from data.
+#             1) Every game seats one WOFComputerPlayer per entry of the level list. The seat order is rotated from
+#                game to game, so no level always spins first.
+#             2) Games run without pauses or output and are split across worker processes; each worker returns
+#                counts only, so the memory used does not grow with the number of games.
+#             3) Win rate and average winnings per level, turns (spins) per game and games per second are
+#                reported as JSON.
+#             4) With --journal DIR every task writes the events of its games to its own journal file in DIR
+#                (see journal.py).
+#             5) Every game draws from its own random generator, seeded from the tournament seed and the game number
+#                only, and gives one generator spawned from it to each player. The report of a seed is the same for any
+#                number of workers and any chunk size.
+#             6) Computer players from EV_LEVEL on score their moves with the expected value engine (see ev.py). Its time
+#                budget per move is 0 by default (one batch of rollouts per move), so a seed always gives the same report.
+#             Usage: python -m wheel_of_fortune.tournament [--games N] [--levels 1,5,10] [--seed S] [--workers W] [--journal DIR] [--ev-budget SECONDS]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import os
+import random
+import time
+
+from .game_data import getGameData
+from .journal import Journal
+from .wheel_of_fortune import EV_LEVEL, Game, WOFComputerPlayer
+
+MAX_TURNS = 200 # Spins after which a game ends without a winner (e.g. every player can only pass)
+
+################################################
+# Function Definitions
+################################################
+# Does nothing; stands in for print and time.sleep in headless games
+def discard(*args):
+    """Ignore all arguments"""
+    pass
+
+# Returns the journal file of a task
+def journalPath(journalDir, firstGame):
+    """Returns the path of the journal of the games numbered from firstGame"""
+    return os.path.join(journalDir, 'journal-{:010d}.bin'.format(firstGame))
+
+# Returns the random generator of a game
+def gameRandom(seed, game):
+    """Returns a random.Random seeded from a digest of the tournament seed and the game number"""
+    digest = hashlib.sha256('{}/{}'.format(seed, game).encode('ascii')).digest()
+    return random.Random(int.from_bytes(digest, 'little'))
+
+# Plays a number of computer-only games and returns their counts
+def playGames(levels, firstGame, numGames, seed, maxTurns=MAX_TURNS, journalDir=None, evBudget=0.0):
+    """
+    Play numGames headless games numbered from firstGame of a tournament seeded with seed, journaling them in
+    journalDir if given. evBudget is the time budget per move of the expected value engine.
+    Returns a dictionary with the seats, wins, winnings and final money per seat of the level list,
+    the histogram of turns per game and the number of games without a winner.
+    """
+    evEngine = None
+    if max(levels) >= EV_LEVEL:
+        from .ev import EVEngine
+        evEngine = EVEngine(getGameData().getWheel()[0], evBudget)
+    seats = [0] * len(levels)
+    wins = [0] * len(levels)
+    winnings = [0] * len(levels) # Prize money of the winners
+    money = [0] * len(levels) # Prize money of every seat at the end of a game
+    turns = {}
+    unfinished = 0
+    with Journal(journalPath(journalDir, firstGame)) if journalDir else contextlib.nullcontext() as journal:
+        for game in range(firstGame, firstGame + numGames):
+            rotation = game % len(levels)
+            order = list(range(rotation, len(levels))) + list(range(rotation))
+            rng = gameRandom(seed, game)
+            players = [WOFComputerPlayer('Computer {}'.format(seat+1), levels[seat], output=discard, evEngine=evEngine,
+                                         rng=random.Random(rng.getrandbits(128))) for seat in order]
+            wofGame = Game(players, sleep=discard, output=discard, maxTurns=maxTurns, journal=journal, gameId=game, rng=rng)
+            winner = wofGame.play()
+            for seat, player in zip(order, players):
+                seats[seat] += 1
+                money[seat] += player.prizeMoney
+                if player is winner:
+                    wins[seat] += 1
+                    winnings[seat] += player.prizeMoney
+            if not winner:
+                unfinished += 1
+            turns[wofGame.turns] = turns.get(wofGame.turns, 0) + 1
+    return {'seats': seats, 'wins': wins, 'winnings': winnings, 'money': money, 'turns': turns, 'unfinished': unfinished}
+
+# Runs the tournament and returns the report
+def runTournament(levels, games=10000, seed=0, workers=None, chunkSize=1000, maxTurns=MAX_TURNS, journalDir=None, evBudget=0.0):
+    """Play computer-only games across worker processes and summarize them per level"""
+    workers = workers or os.cpu_count() or 1
+    if journalDir:
+        os.makedirs(journalDir, exist_ok=True)
+    totals = {'seats': [0] * len(levels), 'wins': [0] * len(levels), 'winnings': [0] * len(levels),
+              'money': [0] * len(levels), 'turns': {}, 'unfinished': 0}
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(playGames, levels, first, min(chunkSize, games - first), seed, maxTurns, journalDir,
+                                   evBudget)
+                   for first in range(0, games, chunkSize)]
+        for future in futures:
+            counts = future.result()
+            for key in ('seats', 'wins', 'winnings', 'money'):
+                totals[key] = [a + b for a, b in zip(totals[key], counts[key])]
+            for turnCount, n in counts['turns'].items():
+                totals['turns'][turnCount] = totals['turns'].get(turnCount, 0) + n
+            totals['unfinished'] += counts['unfinished']
+    elapsed = time.perf_counter() - start
+
+    # Seats with the same level are reported together
+    byLevel = {}
+    for seat, level in enumerate(levels):
+        entry = byLevel.setdefault(level, {'seats': 0, 'wins': 0, 'winnings': 0, 'money': 0})
+        for key in entry:
+            entry[key] += totals[key][seat]
+    report = {}
+    for level, entry in sorted(byLevel.items()):
+        report[str(level)] = {
+            'seats': entry['seats'],
+            'wins': entry['wins'],
+            'win_rate': entry['wins'] / entry['seats'] if entry['seats'] else 0.0,
+            'mean_winnings': entry['winnings'] / entry['wins'] if entry['wins'] else 0.0,
+            'mean_money': entry['money'] / entry['seats'] if entry['seats'] else 0.0,
+        }
+
+    turnCounts = sorted(totals['turns'].items())
+    numGames = sum(n for _, n in turnCounts)
+    def turnPercentile(q):
+        rank = max(1, -(-numGames * q // 100))
+        seen = 0
+        for turnCount, n in turnCounts:
+            seen += n
+            if seen >= rank:
+                return turnCount
+        return 0
+    return {
+        'levels': levels,
+        'games': numGames,
+        'workers': workers,
+        'seed': seed,
+        'unfinished': totals['unfinished'],
+        'by_level': report,
+        'turns': {
+            'mean': sum(turnCount * n for turnCount, n in turnCounts) / numGames if numGames else 0.0,
+            'p50': turnPercentile(50),
+            'p99': turnPercentile(99),
+            'max': turnCounts[-1][0] if turnCounts else 0,
+        },
+        'elapsed_s': elapsed,
+        'games_per_s': numGames / elapsed if elapsed else 0.0,
+    }
+
+################################################
+# Tournament Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play headless computer-only Wheel of Fortune games and report per-level statistics as JSON.")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--levels", default="1,5,10", help="Comma separated levels (1-10), one computer player per entry")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Games per task sent to a worker")
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS, help="Spins after which a game ends without a winner")
+    parser.add_argument("--journal", default=None, help="Directory to write the event journals of the games to")
+    parser.add_argument("--ev-budget", type=float, default=0.0, help="Seconds per move of the expected value engine (0: one batch)")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.levels.split(',')]
+    if any(level < 1 or level > 10 for level in levels):
+        parser.error('levels must be between 1 and 10')
+    report = runTournament(levels, args.games, args.seed, args.workers, args.chunk_size, args.max_turns, args.journal, args.ev_budget)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -15,26 +15,38 @@
 #                     2.2.b) If the wheel lands on "lose a turn", the player loses their turn and the game moves on to the next player.
 #                     2.2.c) If the wheel lands on "bankrupt", the player loses their turn and loses their money. However, they keep all of the prizes they have won so far.
 #                2.3) The turns or rounds continue until the entire phrase is revealed (or if any player guesses the complete phrase correctly).
+#             3) A Game takes its pauses and its output from the sleep and output callables it is given, so computer-only
+#                games can be played headless and without pauses (see tournament.py).
+#             4) A computer player solves the phrase once enough letters are revealed and few enough phrases of the category
+#                are consistent with the board (see phrase_index.py). Both thresholds loosen as its level grows.
+#             5) The good moves of a computer player are the best ranked available letter for the category and the shape
+#                of the phrase (see letter_stats.py); its bad moves are random available letters.
+#             6) A Game keeps its board in a Board object, which reveals, renders and checks for a win without rescanning
+#                the phrase or the guessed letters.
+#             7) A Game given a Journal records its spins, moves, reveals, money changes and prizes as binary records
+#                (see journal.py).
+#             8) From level EV_LEVEL on, the good moves of a computer player are scored by an expected value engine
+#                that weighs the prize of its spin against the bankrupt and lose a turn segments of the wheel, the cost
+#                of a vowel and the chance of solving (see ev.py). Players learn the prize of their spin from observeSpin().
+#             9) Games and computer players draw their random numbers from the random generator they are given (the
+#                random module by default), so a simulation can give every game and player its own reproducible stream.
 #
 # All Rights Reserved.
 ################################################
 
-import json
 import random
 import time
-import os
+
+from . import events
+from .game_data import getGameData
+from .letter_stats import LETTER_BITS
 
 LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 VOWELS = 'AEIOU'
 VOWEL_COST = 250
-
-# NOTE: Use the below code snippet to figure out the absolute path to the working directory.
-#       Failure to do so will lead to program failure while reading files.
-cwd = os.getcwd() # Get the current working directory
-files = os.listdir(cwd) # Get all the files and sub-directories in that directory
-print("Files in {}: {}".format(cwd, files))
-working_directory = cwd + "/Python/wheel_of_fortune/"
-print("Working directory is: {}".format(working_directory))
+CONSONANTS_MASK = sum(LETTER_BITS[c] for c in LETTERS if c not in VOWELS) # 26-bit mask of the consonants
+VOWELS_MASK = sum(LETTER_BITS[c] for c in VOWELS) # 26-bit mask of the vowels
+EV_LEVEL = 8 # Lowest computer level whose good moves are chosen by the expected value engine
 
 ################################################
 # Class Definitions
@@ -51,6 +63,8 @@ class WOFPlayer:
         self.prizeMoney = 0
     def addPrize(self, prize):
         self.prizes.append(prize)
+    def observeSpin(self, wheelPrize):
+        pass # Called with the cash segment of a spin before the player is asked for a move
     def __str__(self):
         return "{} (${})".format(self.name, self.prizeMoney)
 
@@ -73,50 +87,141 @@ Guess a letter, phrase, or type 'exit' or 'pass': """.format(super().__str__() ,
 
 # Derived class to represent a Wheel of Fortune player (computer)
 class WOFComputerPlayer(WOFPlayer):
-    SORTED_FREQUENCIES = 'ZQXJKVBPYGFWMUCLDRHSNIOATE'
-    def __init__(self, name, level):
+    def __init__(self, name, level, output=print, phraseIndex=None, letterStats=None, evEngine=None, rng=random):
         super().__init__(name)
         self.level = level
+        self.rng = rng # Random generator of the moves (random.Random or the random module)
+        self.output = output # Called with the comments on each move
+        self.phraseIndex = phraseIndex # Defaults to the index of the cached phrases.json
+        self.letterStats = letterStats # Defaults to the letter counts of the cached phrases.json
+        self.evEngine = evEngine # Defaults to the engine of the cached wheel.json (for levels from EV_LEVEL on)
+        self.wheelPrize = None # Segment of the last cash spin
+        self.evRandom = None # Random generator of the rollouts, seeded from rng on the first expected value move
+        # A phrase is only solved once enough of its letters are revealed and few enough phrases fit the board
+        self.solveRevealed = 1 - level / 20 # Fraction of the letters that must be revealed
+        self.solveCandidates = max(1, level // 3) # Most candidate phrases to pick a solution from
+    def getSolution(self, category, obscuredPhrase, guessed):
+        """Returns a phrase consistent with the board if the player is confident enough to solve, else None"""
+        hidden = obscuredPhrase.count('_')
+        letters = sum(1 for c in obscuredPhrase if c == '_' or c in LETTERS)
+        if hidden == 0 or hidden > (1 - self.solveRevealed) * letters:
+            return None
+        phraseIndex = self.phraseIndex or getGameData().getPhraseIndex()
+        count, phrases = phraseIndex.candidates(category, obscuredPhrase, guessed, self.solveCandidates)
+        if count == 0 or not phrases:
+            return None
+        return self.rng.choice(phrases)
     def smartCoinFlip(self):
-        rand_number = random.randint(1, 10)
+        rand_number = self.rng.randint(1, 10)
         if (rand_number > self.level):
             return False
         elif (rand_number <= self.level):
             return True
+    def observeSpin(self, wheelPrize):
+        self.wheelPrize = wheelPrize
+    def getEVMove(self, category, obscuredPhrase, guessed):
+        """Returns the move with the best expected value (a letter, a phrase or 'pass'), or None without a board model"""
+        from .ev import BoardModel
+        phraseIndex = self.phraseIndex or getGameData().getPhraseIndex()
+        board = BoardModel.build(phraseIndex, category, obscuredPhrase, guessed)
+        if board is None or self.wheelPrize is None:
+            return None
+        evEngine = self.evEngine or getGameData().getEVEngine()
+        if self.evRandom is None:
+            self.evRandom = evEngine.generator(self.rng.getrandbits(64))
+        move = evEngine.chooseMove(board, self.prizeMoney, self.wheelPrize['value'], VOWEL_COST, VOWELS, self.evRandom)
+        return 'pass' if move == 'PASS' else move
+    def getAvailableMask(self, guessed):
+        """Returns the 26-bit mask of the letters the player may guess (vowels only if affordable)"""
+        available = CONSONANTS_MASK | VOWELS_MASK if self.prizeMoney >= VOWEL_COST else CONSONANTS_MASK
+        for c in guessed:
+            available &= ~LETTER_BITS[c]
+        return available
     def getPossibleLetters(self, guessed):
-        possibleLetters = []
-        for c in LETTERS:
-            if ((c not in guessed) and (c not in VOWELS)):
-                possibleLetters.append(c)
-            if ((c not in guessed) and (self.prizeMoney >= VOWEL_COST) and (c in VOWELS)):
-                possibleLetters.append(c)
-        return possibleLetters
+        available = self.getAvailableMask(guessed)
+        return [c for c in LETTERS if available & LETTER_BITS[c]]
     def getMove(self, category, obscuredPhrase, guessed):
-        possibleLetters = self.getPossibleLetters(guessed)
+        # From EV_LEVEL on the expected value engine decides when to solve
+        solution = self.getSolution(category, obscuredPhrase, guessed) if self.level < EV_LEVEL else None
+        if solution is not None:
+            self.output("Solve: {}\n".format(solution))
+            return solution
+        available = self.getAvailableMask(guessed)
         coinFlip = self.smartCoinFlip()
-        if (possibleLetters == []):
-            print("Returning pass\n")
+        if coinFlip and self.level >= EV_LEVEL: # Good move scored by the expected value engine
+            move = self.getEVMove(category, obscuredPhrase, guessed)
+            if move is not None:
+                self.output("Expected value move: {}\n".format(move))
+                return move
+        if available == 0:
+            self.output("Returning pass\n")
             return 'pass'
-        if (coinFlip == True): # Good move
-            possibleLettersL = ''
-            for l in possibleLetters:
-                possibleLettersL = possibleLettersL+l
-            # Do a pick based on the highest frequency character in self.SORTED_FREQUENCIES
-            for i in range(len(self.SORTED_FREQUENCIES)-1, 0, -1):
-                if (self.SORTED_FREQUENCIES[i] in possibleLettersL):
-                    print("Good move: {}\n".format(self.SORTED_FREQUENCIES[i]))
-                    return self.SORTED_FREQUENCIES[i]
-        elif (coinFlip == False): # Bad move
-            possibleLettersL = ''
-            for l in possibleLetters:
-                possibleLettersL = possibleLettersL+l
+        if coinFlip: # Good move
+            # Pick the letter contained in the most phrases still consistent with the board
+            letterStats = self.letterStats or getGameData().getLetterStats()
+            phraseIndex = self.phraseIndex or getGameData().getPhraseIndex()
+            letter = letterStats.bestLetter(category, obscuredPhrase, guessed, available, phraseIndex)
+            self.output("Good move: {}\n".format(letter))
+            return letter
+        else: # Bad move
             # Do a random pick
-            randomLetter = random.choice(possibleLettersL)
-            print("Bad move: {}\n".format(randomLetter))
+            randomLetter = self.rng.choice([c for c in LETTERS if available & LETTER_BITS[c]])
+            self.output("Bad move: {}\n".format(randomLetter))
             return randomLetter
-        else:
-            print("Returning pass\n")
-            return 'pass'
+
+# Class to represent the board of a game
+class Board:
+    """
+    Category, phrase and guessed letters of a game with an incrementally revealed obscured phrase.
+    The positions of every letter are found once, guessed letters are kept as a 26-bit mask and the obscured
+    phrase is a character buffer updated only where a guess reveals a letter.
+    """
+    def __init__(self, category, phrase):
+        self.category = category
+        self.phrase = phrase
+        self.guessed = [] # Letters in the order they were guessed, as shown to the players
+        self.guessedMask = 0 # Bit i is set once LETTERS[i] has been guessed
+        self.positions = {} # Letter -> positions of the letter in the phrase
+        for i, c in enumerate(phrase):
+            if c in LETTERS:
+                self.positions.setdefault(c, []).append(i)
+        self.hidden = sum(len(p) for p in self.positions.values()) # Letters still hidden
+        self._chars = ['_' if c in LETTERS else c for c in phrase]
+        self._obscured = None # Cached rendering of self._chars
+        self._board = None # Cached rendering of showBoard()
+
+    def isGuessed(self, letter):
+        """Returns True if a letter has already been guessed"""
+        return bool(self.guessedMask >> (ord(letter) - ord('A')) & 1)
+
+    def guess(self, letter):
+        """Records a guessed letter, reveals it and returns how many times it appears in the phrase"""
+        self.guessed.append(letter)
+        self.guessedMask |= 1 << (ord(letter) - ord('A'))
+        self._board = None
+        positions = self.positions.get(letter, ())
+        if positions:
+            for i in positions:
+                self._chars[i] = letter
+            self.hidden -= len(positions)
+            self._obscured = None
+        return len(positions)
+
+    def isSolved(self):
+        """Returns True once every letter of the phrase is revealed"""
+        return self.hidden == 0
+
+    def obscured(self):
+        """Returns the phrase with the letters not guessed yet shown as underscores"""
+        if self._obscured is None:
+            self._obscured = ''.join(self._chars)
+        return self._obscured
+
+    def show(self):
+        """Returns a string representing the current state of the game (see showBoard())"""
+        if self._board is None:
+            self._board = showBoard(self.category, self.obscured(), self.guessed)
+        return self._board
 
 ################################################
 # Function Definitions
@@ -142,21 +247,19 @@ def getNumberBetween(prompt, min, max):
         userinp = input('{}\n{}'.format(errmessage, prompt))
 
 # Spins the wheel of fortune wheel to give a random prize
-def spinWheel():
+def spinWheel(rng=random):
     """Simulates spinning the wheel of fortune and returns a dictionary with a random prize"""
-    with open(working_directory + "wheel.json", 'r') as f:
-        wheel = json.loads(f.read())
-        return random.choice(wheel)
+    return getGameData().spinWheel(rng)
+
+# Spins the wheel of fortune wheel to give a random prize and its position on the wheel
+def spinWheelIndex(rng=random):
+    """Simulates spinning the wheel of fortune and returns the index of the segment and its dictionary"""
+    return getGameData().spinWheelIndex(rng)
 
 # Returns a category & phrase (as a tuple) to guess
-def getRandomCategoryAndPhrase():
+def getRandomCategoryAndPhrase(rng=random):
     """Returns a tuple with a random category and phrase for players to guess"""
-
-    with open(working_directory + "phrases.json", 'r') as f:
-        phrases = json.loads(f.read())
-        category = random.choice(list(phrases.keys()))
-        phrase   = random.choice(phrases[category])
-        return (category, phrase.upper())
+    return getGameData().getRandomCategoryAndPhrase(rng)
 
 # Returns an obscure phrase for players to guess
 def obscurePhrase(phrase, guessed):
@@ -167,13 +270,8 @@ def obscurePhrase(phrase, guessed):
         phrase:  "GLACIER NATIONAL PARK"
         returns> "_L___ER N____N_L P_RK"
     """
-    rv = ''
-    for s in phrase:
-        if (s in LETTERS) and (s not in guessed):
-            rv = rv+'_'
-        else:
-            rv = rv+s
-    return rv
+    guessed = set(guessed)
+    return ''.join('_' if (s in LETTERS) and (s not in guessed) else s for s in phrase)
 
 # Returns the current state of the game
 def showBoard(category, obscuredPhrase, guessed):
@@ -183,149 +281,268 @@ Category: {}
 Phrase:   {}
 Guessed:  {}""".format(category, obscuredPhrase, ', '.join(sorted(guessed)))
 
+# Checks the move of a player
+def checkMove(player, move, board):
+    """Returns why an upper-cased move may not be played on the board, or None if it is valid"""
+    if len(move) == 1: # At least one character has been guessed
+        if move not in LETTERS: # The player entered an invalid character (such as @, #, or $)
+            return 'Guesses should be letters. Try again.'
+        elif board.isGuessed(move): # This letter has already been guessed
+            return '{} has already been guessed. Try again.'.format(move)
+        elif move in VOWELS and player.prizeMoney < VOWEL_COST: # If it's a vowel, we need to be sure the player has enough prize money
+            return 'Need ${} to guess a vowel. Try again.'.format(VOWEL_COST)
+    return None
+
 # Request a player for a move until a valid one is given
-def requestPlayerMove(player, category, guessed):
-    """Request a player for a move until a valid one is given"""
+def requestPlayerMove(player, category, guessed, phrase, sleep=time.sleep, output=print, board=None):
+    """Request a player for a move until a valid one is given; a Board of the game, if given, replaces category, guessed and phrase"""
+    if board is None:
+        board = Board(category, phrase)
+        for letter in guessed:
+            board.guess(letter)
     while True:
-        time.sleep(0.1) # Added so that any feedback is printed out before the next prompt
-        move = player.getMove(category, obscurePhrase(phrase, guessed), guessed)
-        print("move: {}".format(move))
+        sleep(0.1) # Added so that any feedback is printed out before the next prompt
+        move = player.getMove(board.category, board.obscured(), board.guessed)
+        output("move: {}".format(move))
         move = move.upper()
         if move == 'EXIT' or move == 'PASS':
             return move
-        elif len(move) == 1: # At least one character has been guessed
-            if move not in LETTERS: # The player entered an invalid character (such as @, #, or $)
-                print('Guesses should be letters. Try again.')
-                continue
-            elif move in guessed: # This letter has already been guessed
-                print('{} has already been guessed. Try again.'.format(move))
-                continue
-            elif move in VOWELS and player.prizeMoney < VOWEL_COST: # If it's a vowel, we need to be sure the player has enough prize money
-                    print('Need ${} to guess a vowel. Try again.'.format(VOWEL_COST))
-                    continue
-            else:
-                return move
-        else: # The player guessed the phrase
+        error = checkMove(player, move, board)
+        if error is None: # A letter or the phrase
             return move
+        output(error)
 
 ################################################
 # Create and set up players to play the game
 ################################################
-num_human = getNumberBetween('How many human players? ', 0, 10)
+# Creates the players of a game after asking the user how many there are
+def createPlayers():
+    """Ask the user for the human and computer players of a game and return them as a list"""
+    num_human = getNumberBetween('How many human players? ', 0, 10)
+
+    # Create the human player instances
+    human_players = [WOFHumanPlayer(input('Enter the name for human player #{}: '.format(i+1))) for i in range(num_human)]
 
-# Create the human player instances
-human_players = [WOFHumanPlayer(input('Enter the name for human player #{}: '.format(i+1))) for i in range(num_human)]
+    num_computer = getNumberBetween('How many computer players? ', 0, 10)
 
-num_computer = getNumberBetween('How many computer players? ', 0, 10)
+    # If there are computer players, ask what level they should be; A level determines the skill
+    if num_computer >= 1:
+        level = getNumberBetween('What level for the computers? (1-10) ', 1, 10)
 
-# If there are computer players, ask what level they should be; A level determines the skill
-if num_computer >= 1:
-    level = getNumberBetween('What level for the computers? (1-10) ', 1, 10)
+    # Create the computer player instances
+    computer_players = [WOFComputerPlayer('Computer {}'.format(i+1), level) for i in range(num_computer)]
 
-# Create the computer player instances
-computer_players = [WOFComputerPlayer('Computer {}'.format(i+1), level) for i in range(num_computer)]
+    players = human_players + computer_players
 
-players = human_players + computer_players
+    if len(players) == 0: # No players, no game
+        print('We need players to play!')
+        raise Exception('Not enough players')
 
-if len(players) == 0: # No players, no game
-    print('We need players to play!')
-    raise Exception('Not enough players')
+    return players
+
+# Plays one game of Wheel of Fortune with the given players
+def playGame(players):
+    """Play a game until the phrase is revealed, guessed or a player exits; returns the winner (or False)"""
+    return Game(players).play()
 
 ################################################
-# Game Logic
+# Game Play
 ################################################
-print('='*16)
-print('WHEEL OF FORTUNE')
-print('='*16)
-print('')
-
-# Category and phrase are strings
-category, phrase = getRandomCategoryAndPhrase()
-# Guessed is a list of the letters that have been guessed so far in the game
-guessed = []
-
-# playerIndex keeps track of the index (0 to len(players)-1) of the player whose turn it is
-playerIndex = 0
-
-# Will be set to the player instance when/if someone wins
-winner = False
-
-while True:
-    player = players[playerIndex]
-    wheelPrize = spinWheel()
-
-    print('')
-    print('-'*15)
-    print(showBoard(category, obscurePhrase(phrase, guessed), guessed))
-    print('')
-    print('{} spins...'.format(player.name))
-    time.sleep(2) # Pause for dramatic effect!
-    print('{}!'.format(wheelPrize['text']))
-    time.sleep(1) # Pause again for more dramatic effect!
-
-    if wheelPrize['type'] == 'bankrupt':
-        player.goBankrupt()
-    elif wheelPrize['type'] == 'loseturn':
-        pass # Do nothing; just move on to the next player
-    elif wheelPrize['type'] == 'cash':
-        move = requestPlayerMove(player, category, guessed)
+# Class to play one game of Wheel of Fortune
+class Game:
+    """
+    One game of Wheel of Fortune between the given players.
+    sleep and output default to time.sleep and print; pass no-op callables to play a game headless and
+    without pauses. maxTurns (spins) ends a game without a winner, e.g. when every player can only pass.
+    journal, if given, is a Journal receiving the events of the game under the number gameId.
+    play() drives the game itself; other drivers (e.g. the asyncio server) step through steps() instead.
+    """
+    SPIN_PAUSE = 2 # Seconds between a spin and its result
+    RESULT_PAUSE = 1 # Seconds after the result of a spin
+    PAUSE = 'pause' # Step asking the driver to pause for a number of seconds
+    MOVE = 'move' # Step asking the driver for a valid move of a player
+
+    def __init__(self, players, sleep=time.sleep, output=print, maxTurns=None, journal=None, gameId=0, rng=random):
+        self.players = players
+        self.rng = rng # Random generator of the phrase and the spins
+        self.sleep = sleep
+        self.output = output
+        self.maxTurns = maxTurns
+        self.journal = journal
+        self.gameId = gameId
+        # Category and phrase are strings
+        self.category, self.phrase = getRandomCategoryAndPhrase(rng)
+        self.board = Board(self.category, self.phrase)
+        # Guessed is a list of the letters that have been guessed so far in the game
+        self.guessed = self.board.guessed
+        # playerIndex keeps track of the index (0 to len(players)-1) of the player whose turn it is
+        self.playerIndex = 0
+        # Will be set to the player instance when/if someone wins
+        self.winner = False
+        self.turns = 0 # Number of spins so far
+        self.segment = events.NO_SEGMENT # Index of the wheel segment of the last spin
+
+    def record(self, event, letter=0, count=0, value=0):
+        """Record an event of the current player in the journal, if there is one"""
+        if self.journal is not None:
+            self.journal.record(self.gameId, self.turns, self.playerIndex, event, letter, count, self.segment, value,
+                                self.players[self.playerIndex].prizeMoney)
+
+    def spin(self):
+        """Spin the wheel for the current player, show the board and return the prize"""
+        player = self.players[self.playerIndex]
+        self.segment, wheelPrize = spinWheelIndex(self.rng)
+        self.turns += 1
+        self.record(events.SPIN, value=wheelPrize.get('value', 0))
+
+        self.output('')
+        self.output('-'*15)
+        self.output(self.board.show())
+        self.output('')
+        self.output('{} spins...'.format(player.name))
+        return wheelPrize
+
+    def applyMove(self, move, wheelPrize):
+        """
+        Apply a valid move of the current player on a cash spin.
+        Returns True if the player goes again, False if the turn passes and None if the game is over.
+        """
+        player = self.players[self.playerIndex]
         if move == 'EXIT': # Leave the game
-            print('Until next time! Thank you for playing the game!')
-            break
+            self.record(events.EXIT)
+            self.output('Until next time! Thank you for playing the game!')
+            return None
         elif move == 'PASS': # Move on to the next player
-            print('{} passes'.format(player.name))
+            self.record(events.PASS)
+            self.output('{} passes'.format(player.name))
         elif len(move) == 1: # The player guessed a letter
-            guessed.append(move)
+            count = self.board.guess(move) # Returns an integer with how many times this letter appears
+            letter = ord(move) - ord('A') + 1
 
-            print('{} guesses "{}"'.format(player.name, move))
+            self.output('{} guesses "{}"'.format(player.name, move))
 
-            count = phrase.count(move) # Returns an integer with how many times this letter appears
             if count > 0:
                 if count == 1:
-                    print("There is one {}".format(move))
+                    self.output("There is one {}".format(move))
                 else:
-                    print("There are {} {}'s".format(count, move))
+                    self.output("There are {} {}'s".format(count, move))
 
                 # Give the player their money and the prizes
                 if move in VOWELS:
                     player.prizeMoney -= VOWEL_COST
+                    self.record(events.LETTER, letter, count, -VOWEL_COST)
 
                 else:
                     player.addMoney(count * wheelPrize['value'])
+                    self.record(events.LETTER, letter, count, count * wheelPrize['value'])
                     if wheelPrize['prize']:
                         player.addPrize(wheelPrize['prize'])
+                        self.record(events.PRIZE)
 
                 # Check if all of the letters have been guessed
-                if obscurePhrase(phrase, guessed) == phrase:
-                    winner = player
-                    break
+                if self.board.isSolved():
+                    self.winner = player
+                    return None
 
-                continue # This player gets to go again
+                return True # This player gets to go again
 
             else: # count == 0
-                print("There is no {}".format(move))
+                self.record(events.LETTER, letter)
+                self.output("There is no {}".format(move))
 
         else: # The player guessed the whole phrase
-            if move == phrase: # The player guessed the full phrase correctly
-                winner = player
+            if move == self.phrase: # The player guessed the full phrase correctly
+                self.winner = player
                 # Give the player their money and the prizes
                 player.addMoney(wheelPrize['value'])
+                self.record(events.SOLVE, count=1, value=wheelPrize['value'])
                 if wheelPrize['prize']:
                     player.addPrize(wheelPrize['prize'])
-                break
+                    self.record(events.PRIZE)
+                return None
             else:
-                print('{} was not the phrase'.format(move))
-
-    # Move on to the next player (or go back to player[0] if we reached the end)
-    playerIndex = (playerIndex + 1) % len(players)
-
-if winner:
-    # Declaration of winner and results
-    print('{} wins! The phrase was {}'.format(winner.name, phrase))
-    print('{} won ${}'.format(winner.name, winner.prizeMoney))
-    if len(winner.prizes) > 0:
-        print('{} also won:'.format(winner.name))
-        for prize in winner.prizes:
-            print('    - {}'.format(prize))
-else:
-    print('Nobody won. The phrase was {}'.format(phrase))
+                self.record(events.SOLVE)
+                self.output('{} was not the phrase'.format(move))
+        return False
+
+    def nextPlayer(self):
+        """Move on to the next player (or go back to player[0] if we reached the end)"""
+        self.playerIndex = (self.playerIndex + 1) % len(self.players)
+
+    def steps(self):
+        """
+        Play the game one step at a time as a generator, returning the winner (or False).
+        Yields (Game.PAUSE, seconds) and (Game.MOVE, player); a MOVE step must be answered with send(move),
+        where move is upper-cased and valid (see requestPlayerMove()).
+        """
+        self.output('='*16)
+        self.output('WHEEL OF FORTUNE')
+        self.output('='*16)
+        self.output('')
+        self.record(events.GAME_START, count=len(self.players), value=self.board.hidden)
+
+        while self.maxTurns is None or self.turns < self.maxTurns:
+            player = self.players[self.playerIndex]
+            wheelPrize = self.spin()
+            yield self.PAUSE, self.SPIN_PAUSE # Pause for dramatic effect!
+            self.output('{}!'.format(wheelPrize['text']))
+            yield self.PAUSE, self.RESULT_PAUSE # Pause again for more dramatic effect!
+
+            if wheelPrize['type'] == 'bankrupt':
+                lost = player.prizeMoney
+                player.goBankrupt()
+                self.record(events.BANKRUPT, value=-lost)
+            elif wheelPrize['type'] == 'loseturn':
+                self.record(events.LOSE_TURN) # Do nothing; just move on to the next player
+            elif wheelPrize['type'] == 'cash':
+                player.observeSpin(wheelPrize)
+                move = yield self.MOVE, player
+                goAgain = self.applyMove(move, wheelPrize)
+                if goAgain is None:
+                    break
+                if goAgain:
+                    continue
+            self.nextPlayer()
+
+        winner = self.winner
+        if self.journal is not None:
+            self.segment = events.NO_SEGMENT
+            if winner:
+                self.record(events.WIN, value=winner.prizeMoney) # The winner is the current player
+            self.journal.record(self.gameId, self.turns, self.playerIndex if winner else 0xFF, events.GAME_END)
+        if winner:
+            # Declaration of winner and results
+            self.output('{} wins! The phrase was {}'.format(winner.name, self.phrase))
+            self.output('{} won ${}'.format(winner.name, winner.prizeMoney))
+            if len(winner.prizes) > 0:
+                self.output('{} also won:'.format(winner.name))
+                for prize in winner.prizes:
+                    self.output('    - {}'.format(prize))
+        else:
+            self.output('Nobody won. The phrase was {}'.format(self.phrase))
+        return winner
+
+    def play(self):
+        """Play the game until the phrase is revealed, guessed, a player exits or maxTurns is reached; returns the winner (or False)"""
+        steps = self.steps()
+        reply = None
+        try:
+            while True:
+                step, value = steps.send(reply)
+                if step == self.PAUSE:
+                    self.sleep(value)
+                    reply = None
+                else:
+                    reply = requestPlayerMove(value, self.category, self.guessed, self.phrase, self.sleep, self.output, self.board)
+        except StopIteration as stop:
+            return stop.value
+
+################################################
+# Game Logic
+################################################
+def main():
+    """Set up the players and play one game (python -m wheel_of_fortune)"""
+    playGame(createPlayers())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+################################################
+# Title     : Wordle Game
+# Author    : balarcode
+# File Type : Python Package
+# Comments  : Importing the package does no I/O; the word list is read on first use.
+#             Play a game with: python -m wordle
+#
+# All Rights Reserved.
+################################################
+
+from .feedback import decode, format_feedback, score, solved_code
+from .lexicon import DEFAULT_WORDS_FILE, Lexicon
+from .metrics import Metrics
+from .wordle import Bot, CandidateIndex, GameEngine, Letter, NoGuessLeftError, RandomStrategy, Strategy, main
@@ -0,0 +1,3 @@
+from .wordle import main
+
+main()
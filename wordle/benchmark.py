@@ -0,0 +1,184 @@
+################################################
+# Title     : Wordle Benchmark Harness
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Plays headless games of Wordle to measure the quality and the speed of the Bot.
+#             1) The GameEngine plays the Bot against every word in the word list (or a seeded sample of it).
+#             2) Games are split across worker processes and all game output is suppressed.
+#             3) Every game draws from its own random generator, seeded from the run seed and the game number only,
+#                so a seed gives the same results for any number of workers and any chunk size.
+#             4) Win rate, the histogram of guesses needed, p50/p99 latency of make_guess() and games per second
+#                are reported as JSON, so strategy or engine changes can be compared run to run.
+#             Usage: python -m wordle.benchmark [--strategy random|entropy|minimax|book] [--sample N] [--seed S] [--workers W]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import os
+import random
+import time
+
+from .lexicon import DEFAULT_WORDS_FILE, Lexicon
+from .metrics import Metrics
+from .wordle import Bot, GameEngine
+
+################################################
+# Class Definitions
+################################################
+# Class to time the moves of a Bot
+class TimedBot:
+    """Wraps a Bot and records the wall time of every make_guess() call."""
+    def __init__(self, bot: Bot) -> None:
+        self.bot: Bot = bot
+        self.move_times: list[float] = []
+    def make_guess(self) -> str:
+        start = time.perf_counter()
+        guess = self.bot.make_guess()
+        self.move_times.append(time.perf_counter() - start)
+        return guess
+    def record_guess_results(self, guess, guess_results) -> None:
+        self.bot.record_guess_results(guess, guess_results)
+
+################################################
+# Function Definitions
+################################################
+_worker_bot: Bot = None
+
+# Creates the strategy named on the command line
+def make_strategy(name: str, word_list: Lexicon, cache_dir: str):
+    """Return a strategy instance for name; solver strategies score in-process."""
+    if name == "random":
+        return None
+    if name == "book":
+        from .opening_book import BookStrategy, OpeningBook
+        return BookStrategy(OpeningBook.load(word_list, cache_dir))
+    from .patterns import PatternMatrix
+    from .strategies import EntropyStrategy, MinimaxStrategy
+    strategy_class = {"entropy": EntropyStrategy, "minimax": MinimaxStrategy}[name]
+    return strategy_class(PatternMatrix.load(word_list, cache_dir), workers=1)
+
+# Sets up the Bot of a worker process
+def _init_worker(words_file: str, strategy_name: str, cache_dir: str) -> None:
+    global _worker_bot
+    lexicon = Lexicon.load(words_file)
+    _worker_bot = Bot(lexicon, strategy=make_strategy(strategy_name, lexicon, cache_dir))
+
+# Returns the random generator of a game
+def game_rng(seed: int, game: int) -> random.Random:
+    """Return a random.Random seeded from a digest of the run seed and the game number."""
+    digest = hashlib.sha256(f"{seed}/{game}".encode("ascii")).digest()
+    return random.Random(int.from_bytes(digest, "little"))
+
+# Plays one game per target word and returns the raw results
+def play_games(targets: list[str], first_game: int, seed: int, collect_metrics: bool = False) -> tuple[list[tuple[bool, int, list[float]]], Metrics]:
+    """Play a headless game for every target, numbering the games from first_game.
+
+    Returns (solved, guesses, move times) per game and, if collect_metrics is
+    set, the Metrics recorded by the Bot and the GameEngine.
+    """
+    results = []
+    metrics = Metrics() if collect_metrics else None
+    _worker_bot.metrics = metrics
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for game, target in enumerate(targets, first_game):
+            rng = game_rng(seed, game)
+            _worker_bot.new_game(rng)
+            bot = TimedBot(_worker_bot)
+            engine = GameEngine(metrics=metrics, rng=rng)
+            engine.play(bot, word_list_file=_worker_bot.lexicon, target_word=target)
+            results.append((engine.solved, len(engine.prev_guesses), bot.move_times))
+    return results, metrics
+
+# Returns a percentile of a sorted list of samples
+def percentile(samples: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of sorted samples using the nearest rank."""
+    if not samples:
+        return 0.0
+    rank = max(1, -(-len(samples) * q // 100))
+    return samples[int(rank) - 1]
+
+# Runs the benchmark and returns the report
+def run_benchmark(words_file: str, strategy: str = "random", sample: int = None, seed: int = 0,
+                  workers: int = None, cache_dir: str = None, chunk_size: int = 64, metrics: Metrics = None) -> dict:
+    """Play the Bot against the target words across worker processes and summarize the results.
+
+    If metrics is given, the per-move metrics of every worker are merged into it.
+    """
+    words_file = os.path.abspath(words_file)
+    cache_dir = cache_dir or os.path.dirname(words_file)
+    lexicon = Lexicon.load(words_file)
+    targets = list(lexicon.words)
+    rng = random.Random(seed)
+    if sample is not None and sample < len(targets):
+        targets = rng.sample(targets, sample)
+    workers = workers or os.cpu_count() or 1
+    if strategy != "random": # Build the pattern file (and book) once before the workers load them
+        make_strategy(strategy, lexicon, cache_dir)
+
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(words_file, strategy, cache_dir)) as executor:
+        futures = [executor.submit(play_games, targets[i:i + chunk_size], i, seed, metrics is not None)
+                   for i in range(0, len(targets), chunk_size)]
+        results = []
+        for future in futures:
+            games, chunk_metrics = future.result()
+            results.extend(games)
+            if metrics is not None:
+                metrics.merge(chunk_metrics)
+    elapsed = time.perf_counter() - start
+
+    histogram: dict[str, int] = {}
+    move_times: list[float] = []
+    wins = 0
+    for solved, guesses, times in results:
+        move_times.extend(times)
+        if solved:
+            wins += 1
+            histogram[str(guesses)] = histogram.get(str(guesses), 0) + 1
+        else:
+            histogram["failed"] = histogram.get("failed", 0) + 1
+    move_times.sort()
+    return {
+        "strategy": strategy,
+        "games": len(results),
+        "workers": workers,
+        "seed": seed,
+        "win_rate": wins / len(results) if results else 0.0,
+        "mean_guesses": sum(guesses for solved, guesses, _ in results if solved) / wins if wins else 0.0,
+        "guess_histogram": dict(sorted(histogram.items())),
+        "move_latency_ms": {"p50": percentile(move_times, 50) * 1e3, "p99": percentile(move_times, 99) * 1e3},
+        "elapsed_s": elapsed,
+        "games_per_s": len(results) / elapsed if elapsed else 0.0,
+    }
+
+################################################
+# Benchmark Logic
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play headless Wordle games and report Bot quality and speed as JSON.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_FILE)
+    parser.add_argument("--strategy", choices=["random", "entropy", "minimax", "book"], default="random")
+    parser.add_argument("--sample", type=int, default=None, help="Number of target words to sample (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache-dir", default=None, help="Directory of the pattern file (default: next to the word list)")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--metrics", default=None, help="Also write the per-move metrics summary to this file")
+    args = parser.parse_args()
+
+    with Metrics(args.metrics) if args.metrics else contextlib.nullcontext() as metrics:
+        report = run_benchmark(args.words, args.strategy, args.sample, args.seed, args.workers, args.cache_dir, metrics=metrics)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
@@ -0,0 +1,125 @@
+################################################
+# Title     : Wordle Feedback Scoring
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Scores guesses against target words with compact integer feedback codes.
+#             1) The feedback of a guess is a base-3 number with one digit per letter: 0 if the letter is not
+#                matched, 1 if it is in the word but elsewhere and 2 if it is in the correct place.
+#                The digit of the first letter is the least significant one.
+#             2) Repeated letters follow the Wordle rules: letters in the correct place are matched first, then
+#                the remaining copies of a letter in the target are handed out from left to right.
+#             3) score() scores a single pair without allocating objects; the batch functions score one guess
+#                against many targets (or many guesses against one target) in a single NumPy call.
+#                NumPy is only imported by the batch functions, so the game itself does not depend on it.
+#
+# All Rights Reserved.
+################################################
+
+from .lexicon import Lexicon
+
+NOT_IN_WORD = 0
+IN_WORD = 1
+IN_CORRECT_PLACE = 2
+
+################################################
+# Function Definitions
+################################################
+# Returns the feedback code of a guess against a target word
+def score(guess: str, target: str) -> int:
+    """Return the feedback code of guess against target."""
+    remaining = {}
+    for g, t in zip(guess, target):
+        if g != t:
+            remaining[t] = remaining.get(t, 0) + 1
+    code = 0
+    place = 1
+    for g, t in zip(guess, target):
+        if g == t:
+            code += IN_CORRECT_PLACE * place
+        elif remaining.get(g, 0) > 0:
+            code += IN_WORD * place
+            remaining[g] -= 1
+        place *= 3
+    return code
+
+# Returns the feedback code of a correct guess
+def solved_code(length: int) -> int:
+    """Return the feedback code of a guess with every letter in the correct place."""
+    return 3 ** length - 1
+
+# Splits a feedback code into one digit per letter
+def decode(code: int, length: int) -> list[int]:
+    """Return the per-letter feedback digits (0, 1 or 2) of a feedback code."""
+    marks = []
+    for _ in range(length):
+        code, mark = divmod(code, 3)
+        marks.append(mark)
+    return marks
+
+# Renders a feedback code for quick review
+def format_feedback(guess: str, code: int) -> str:
+    """Return the guess with letters not in place shown as '*' (in the word) or '?' (not in the word)."""
+    response = []
+    for letter in guess:
+        code, mark = divmod(code, 3)
+        response.append(letter if mark == IN_CORRECT_PLACE else "*" if mark == IN_WORD else "?")
+    return "".join(response)
+
+# Returns the smallest unsigned integer type holding the feedback codes of a word length
+def code_dtype(length: int):
+    """Return the NumPy dtype used for feedback codes of words of the given length."""
+    import numpy as np
+    return np.min_scalar_type(solved_code(length))
+
+# Returns words as an array of letter codes
+def encode_words(words) -> "np.ndarray":
+    """Return an N x L uint8 array with the letters of each word mapped to 0-25.
+
+    words may be a Lexicon, a sequence of words of equal length or an already
+    encoded array, which is returned unchanged.
+    """
+    import numpy as np
+    if isinstance(words, np.ndarray):
+        return words
+    if isinstance(words, Lexicon):
+        return np.frombuffer(words.codes, dtype=np.uint8).reshape(len(words), -1)
+    data = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (data - ord("A")).reshape(len(words), -1)
+
+# Computes the feedback codes of many guesses against many targets
+def batch_score(guesses, targets) -> "np.ndarray":
+    """Return the G x T matrix of feedback codes of guesses against targets."""
+    import numpy as np
+    guesses = encode_words(guesses)
+    targets = encode_words(targets)
+    length = guesses.shape[1]
+    dtype = code_dtype(length)
+    green = guesses[:, None, :] == targets[None, :, :]
+    codes = np.zeros(green.shape[:2], dtype=dtype)
+    yellows = []
+    for j in range(length):
+        letter = guesses[:, j][:, None]
+        # Copies of this letter in the target not matched in place ...
+        available = np.zeros(green.shape[:2], dtype=np.uint8)
+        for k in range(length):
+            available += (targets[:, k][None, :] == letter) & ~green[:, :, k]
+        # ... less the copies already handed out to earlier positions of the guess
+        for i in range(j):
+            available -= yellows[i] & (guesses[:, i] == guesses[:, j])[:, None]
+        yellow = ~green[:, :, j] & (available > 0)
+        yellows.append(yellow)
+        codes += (IN_CORRECT_PLACE * green[:, :, j] + yellow).astype(dtype) * dtype.type(3 ** j)
+    return codes
+
+# Computes the feedback codes of one guess against many targets
+def score_targets(guess: str, targets) -> "np.ndarray":
+    """Return the feedback codes of a single guess against every target."""
+    return batch_score([guess], targets)[0]
+
+# Computes the feedback codes of many guesses against one target
+def score_guesses(guesses, target: str) -> "np.ndarray":
+    """Return the feedback codes of every guess against a single target."""
+    return batch_score(guesses, [target])[:, 0]
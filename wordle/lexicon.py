@@ -0,0 +1,172 @@
+################################################
+# Title     : Wordle Lexicon
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Shared word list for the Bot and the GameEngine.
+#             1) A word list file is read once per process; later loads of the same file return the same object.
+#             2) Words are upper-cased, deduplicated (keeping the first occurrence) and interned.
+#             3) Membership is a dictionary lookup and the letters are also kept as a compact array of
+#                letter codes (one byte per letter, 0-25) for vectorized consumers.
+#             4) Words may only hold the letters A-Z. Lines of a word list file with other characters (accents,
+#                apostrophes, hyphens, ...) are skipped and counted; a Lexicon built from such a word raises ValueError.
+#
+# All Rights Reserved.
+################################################
+
+import array
+import gzip
+import hashlib
+import os
+import sys
+
+# Word list shipped with the game; it is only read when a lexicon is first loaded
+DEFAULT_WORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.txt")
+
+# Table mapping the letters A-Z to the letter codes 0-25
+LETTER_CODES = bytes.maketrans(bytes(range(ord("A"), ord("Z") + 1)), bytes(range(26)))
+
+################################################
+# Function Definitions
+################################################
+# Returns True if a word only holds the letters A-Z
+def is_word(word: str) -> bool:
+    """Return True if an upper-cased word is made of the letters A-Z only."""
+    return word.isascii() and word.isalpha()
+
+# Streams the words of a plain or gzip-compressed word list file
+def read_words(path: str, skipped: list = None):
+    """Yield the upper-cased, non-empty lines of a word list file (.gz files are decompressed on the fly).
+
+    Lines holding anything but the letters A-Z are not yielded; their numbers
+    are appended to skipped if it is given.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            word = line.strip().upper()
+            if not word:
+                continue
+            if is_word(word):
+                yield word
+            elif skipped is not None:
+                skipped.append(number)
+
+################################################
+# Class Definitions
+################################################
+# Class to represent a deduplicated list of allowable words
+class Lexicon:
+    """Deduplicated, interned list of allowable words of one length with O(1) membership."""
+    _loaded: dict[tuple[str, int], "Lexicon"] = {}
+    def __init__(self, words, path: str = None) -> None:
+        self.path: str = path
+        self.words: tuple[str, ...] = tuple(dict.fromkeys(sys.intern(w.strip().upper()) for w in words if w.strip()))
+        for word in self.words:
+            if not is_word(word):
+                raise ValueError("{!r} is not a word of the letters A-Z".format(word))
+        self.word_length: int = len(self.words[0]) if self.words else 0
+        if any(len(word) != self.word_length for word in self.words):
+            raise ValueError("The words of a lexicon must all have the same length; load it with a word_length")
+        self._index: dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        self.codes: array.array = array.array("B", "".join(self.words).encode("ascii").translate(LETTER_CODES))
+
+    @classmethod
+    def load(cls, path: str, word_length: int = None) -> "Lexicon":
+        """Return the lexicon of a word list file, reading the file only once per process.
+
+        The word length is inferred when every word of the file has the same
+        length; otherwise word_length selects one partition of the file.
+        """
+        path = os.path.abspath(path)
+        lexicon = cls._loaded.get((path, word_length))
+        if lexicon is None:
+            store = LexiconStore.load(path)
+            lengths = store.word_lengths()
+            if word_length is None and len(lengths) != 1:
+                raise ValueError("{} holds words of lengths {}; pass a word_length".format(path, lengths))
+            lexicon = cls._loaded[(path, word_length)] = store.lexicon(word_length or lengths[0])
+        return lexicon
+
+    @classmethod
+    def coerce(cls, source) -> "Lexicon":
+        """Return source if it already is a Lexicon, else load it as a word list file."""
+        return source if isinstance(source, Lexicon) else cls.load(source)
+
+    def index(self, word: str) -> int:
+        """Return the position of a word in the lexicon (ValueError if it is not there)."""
+        try:
+            return self._index[word]
+        except KeyError:
+            raise ValueError("{} is not in the lexicon".format(word)) from None
+
+    def word_codes(self, i: int) -> array.array:
+        """Return the letter codes of the word at position i."""
+        return self.codes[i * self.word_length:(i + 1) * self.word_length]
+
+    def digest(self) -> str:
+        """Return a hex digest identifying the words and their order."""
+        return hashlib.sha256("\n".join(self.words).encode("ascii")).hexdigest()
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._index
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __getitem__(self, i: int) -> str:
+        return self.words[i]
+
+    def __str__(self) -> str:
+        return self.path if self.path is not None else "<{} words>".format(len(self.words))
+
+# Class to hold the words of a large word list partitioned by length
+class LexiconStore:
+    """Words of a (possibly gzip-compressed) word list file, partitioned by length.
+
+    The file is streamed line by line into one bytearray per word length,
+    holding the ASCII letters of its words back to back in file order (words of
+    one length need no offsets). A partition is only decoded into strings, and
+    deduplicated, when it is turned into a Lexicon on first use. skipped holds
+    the numbers of the lines that are not words of the letters A-Z.
+    """
+    _loaded: dict[str, "LexiconStore"] = {}
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.skipped: list[int] = []
+        self.partitions: dict[int, bytearray] = {}
+        for word in read_words(path, self.skipped):
+            partition = self.partitions.get(len(word))
+            if partition is None:
+                partition = self.partitions[len(word)] = bytearray()
+            partition += word.encode("ascii")
+        self._lexicons: dict[int, Lexicon] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "LexiconStore":
+        """Return the store of a word list file, reading the file only once per process."""
+        path = os.path.abspath(path)
+        store = cls._loaded.get(path)
+        if store is None:
+            store = cls._loaded[path] = cls(path)
+        return store
+
+    def lexicon(self, word_length: int) -> Lexicon:
+        """Return the lexicon of the words of the given length."""
+        lexicon = self._lexicons.get(word_length)
+        if lexicon is None:
+            if word_length not in self.partitions:
+                raise ValueError("{} has no words of length {}".format(self.path, word_length))
+            partition = self.partitions.pop(word_length)
+            words = (partition[i:i + word_length].decode("ascii") for i in range(0, len(partition), word_length))
+            lexicon = self._lexicons[word_length] = Lexicon(words, self.path)
+        return lexicon
+
+    def word_lengths(self) -> list[int]:
+        """Return the word lengths present in the file."""
+        return sorted(set(self.partitions) | set(self._lexicons))
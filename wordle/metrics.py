@@ -0,0 +1,99 @@
+################################################
+# Title     : Wordle Metrics
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Optional per-move instrumentation for the Bot and the GameEngine.
+#             1) A Metrics object collects counters (e.g. rejected guesses) and histograms (e.g. move time,
+#                candidate set sizes) and can forward every sample to a callback as it is recorded.
+#             2) Bot and GameEngine only record when they are given a Metrics object, so the cost when
+#                instrumentation is disabled is a single attribute check per move.
+#             3) Used as a context manager, a Metrics object writes its JSON summary to a file on exit.
+#             Usage: with Metrics("run.json") as metrics: GameEngine(metrics=metrics).play(Bot(words, metrics=metrics))
+#
+# All Rights Reserved.
+################################################
+
+import contextlib
+import json
+import time
+
+################################################
+# Class Definitions
+################################################
+# Class to collect counters and histograms
+class Metrics:
+    """Counters and histograms of a run, optionally forwarded to a callback(name, value)."""
+    def __init__(self, path: str = None, callback=None) -> None:
+        self.path: str = path
+        self.callback = callback
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, list[float]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """Add value to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+        if self.callback is not None:
+            self.callback(name, value)
+
+    def observe(self, name: str, value: float) -> None:
+        """Add a sample to a histogram."""
+        samples = self.histograms.get(name)
+        if samples is None:
+            samples = self.histograms[name] = []
+        samples.append(value)
+        if self.callback is not None:
+            self.callback(name, value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str):
+        """Record the wall time of the with-block, in seconds, in a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def merge(self, other: "Metrics") -> None:
+        """Fold the counters and samples of another Metrics object (e.g. from a worker) into this one."""
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        for name, samples in other.histograms.items():
+            self.histograms.setdefault(name, []).extend(samples)
+
+    def summary(self) -> dict:
+        """Return the counters and the count, mean and percentiles of every histogram."""
+        histograms = {}
+        for name, samples in sorted(self.histograms.items()):
+            ordered = sorted(samples)
+            def rank(q: float) -> float:
+                return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+            histograms[name] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered),
+                "min": ordered[0],
+                "p50": rank(0.50),
+                "p90": rank(0.90),
+                "p99": rank(0.99),
+                "max": ordered[-1],
+            }
+        return {"counters": dict(sorted(self.counters.items())), "histograms": histograms}
+
+    def write(self, path: str = None) -> None:
+        """Write the summary as JSON to path (default: the path given at construction)."""
+        with open(path or self.path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["callback"] = None # Callbacks stay in the process that set them
+        return state
+
+    def __enter__(self) -> "Metrics":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.path is not None:
+            self.write()
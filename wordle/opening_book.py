@@ -0,0 +1,171 @@
+################################################
+# Title     : Wordle Opening Book
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Precomputed decision tree of a solver strategy for a fixed word list.
+#             1) For a fixed word list a solver plays a deterministic tree: a first guess, then one next guess per
+#                feedback code, and so on. The tree is built offline by playing the strategy against every feedback
+#                the GameEngine can give, following the same hard mode rules as the Bot.
+#             2) The tree is saved as a compact binary file keyed by the digest of the lexicon, so it is only
+#                rebuilt when words.txt changes.
+#             3) BookStrategy answers every move of the Bot with one dictionary lookup and falls back to another
+#                strategy when the game leaves the book (e.g. a target word missing from the word list).
+#             Usage: python -m wordle.opening_book [--strategy entropy|minimax] [--words words.txt] [--cache-dir DIR]
+#
+# All Rights Reserved.
+################################################
+
+import argparse
+import array
+import collections
+import os
+import struct
+
+import numpy as np
+
+from . import feedback
+from .lexicon import DEFAULT_WORDS_FILE, Lexicon
+from .patterns import PatternMatrix
+from .strategies import EntropyStrategy, MinimaxStrategy, mask_to_indices
+from .wordle import RandomStrategy, Strategy, candidate_index
+
+MAGIC = b"WRDLBOOK"
+VERSION = 1
+# Magic, version, word length, number of nodes, number of edges and SHA-256 digest of the lexicon
+HEADER = struct.Struct("<8sHHII32s")
+MAX_GUESSES = 6 # Same limit as the GameEngine; deeper nodes are never reached
+
+################################################
+# Function Definitions
+################################################
+# Returns the default book file for a lexicon
+def book_path(lexicon: Lexicon, cache_dir: str, strategy_name: str = "entropy") -> str:
+    """Return the path of the opening book of a lexicon inside cache_dir."""
+    return os.path.join(cache_dir, "opening-book-{}-v{}-{}.bin".format(strategy_name, VERSION, lexicon.digest()[:16]))
+
+# Plays a strategy against every possible feedback and returns the decision tree
+def build_tree(lexicon: Lexicon, strategy, matrix: PatternMatrix) -> tuple[array.array, dict[int, int]]:
+    """Return the guesses of every node and the (node, feedback code) -> child node edges.
+
+    Node 0 is the opening guess. Edges are keyed by node * 3**L + code, which is
+    also the key used by BookStrategy at play time.
+    """
+    index = candidate_index(lexicon)
+    num_patterns = 3 ** lexicon.word_length
+    solved = feedback.solved_code(lexicon.word_length)
+    guesses = array.array("I")
+    edges: dict[int, int] = {}
+    # Candidates, allowed and depth of the nodes to expand; nodes are numbered in the order they are queued
+    pending = collections.deque([(index.all_words, index.all_words, 1)])
+    while pending:
+        candidates, allowed, depth = pending.popleft()
+        node = len(guesses)
+        strategy.new_game()
+        guess_id = strategy.choose(index, candidates, allowed)
+        guesses.append(guess_id)
+        if depth == MAX_GUESSES:
+            continue
+        guess = lexicon[guess_id]
+        # Same bookkeeping as Bot.make_guess() and Bot.record_guess_results()
+        candidates ^= candidates & index.word_mask(guess)
+        allowed ^= allowed & index.word_mask(guess)
+        candidate_ids = mask_to_indices(candidates, len(lexicon))
+        for code in np.unique(matrix.patterns[guess_id, candidate_ids]):
+            if code == solved:
+                continue
+            child = index.narrow(candidates, allowed, guess, feedback.decode(int(code), lexicon.word_length))
+            edges[node * num_patterns + int(code)] = len(guesses) + len(pending)
+            pending.append(child + (depth + 1,))
+    return guesses, edges
+
+# Writes a decision tree to a book file
+def write_book(lexicon: Lexicon, guesses: array.array, edges: dict[int, int], path: str) -> None:
+    """Save the tree as a header followed by the node guesses, the edge keys and the edge targets."""
+    keys = array.array("Q", edges.keys())
+    children = array.array("I", edges.values())
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, lexicon.word_length, len(guesses), len(keys), bytes.fromhex(lexicon.digest())))
+        f.write(guesses.tobytes())
+        f.write(keys.tobytes())
+        f.write(children.tobytes())
+    os.replace(tmp_path, path)
+
+################################################
+# Class Definitions
+################################################
+# Class to hold a decision tree loaded from a book file
+class OpeningBook:
+    """Decision tree of a solver; guesses[node] is a word index and edges map node * 3**L + code to a child."""
+    def __init__(self, path: str, lexicon: Lexicon = None) -> None:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, length, num_nodes, num_edges, digest = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} opening book".format(path, VERSION))
+        if lexicon is not None and digest != bytes.fromhex(lexicon.digest()):
+            raise ValueError("{} was built for a different word list".format(path))
+        self.word_length: int = length
+        self.num_patterns: int = 3 ** length
+        offset = HEADER.size
+        self.guesses: array.array = array.array("I", data[offset:offset + 4 * num_nodes])
+        offset += 4 * num_nodes
+        keys = array.array("Q", data[offset:offset + 8 * num_edges])
+        offset += 8 * num_edges
+        self.edges: dict[int, int] = dict(zip(keys, array.array("I", data[offset:offset + 4 * num_edges])))
+
+    @classmethod
+    def load(cls, lexicon: Lexicon, cache_dir: str, strategy_name: str = "entropy") -> "OpeningBook":
+        """Load the book of a lexicon, building it first if the word list changed."""
+        path = book_path(lexicon, cache_dir, strategy_name)
+        if not os.path.exists(path):
+            matrix = PatternMatrix.load(lexicon, cache_dir)
+            strategy_class = {"entropy": EntropyStrategy, "minimax": MinimaxStrategy}[strategy_name]
+            with strategy_class(matrix) as strategy:
+                guesses, edges = build_tree(lexicon, strategy, matrix)
+            write_book(lexicon, guesses, edges, path)
+        return cls(path, lexicon)
+
+# Class to play the moves of an opening book
+class BookStrategy(Strategy):
+    """Strategy answering each move with one lookup in an opening book.
+
+    Moves outside of the book (the word list of the game differs, or the game
+    ran past the tree) are delegated to the fallback strategy.
+    """
+    def __init__(self, book: OpeningBook, fallback=None) -> None:
+        self.book: OpeningBook = book
+        self.fallback = fallback if fallback is not None else RandomStrategy()
+        self.node: int = 0
+
+    def choose(self, index, candidates: int, allowed: int) -> int | None:
+        if self.node is not None:
+            return self.book.guesses[self.node]
+        return self.fallback.choose(index, candidates, allowed)
+
+    def new_game(self) -> None:
+        self.node = 0
+        self.fallback.rng = self.rng
+        self.fallback.new_game()
+
+    def record(self, guess: str, code: int) -> None:
+        if self.node is not None:
+            self.node = self.book.edges.get(self.node * self.book.num_patterns + code)
+        self.fallback.record(guess, code)
+
+################################################
+# Build Step
+################################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the opening book of a word list.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_FILE)
+    parser.add_argument("--strategy", choices=["entropy", "minimax"], default="entropy")
+    parser.add_argument("--cache-dir", default=None, help="Directory of the book and pattern files (default: next to the word list)")
+    args = parser.parse_args()
+
+    lexicon = Lexicon.load(args.words)
+    book = OpeningBook.load(lexicon, args.cache_dir or os.path.dirname(lexicon.path), args.strategy)
+    print("Opening book of {} words has {} nodes".format(len(lexicon), len(book.guesses)))
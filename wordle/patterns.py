@@ -0,0 +1,98 @@
+################################################
+# Title     : Wordle Feedback Pattern Matrix
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Precomputes the feedback of every guess against every target word of a word list.
+#             1) Feedback codes are the base-3 codes of feedback.py, so the feedback of a 5 letter word fits in one byte.
+#             2) The N x N matrix is built once with NumPy and saved as a versioned binary file keyed by the digest of the
+#                lexicon (Lexicon.digest(), as the opening books are).
+#             3) Later runs memory-map the file, so every process reading the same word list shares the same pages.
+#             Usage: python -m wordle.patterns [word_list_file] [cache_directory]
+#
+# All Rights Reserved.
+################################################
+
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from .feedback import batch_score, encode_words
+from .lexicon import DEFAULT_WORDS_FILE, Lexicon
+
+MAGIC = b"WRDLPTRN"
+VERSION = 1
+# Magic, version, word length, number of words and SHA-256 digest of the lexicon
+HEADER = struct.Struct("<8sHHI32s")
+CHUNK_SIZE = 64 # Guesses scored per vectorized step; bounds the working memory of a build
+
+################################################
+# Function Definitions
+################################################
+# Returns the default cache file for a lexicon
+def cache_path(lexicon: Lexicon, cache_dir: str) -> str:
+    """Return the path of the pattern file of a lexicon inside cache_dir."""
+    return os.path.join(cache_dir, "patterns-v{}-{}.bin".format(VERSION, lexicon.digest()[:16]))
+
+# Builds the pattern file of a lexicon
+def build_pattern_file(lexicon: Lexicon, path: str) -> None:
+    """Compute the full pattern matrix of a lexicon and write it to path."""
+    length = lexicon.word_length
+    if 3 ** length > 256:
+        raise ValueError("Feedback codes of {} letter words do not fit in one byte".format(length))
+    words = encode_words(lexicon)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, length, len(lexicon), bytes.fromhex(lexicon.digest())))
+        for start in range(0, len(lexicon), CHUNK_SIZE):
+            f.write(batch_score(words[start:start + CHUNK_SIZE], words).tobytes())
+    os.replace(tmp_path, path) # Readers never see a partially written file
+
+################################################
+# Class Definitions
+################################################
+# Class to hold a memory-mapped feedback pattern matrix
+class PatternMatrix:
+    """Memory-mapped N x N matrix of feedback codes; row is the guess, column the target."""
+    def __init__(self, path: str, lexicon: Lexicon = None) -> None:
+        self.path: str = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, length, count, digest = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("{} is not a version {} pattern file".format(path, VERSION))
+        if lexicon is not None and (count != len(lexicon) or digest != bytes.fromhex(lexicon.digest())):
+            raise ValueError("{} was built for a different word list".format(path))
+        self.word_length: int = length
+        self.size: int = count
+        self.patterns: np.ndarray = np.frombuffer(self._mmap, dtype=np.uint8, count=count * count, offset=HEADER.size).reshape(count, count)
+
+    @classmethod
+    def load(cls, lexicon: Lexicon, cache_dir: str) -> "PatternMatrix":
+        """Memory-map the pattern file of a lexicon, building it first if needed."""
+        path = cache_path(lexicon, cache_dir)
+        if not os.path.exists(path):
+            build_pattern_file(lexicon, path)
+        return cls(path, lexicon)
+
+    def pattern(self, guess: int, target: int) -> int:
+        """Return the feedback code of the guess at index guess against the target at index target."""
+        return int(self.patterns[guess, target])
+
+    def row(self, guess: int) -> np.ndarray:
+        """Return the feedback codes of one guess against every target."""
+        return self.patterns[guess]
+
+################################################
+# Build Step
+################################################
+if __name__ == "__main__":
+    word_list_file = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_WORDS_FILE
+    cache_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.dirname(os.path.abspath(word_list_file))
+    matrix = PatternMatrix.load(Lexicon.load(word_list_file), cache_dir)
+    print("Pattern matrix of {} words is in {}".format(matrix.size, matrix.path))
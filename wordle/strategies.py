@@ -0,0 +1,148 @@
+################################################
+# Title     : Wordle Solver Strategies
+# Author    : balarcode
+# Version   : 1.0
+# Date      : 18th October 2026
+# File Type : Python Script / Program
+# File Test : Verified on Python 3.12.6
+# Comments  : Information theoretic strategies for the Wordle Bot built on the feedback pattern matrix.
+#             1) EntropyStrategy picks the guess maximizing the expected information of its feedback.
+#             2) MinimaxStrategy picks the guess minimizing the largest group of candidates left after its feedback.
+#             3) Guesses are always drawn from the words the game engine accepts (hard mode), and scoring
+#                large guess sets is split across a concurrent.futures process pool. Every worker memory-maps
+#                the same pattern file, so the pool shares one copy of the matrix.
+#             Usage: Bot(words_file, strategy=EntropyStrategy(PatternMatrix.load(lexicon, cache_dir)))
+#
+# All Rights Reserved.
+################################################
+
+import concurrent.futures
+import os
+
+import numpy as np
+
+from .patterns import PatternMatrix
+from .wordle import Strategy
+
+SCORE_CHUNK = 1 << 22 # Guess x candidate pairs scored per vectorized step
+POOL_THRESHOLD = 1 << 24 # Below this many pairs scoring stays in-process
+
+################################################
+# Function Definitions
+################################################
+# Returns the word indices held in a candidate mask
+def mask_to_indices(mask: int, size: int) -> np.ndarray:
+    """Return the indices of the bits set in an integer bitset of size bits."""
+    data = np.frombuffer(mask.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder="little")[:size])
+
+# Counts how many candidates fall in each feedback group for a block of guesses
+def pattern_counts(patterns: np.ndarray, guesses: np.ndarray, candidates: np.ndarray, num_patterns: int) -> np.ndarray:
+    """Return a G x P array with the number of candidates giving each feedback code to each guess."""
+    block = patterns[guesses][:, candidates].astype(np.int64)
+    block += (np.arange(len(guesses), dtype=np.int64) * num_patterns)[:, None]
+    return np.bincount(block.ravel(), minlength=len(guesses) * num_patterns).reshape(len(guesses), num_patterns)
+
+# Scores guesses by the expected information of their feedback
+def entropy_scores(counts: np.ndarray) -> np.ndarray:
+    """Return the entropy in bits of each row of feedback group sizes."""
+    total = counts.sum(axis=1, keepdims=True)
+    p = counts / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return -np.where(counts > 0, p * np.log2(p), 0.0).sum(axis=1)
+
+# Scores guesses by the size of their worst feedback group
+def minimax_scores(counts: np.ndarray) -> np.ndarray:
+    """Return the negated size of the largest feedback group of each row (higher is better)."""
+    return -counts.max(axis=1).astype(np.float64)
+
+SCORERS = {"entropy": entropy_scores, "minimax": minimax_scores}
+
+_worker_matrices: dict[str, PatternMatrix] = {}
+
+# Scores a block of guesses inside a worker process
+def _score_guesses(path: str, mode: str, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Score guesses against candidates with the pattern file at path (one mapping per process)."""
+    matrix = _worker_matrices.get(path)
+    if matrix is None:
+        matrix = _worker_matrices[path] = PatternMatrix(path)
+    return score_guesses(matrix, mode, guesses, candidates)
+
+# Scores guesses against candidates in bounded blocks
+def score_guesses(matrix: PatternMatrix, mode: str, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """Return the score of every guess against the candidates for the given mode."""
+    num_patterns = 3 ** matrix.word_length
+    step = max(1, SCORE_CHUNK // max(1, len(candidates)))
+    scores = np.empty(len(guesses), dtype=np.float64)
+    for start in range(0, len(guesses), step):
+        counts = pattern_counts(matrix.patterns, guesses[start:start + step], candidates, num_patterns)
+        scores[start:start + step] = SCORERS[mode](counts)
+    return scores
+
+################################################
+# Class Definitions
+################################################
+# Class to pick the guess with the best feedback distribution
+class ScoringStrategy(Strategy):
+    """Strategy scoring every allowed guess against the remaining candidates.
+
+    Ties are broken in favour of guesses which may be the target word. The
+    choice for the full word list is cached, as the opening guess is the same
+    for every game and is the most expensive one to compute.
+    """
+    mode: str = "entropy"
+    def __init__(self, matrix: PatternMatrix, workers: int = None) -> None:
+        self.matrix: PatternMatrix = matrix
+        self.workers: int = workers if workers is not None else (os.cpu_count() or 1)
+        self._executor: concurrent.futures.ProcessPoolExecutor = None
+        self._opening: int = None
+
+    def choose(self, index, candidates: int, allowed: int) -> int | None:
+        if candidates == index.all_words and self._opening is not None:
+            return self._opening
+        size = len(index.word_list)
+        candidate_ids = mask_to_indices(candidates if candidates else allowed, size)
+        if len(candidate_ids) == 0: # No legal word is left
+            return None
+        if len(candidate_ids) <= 2: # Guessing a candidate is at least as good as anything else
+            return int(candidate_ids[0])
+        guess_ids = mask_to_indices(allowed | candidates, size)
+        scores = self.score(guess_ids, candidate_ids)
+        best = guess_ids[scores >= scores.max() - 1e-9]
+        in_candidates = best[np.isin(best, candidate_ids)]
+        choice = int(in_candidates[0] if len(in_candidates) else best[0])
+        if candidates == index.all_words:
+            self._opening = choice
+        return choice
+
+    def score(self, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Score guesses against candidates, using the process pool for large workloads."""
+        if self.workers <= 1 or len(guesses) * len(candidates) < POOL_THRESHOLD:
+            return score_guesses(self.matrix, self.mode, guesses, candidates)
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+        blocks = np.array_split(guesses, self.workers)
+        futures = [self._executor.submit(_score_guesses, self.matrix.path, self.mode, block, candidates) for block in blocks]
+        return np.concatenate([future.result() for future in futures])
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# Class to pick the guess maximizing the expected information
+class EntropyStrategy(ScoringStrategy):
+    """Strategy which maximizes the expected information (entropy) of the feedback."""
+    mode = "entropy"
+
+# Class to pick the guess minimizing the worst case
+class MinimaxStrategy(ScoringStrategy):
+    """Strategy which minimizes the number of candidates left in the worst case."""
+    mode = "minimax"
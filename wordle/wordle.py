@@ -7,153 +7,323 @@
 # File Test : Verified on Python 3.12.6
 # Comments  : Game rules are provided below.
 #             1) Each guess must be a five letter English word. Only the 26 letters of the English alphabet are used and case does not matter.
+#                Other word lengths are played by loading a lexicon of that length (Lexicon.load(path, word_length)).
 #             2) The game engine generates a hidden 5 letter word called the target word.
 #             3) The bot plays the game and attempts to guess the word. It will get up to six tries.
 #             4) The bot will be given the location of a datafile which has a list of allowable words (one per line). Bot can only make guesses from this datafile.
 #             5) After each guess, the game engine provides feedback indicating if each character was in the correct position for the target word, and if not, if the character is in the target word but in the wrong position.
 #             6) The bot must be smart such that once it has identified the correct position of a letter in a word it must only guess future words where that letter is in the same position.
+#             7) The game engine and the bot draw their random numbers from the generator they are given (the random module by default),
+#                so simulations can give every game its own reproducible stream.
 #
 # All Rights Reserved.
 ################################################
 
+import functools
 import random
-import os
+import time
 
-# NOTE: Use the below code snippet to figure out the absolute path to the working directory.
-#       Failure to do so will lead to program failure while reading files.
-cwd = os.getcwd() # Get the current working directory
-files = os.listdir(cwd) # Get all the files and sub-directories in that directory
-print("Files in {}: {}".format(cwd, files))
-working_directory = cwd + "/Python/wordle/"
-print("Working directory is: {}".format(working_directory))
+from . import feedback
+from .lexicon import DEFAULT_WORDS_FILE, Lexicon
+from .metrics import Metrics
 
 ################################################
 # Class Definitions
 ################################################
+# Exception raised when a Bot has no legal word left to guess
+class NoGuessLeftError(LookupError):
+    """Raised by Bot.make_guess() when every word of its list was guessed or ruled out by the feedback."""
+
 # Class to handle a single English letter from a guessed word
 class Letter:
-    """Class to handle a single English letter from a guessed word."""
-    in_correct_place: bool = False
-    in_word: bool = False
-    def __init__(self, letter: str) -> None:
+    """Class to handle a single English letter from a guessed word.
+
+    The game engine reports feedback as a single integer code (see feedback.py);
+    Letter objects are a view of that code kept for bots written against lists of
+    letters.
+    """
+    __slots__ = ("letter", "in_correct_place", "in_word")
+    def __init__(self, letter: str, in_correct_place: bool = False, in_word: bool = False) -> None:
         self.letter: str = letter
+        self.in_correct_place: bool = in_correct_place
+        self.in_word: bool = in_word
+    @classmethod
+    def from_feedback(cls, guess: str, code: int) -> list["Letter"]:
+        """Return one Letter per character of guess for a feedback code."""
+        marks = feedback.decode(code, len(guess))
+        return [cls(letter, mark == feedback.IN_CORRECT_PLACE, mark != feedback.NOT_IN_WORD) for letter, mark in zip(guess, marks)]
     def is_in_correct_place(self) -> bool:
         return self.in_correct_place
     def is_in_word(self) -> bool:
         return self.in_word
 
+PICK_BLOCK_SIZE = 64 # Bytes of a candidate mask counted at a time by CandidateIndex.pick()
+
+# Class to index a word list by letter positions and letter counts
+class CandidateIndex:
+    """Bitset index over a word list used to filter candidate words.
+
+    Every word is identified by its position in the word list and every set of
+    words is a Python integer with one bit per word. Masks are precomputed per
+    (position, letter) and per (letter, minimum count), so applying the feedback
+    of a guess is a handful of bitwise AND operations instead of a scan.
+    """
+    def __init__(self, word_list: list[str]) -> None:
+        self.word_list: list[str] = word_list
+        self.word_length: int = len(word_list[0]) if word_list else 0
+        self.all_words: int = (1 << len(word_list)) - 1
+        # Every letter of every word with the last word first, so that taking every
+        # word_length-th character gives one column of letters readable as a binary number
+        text = "".join(reversed(word_list))
+        if len(text) != len(word_list) * self.word_length:
+            raise ValueError("All the words of a CandidateIndex must have the same length")
+        letters = sorted(set(text))
+        self.position_masks: dict[tuple[int, str], int] = {}
+        for j in range(self.word_length):
+            column = text[j::self.word_length]
+            for letter in set(column):
+                table = {ord(c): "1" if c == letter else "0" for c in letters}
+                self.position_masks[(j, letter)] = int(column.translate(table), 2)
+        # Words with at least k copies of a letter, counted position by position as bitwise sums
+        self.count_masks: dict[tuple[str, int], int] = {}
+        for letter in letters:
+            at_least = [self.all_words] + [0] * self.word_length
+            for j in range(self.word_length):
+                mask = self.at_position(j, letter)
+                for k in range(j + 1, 0, -1):
+                    at_least[k] |= at_least[k - 1] & mask
+            for k in range(1, self.word_length + 1):
+                if at_least[k]:
+                    self.count_masks[(letter, k)] = at_least[k]
+        self.word_ids: dict[str, list[int]] = {}
+        for i, word in enumerate(word_list):
+            self.word_ids.setdefault(word, []).append(i)
+        self.rejected_probes: int = 0 # Random probes of pick() which missed the mask
+
+    def at_position(self, position: int, letter: str) -> int:
+        """Return the mask of words with the letter at the given position."""
+        return self.position_masks.get((position, letter), 0)
+
+    def word_mask(self, word: str) -> int:
+        """Return the mask of the entries holding the given word."""
+        return sum(1 << i for i in self.word_ids.get(word, ()))
+
+    def at_least(self, letter: str, count: int) -> int:
+        """Return the mask of words containing the letter at least count times."""
+        if count <= 0:
+            return self.all_words
+        return self.count_masks.get((letter, count), 0)
+
+    def narrow(self, candidates: int, allowed: int, guess: str, marks: list[int]) -> tuple[int, int]:
+        """Apply the feedback of a guess to the candidate and allowed masks.
+
+        marks holds one value per position: 2 if the letter is in the correct
+        place, 1 if it is in the word but elsewhere and 0 if it is not matched.
+        candidates are the words still consistent with every feedback received,
+        allowed are the words that still follow the game engine rules (known
+        letters kept in place and unused letters avoided).
+        """
+        matched: dict[str, int] = {}
+        unmatched: set[str] = set()
+        excluded: list[int] = [] # Masks of words ruled out as candidates
+        for j, letter in enumerate(guess):
+            if marks[j] == 2:
+                mask = self.at_position(j, letter)
+                candidates &= mask
+                allowed &= mask
+            else:
+                excluded.append(self.at_position(j, letter))
+            if marks[j] > 0:
+                matched[letter] = matched.get(letter, 0) + 1
+            else:
+                unmatched.add(letter)
+        for letter, count in matched.items():
+            candidates &= self.at_least(letter, count)
+            if letter in unmatched: # The target has exactly this many copies
+                excluded.append(self.at_least(letter, count + 1))
+        for letter in unmatched - matched.keys():
+            absent = self.at_least(letter, 1)
+            excluded.append(absent)
+            allowed ^= allowed & absent
+        # Required masks are applied first as they shrink the candidates the most;
+        # clearing with x ^ (x & mask) avoids the cost of negative (inverted) big integers
+        for mask in excluded:
+            candidates ^= candidates & mask
+        return candidates, allowed
+
+    def pick(self, mask: int, max_tries: int = 32, rng = random) -> int | None:
+        """Return the index of a random word in a mask, drawn with rng (None if the mask is empty).
+
+        Dense masks are sampled by rejection with a bounded number of tries;
+        otherwise the bits are counted in blocks to find the block holding the
+        chosen word, and only the set bits of that block are walked.
+        """
+        count = mask.bit_count()
+        if count == 0:
+            return None
+        n = len(self.word_list)
+        if count * 8 >= n:
+            for _ in range(max_tries):
+                i = rng.randrange(n)
+                if (mask >> i) & 1:
+                    return i
+                self.rejected_probes += 1
+        target = rng.randrange(count)
+        data = mask.to_bytes((n + 7) // 8, "little")
+        for start in range(0, len(data), PICK_BLOCK_SIZE):
+            block = int.from_bytes(data[start:start + PICK_BLOCK_SIZE], "little")
+            block_count = block.bit_count()
+            if target < block_count:
+                for _ in range(target):
+                    block &= block - 1 # Clear the lowest set bit
+                return start * 8 + (block & -block).bit_length() - 1
+            target -= block_count
+
+    def indices(self, mask: int) -> list[int]:
+        """Return the word indices set in a mask in ascending order."""
+        bits = bin(mask)[:1:-1]
+        return [i for i in range(len(bits)) if bits[i] == "1"]
+
+# Returns the candidate index shared by every Bot playing with a lexicon
+@functools.lru_cache(maxsize=None)
+def candidate_index(lexicon: Lexicon) -> CandidateIndex:
+    """Return the CandidateIndex of a lexicon, building it once per process."""
+    return CandidateIndex(lexicon.words)
+
+# Class to represent the way a Bot picks its next guess
+class Strategy:
+    """Base class for guess selection strategies used by the Bot.
+
+    choose() is given the candidate index of the Bot together with the mask of
+    words consistent with the feedback so far (candidates) and the mask of words
+    the game engine accepts (allowed), and returns the index of the next guess
+    (None if neither mask holds a word).
+    Strategies which follow the course of a game also get notified of a new game
+    and of the feedback code of every guess. Random choices are drawn from rng,
+    which the Bot sets to its own generator.
+    """
+    rng = random
+    def choose(self, index: CandidateIndex, candidates: int, allowed: int) -> int | None:
+        raise NotImplementedError
+    def new_game(self) -> None:
+        pass
+    def record(self, guess: str, code: int) -> None:
+        pass
+
+# Class to pick a random word among the remaining candidates
+class RandomStrategy(Strategy):
+    """Strategy which guesses a random word among the remaining candidates."""
+    def choose(self, index: CandidateIndex, candidates: int, allowed: int) -> int | None:
+        if candidates == 0: # Target word is not in the word list of the Bot; fall back to any legal word
+            candidates = allowed
+        return index.pick(candidates, rng=self.rng) # None once no legal word is left either
+
 # Class to represent a Bot which is a game playing agent
 class Bot:
     """Class to represent a Bot which is a game playing agent."""
     word_list: list[str] = []
-    def __init__(self, word_list_file: str) -> None:
-        self.word_list: list(str) = list( map(lambda x: x.strip().upper(), open(word_list_file, "r").readlines()) )
+    def __init__(self, word_list_file = DEFAULT_WORDS_FILE, strategy: Strategy = None, metrics: Metrics = None, rng = random) -> None:
+        """word_list_file is the path of a word list file or an already loaded Lexicon.
+        Per-move timings and candidate set sizes are recorded in metrics, if given.
+        rng is the random generator of the guesses (random.Random or the random module).
+        """
+        self.lexicon: Lexicon = Lexicon.coerce(word_list_file)
+        self.word_list: tuple[str, ...] = self.lexicon.words
+        self.index = candidate_index(self.lexicon)
+        self.strategy: Strategy = strategy if strategy is not None else RandomStrategy()
+        self.metrics: Metrics = metrics
+        self.rng = rng
+        self.new_game()
+
+    def new_game(self, rng = None) -> None:
+        """Forget the guesses and feedback of the previous game, switching to the generator rng if given."""
+        if rng is not None:
+            self.rng = rng
+        self.strategy.rng = self.rng
         self.past_guesses = []
-        self.correctly_guessed_letters_in_place = {}
-        self.unused_letters = []
-        self.invalid_guess = False
+        self.candidates: int = self.index.all_words # Words consistent with all the feedback so far
+        self.allowed: int = self.index.all_words # Words the game engine accepts as a guess
+        self.strategy.new_game()
 
     def make_guess(self) -> str:
-        """Ensure that make_guess() returns a smartly guessed word by the Bot."""
-        self.invalid_guess = False
-        counter = 1
-        while (True):
-            random_guess = random.choice(self.word_list).upper()
-            if random_guess not in self.past_guesses:
-                self.past_guesses.append(random_guess)
-                self.invalid_guess = False
-                # Check if the newly guessed word has unused letters; If yes, then guess a new random word
-                for j in range(len(random_guess)):
-                    if random_guess[j] in self.unused_letters:
-                        self.invalid_guess = True
-                # Check if the newly guessed word has the letters at correctly guessed position from previous tries
-                ks = list(self.correctly_guessed_letters_in_place.keys())
-                for j in range(len(random_guess)):
-                    if len(ks) != 0:
-                        if self.correctly_guessed_letters_in_place[ks[j]] != None:
-                            if (random_guess[j] != self.correctly_guessed_letters_in_place[ks[j]]):
-                                self.invalid_guess = True
-            else:
-                self.invalid_guess = True
-            counter += 1
-            if self.invalid_guess == False:
-                break # Break the while-loop once a valid guess is found by the Bot
-        print("Guessed word by the Bot: {}\n\n".format(random_guess))
-        return random_guess
-
-    def record_guess_results(self, guess: str, guess_results: list[Letter]) -> None:
-        """Store the metadata for the guessed word."""
-        for j in range(len(guess)):
-            if guess_results[j].in_correct_place:
-                self.correctly_guessed_letters_in_place[j] = guess[j]
-            else:
-                self.correctly_guessed_letters_in_place[j] = None
-            if guess_results[j].in_word == False:
-                self.unused_letters.append(guess[j])
+        """Ensure that make_guess() returns a smartly guessed word by the Bot.
+
+        Raises NoGuessLeftError if no word of the list is left to guess.
+        """
+        if self.metrics is not None:
+            start = time.perf_counter()
+            probes = self.index.rejected_probes
+        choice = self.strategy.choose(self.index, self.candidates, self.allowed)
+        if choice is None:
+            if self.metrics is not None:
+                self.metrics.incr("bot.no_guess_left")
+            raise NoGuessLeftError("No word of the list of the Bot is left to guess")
+        guess = self.word_list[choice]
+        if self.metrics is not None:
+            self.metrics.observe("bot.guess_time_s", time.perf_counter() - start)
+            self.metrics.observe("bot.candidates", self.candidates.bit_count())
+            self.metrics.incr("bot.rejected_probes", self.index.rejected_probes - probes)
+            if self.candidates == 0:
+                self.metrics.incr("bot.fallback_guesses")
+        self.past_guesses.append(guess)
+        # Never offer the same word twice
+        self.candidates ^= self.candidates & self.index.word_mask(guess)
+        self.allowed ^= self.allowed & self.index.word_mask(guess)
+        print("Guessed word by the Bot: {}\n\n".format(guess))
+        return guess
+
+    def record_guess_results(self, guess: str, guess_results) -> None:
+        """Store the metadata for the guessed word.
+
+        guess_results is the feedback code of the guess or, for compatibility,
+        a list of Letter objects.
+        """
+        if isinstance(guess_results, int):
+            code = guess_results
+            marks = feedback.decode(code, len(guess))
+        else:
+            marks = [2 if result.in_correct_place else 1 if result.in_word else 0 for result in guess_results]
+            code = sum(mark * 3 ** j for j, mark in enumerate(marks))
+        if self.metrics is not None:
+            start = time.perf_counter()
+            before = self.candidates.bit_count()
+        self.candidates, self.allowed = self.index.narrow(self.candidates, self.allowed, guess, marks)
+        self.strategy.record(guess, code)
+        if self.metrics is not None:
+            self.metrics.observe("bot.filter_time_s", time.perf_counter() - start)
+            self.metrics.observe("bot.candidates_filtered_out", before - self.candidates.bit_count())
+            self.metrics.observe("bot.candidates_after_filter", self.candidates.bit_count())
 
 # Class to play the Wordle game
 class GameEngine:
     """The GameEngine represents a new Wordle game for play."""
-    def __init__(self):
+    def __init__(self, metrics: Metrics = None, rng = random):
+        self.rng = rng # Random generator of the target word
         self.err_input = False
         self.err_guess = False
+        self.solved = False
         self.prev_guesses = []
+        self.metrics: Metrics = metrics # Per-move timings and game outcomes are recorded here, if given
 
-    def play(self, bot, word_list_file: str = "words.txt", target_word: str = None) -> None:
+    def play(self, bot, word_list_file = DEFAULT_WORDS_FILE, target_word: str = None) -> None:
         """Play a new game using the supplied bot. By default the GameEngine
-        will look in words.txt for the list of allowable words and choose one
+        will look in the words.txt shipped with the game for the list of allowable words and choose one
         at random. Set the value of target_word to override this behavior and
-        choose the word that must be guessed by the bot.
+        choose the word that must be guessed by the bot. word_list_file may also
+        be a Lexicon shared with the bot, in which case no file is read.
         """
-        def format_results(results) -> str:
-            """Function to format the results into a string for quick review by the caller."""
-            response = ""
-            for letter in results:
-                if letter.is_in_correct_place():
-                    response = response + letter.letter
-                elif letter.is_in_word():
-                    response = response + "*"
-                else:
-                    response = response + "?"
-            return response
-
-        def set_feedback(guess: str, target_word: str) -> tuple[bool, list[Letter]]:
-            """Return the results of a guessed word as a tuple."""
-            # Whether the complete guess is correct or not,
-            # set it to True initially and then switch it to False if any letter doesn't match
-            correct: bool = True
-            letters = []
-            for j in range(len(guess)):
-                # Create a new Letter object
-                letter = Letter(guess[j])
-                # Check to see if this character is in the same position in the
-                # guessed word and if so, set the in_correct_place attribute
-                if guess[j] == target_word[j]:
-                    letter.in_correct_place = True
-                    known_letters[j] = guess[j]  # Record the known correct positions
-                else:
-                    # The bot doesn't have a perfect answer, so update
-                    # the correct flag for feedback
-                    correct = False
-                # Check to see if this character is anywhere in the target word
-                if guess[j] in target_word:
-                    letter.in_word = True
-                else:
-                    unused_letters.add(guess[j])  # Record the unused letters
-                # Add this letter object to the list of Letters
-                letters.append(letter)
-            return correct, letters
-
-        # Read in the dictionary of allowable words
-        word_list: list(str) = list(map(lambda x: x.strip().upper(), open(word_list_file, "r").readlines()))
+        # Load the dictionary of allowable words (the file is only read once per process)
+        word_list: Lexicon = Lexicon.coerce(word_list_file)
         # Initialize the known correct positions
-        known_letters: list(str) = [None, None, None, None, None]
+        known_letters: list(str) = [None] * word_list.word_length
+        # Feedback code of a correct guess
+        solved = feedback.solved_code(len(known_letters))
         # Initialize the set of unused letters
         unused_letters = set()
 
         # Assign the target word to a member variable for use later
         if target_word is None:
-            target_word = random.choice(word_list).upper()
+            target_word = self.rng.choice(word_list.words)
         else:
             target_word = target_word.upper()
             if target_word not in word_list:
@@ -164,9 +334,15 @@ class GameEngine:
         print(f"Playing a game of Wordle using the word list file of {word_list_file}.\nThe target word for this round is {target_word}\n")
 
         MAX_GUESSES = 6 # Only six tries are allowed for the bot playing agent
-        for i in range(1, MAX_GUESSES):
+        for i in range(1, MAX_GUESSES + 1):
+            if self.metrics is not None:
+                move_start = time.perf_counter()
             # Ask the bot for its guess and evaluate
-            guess: str = bot.make_guess()
+            try:
+                guess: str = bot.make_guess()
+            except NoGuessLeftError: # Counted as a lost game below
+                print("The bot has no word left to guess!")
+                break
             # Print out a line indicating what the guessed word was
             print(f"Evaluating bot guess of {guess}")
             if guess not in word_list:
@@ -176,6 +352,8 @@ class GameEngine:
                 print(f"Guess word cannot be the same one as previously used!")
                 self.err_guess = True
             if self.err_guess:
+                if self.metrics is not None:
+                    self.metrics.incr("engine.rejected_guesses")
                 return
 
             self.prev_guesses.append(guess)  # Record the previous guess
@@ -193,36 +371,59 @@ class GameEngine:
                         )
                         self.err_guess = True
                 if self.err_guess:
+                    if self.metrics is not None:
+                        self.metrics.incr("engine.rejected_guesses")
                     return
 
-            # Get the results of the guess
-            correct, results = set_feedback(guess, target_word)
+            # Get the results of the guess as a feedback code
+            if self.metrics is not None:
+                score_start = time.perf_counter()
+            results = feedback.score(guess, target_word)
+            if self.metrics is not None:
+                self.metrics.observe("engine.score_time_s", time.perf_counter() - score_start)
+            correct: bool = results == solved
+            for j, mark in enumerate(feedback.decode(results, len(guess))):
+                if mark == feedback.IN_CORRECT_PLACE:
+                    known_letters[j] = guess[j]  # Record the known correct positions
+                elif mark == feedback.NOT_IN_WORD and guess[j] not in target_word:
+                    unused_letters.add(guess[j])  # Record the unused letters
             # Print out a line indicating whether the guess was correct or not
             print(f"Was this guess correct? {correct}")
             # Send the guess results to Bot
-            print(f"Sending guess results to bot {format_results(results)}\n")
+            print(f"Sending guess results to bot {feedback.format_feedback(guess, results)}\n")
             bot.record_guess_results(guess, results)
+            if self.metrics is not None:
+                self.metrics.observe("engine.move_time_s", time.perf_counter() - move_start)
             # If the guessed word is correct, then we can just end the game
             if correct:
+                self.solved = True
+                if self.metrics is not None:
+                    self.metrics.incr("engine.games_won")
+                    self.metrics.observe("engine.guesses_to_win", i)
                 print(f"Great job, Bot found the target word in {i} guesses!")
                 return
 
         # If we get here, the Bot didn't guess the word
+        if self.metrics is not None:
+            self.metrics.incr("engine.games_lost")
         print(f"Thanks for playing! Bot didn't find the target word in the number of guesses allowed.")
         return
 
 ################################################
 # Game Logic
 ################################################
-print('='*8)
-print(' WORDLE ')
-print('='*8)
-print('')
+def main(words_file: str = DEFAULT_WORDS_FILE) -> None:
+    """Play one game of Wordle with the Bot (python -m wordle)."""
+    print('='*8)
+    print(' WORDLE ')
+    print('='*8)
+    print('')
 
-words_file = working_directory + "words.txt"
+    # Initialize the Bot which plays the game
+    bot = Bot(words_file)
 
-# Initialize the Bot which plays the game
-bot = Bot(words_file)
+    # Create a new GameEngine and play a game with the Bot
+    GameEngine().play(bot, word_list_file=words_file)
 
-# Create a new GameEngine and play a game with the Bot
-GameEngine().play(bot, word_list_file=words_file)
+if __name__ == "__main__":
+    main()